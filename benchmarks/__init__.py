@@ -0,0 +1 @@
+"""Client-side performance benchmarks (run with ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,561 @@
+"""In-process stand-in for the model server.
+
+Serves the endpoints the CLI and TUI call, with the payload shapes they
+parse, but generates replies from a fixed markdown script instead of a
+model, so client hot paths (SSE parsing, rendering, connection handling)
+can be profiled and load-tested on CPU-only machines.
+
+Streamed replies are paced by :class:`MockConfig` (token rate, tokens per
+chunk, simulated retrieval and prefill delays) and sent with chunked
+transfer encoding so keep-alive connections are reused as with the real
+server.
+
+    python -m benchmarks.mock_server [--port 8000] [--token-rate 50] [--chunk-tokens 1]
+
+or in-process::
+
+    with MockServer(MockConfig(token_rate=0)) as server:
+        client = ApiClient(server.url)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Reply script cycled to build streamed answers: headings, lists, code and
+# prose, so markdown block splitting is exercised too.
+REPLY_SCRIPT = """## Overview
+
+The request was handled by the mock server. Each token in this reply is paced
+by the configured rate so rendering and parsing costs can be measured.
+
+- First point with **bold** text and `inline code`.
+- Second point that wraps over a longer line to exercise soft wrapping in the log.
+- Third point.
+
+```python
+def handler(event):
+    return event.get("content", "")
+```
+
+Closing paragraph with a [link](https://example.com) and a final sentence.
+
+"""
+
+_TOKEN_RE = re.compile(r"\n|[^\S\n]*\S+")
+
+
+def script_tokens() -> list[str]:
+    """Split REPLY_SCRIPT into word-sized tokens (newlines are tokens too)."""
+    return _TOKEN_RE.findall(REPLY_SCRIPT)
+
+
+@dataclass
+class MockConfig:
+    """Knobs for generated replies; a ``token_rate`` of 0 streams unpaced."""
+    token_rate: float = 50.0
+    chunk_tokens: int = 1
+    reply_tokens: int = 200
+    status_events: bool = True
+    retrieval_s: float = 0.0
+    prefill_s: float = 0.0
+    model_name: str = "mock-model"
+    n_ctx: int = 8192
+    bootstrap_bytes: int = 64 * 1024 * 1024
+    bootstrap_steps: int = 20
+    chunked_uploads: bool = True
+
+
+@dataclass
+class MockState:
+    """Server-side records the endpoints read and mutate."""
+    model_loaded: bool = True
+    rules: str = ""
+    projects: list[dict] = field(default_factory=list)
+    documents: dict[str, list[dict]] = field(default_factory=dict)
+    mcp_servers: dict[str, list[dict]] = field(default_factory=dict)
+    assets: dict[str, dict] = field(default_factory=dict)
+    uploads: dict[str, dict] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def current_project(self) -> dict:
+        return next((p for p in self.projects if p["current"]), self.projects[0])
+
+
+def _new_project(name: str, model_name: str, current: bool = False) -> dict:
+    return {"id": str(uuid.uuid4()), "name": name, "model_name": model_name, "rules": "", "current": current}
+
+
+class MockServer:
+    """Threaded HTTP server bound to *host*:*port* (``0`` picks a free port)."""
+
+    def __init__(self, config: MockConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or MockConfig()
+        self.state = MockState(projects=[_new_project("default", self.config.model_name, current=True)])
+        handler = type("Handler", (_Handler,), {"server_config": self.config, "state": self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.httpd.server_address[0]}:{self.port}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="slp-mock-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Small SSE writes must not wait on delayed ACKs, or they skew TTFT.
+    disable_nagle_algorithm = True
+    server_config: MockConfig
+    state: MockState
+
+    ROUTES = (
+        ("GET", r"/health", "health"),
+        ("GET", r"/v1/rules", "get_rules"),
+        ("PUT", r"/v1/rules", "put_rules"),
+        ("POST", r"/v1/chat/completions", "chat"),
+        ("POST", r"/v1/bootstrap", "bootstrap"),
+        ("POST", r"/v1/init", "bootstrap"),
+        ("POST", r"/v1/models/load", "load_model"),
+        ("POST", r"/v1/models/unload", "unload_model"),
+        ("POST", r"/v1/assets", "upload_asset"),
+        ("GET", r"/v1/assets/by-sha256/(?P<sha256>[0-9a-f]+)", "find_asset"),
+        ("GET", r"/v1/assets/(?P<asset_id>[^/]+)", "get_asset"),
+        ("POST", r"/v1/assets/uploads", "create_upload"),
+        ("GET", r"/v1/assets/uploads/(?P<upload_id>[^/]+)", "upload_status"),
+        ("PUT", r"/v1/assets/uploads/(?P<upload_id>[^/]+)/parts/(?P<index>\d+)", "upload_part"),
+        ("POST", r"/v1/assets/uploads/(?P<upload_id>[^/]+)/complete", "complete_upload"),
+        ("GET", r"/v1/projects", "list_projects"),
+        ("POST", r"/v1/projects", "create_project"),
+        ("PATCH", r"/v1/projects/(?P<pid>[^/]+)", "update_project"),
+        ("DELETE", r"/v1/projects/(?P<pid>[^/]+)", "delete_project"),
+        ("GET", r"/v1/projects/(?P<pid>[^/]+)/documents", "list_documents"),
+        ("POST", r"/v1/projects/(?P<pid>[^/]+)/documents", "add_documents"),
+        ("DELETE", r"/v1/projects/(?P<pid>[^/]+)/documents/(?P<doc_id>[^/]+)", "delete_document"),
+        ("GET", r"/v1/projects/(?P<pid>[^/]+)/mcp", "list_mcp"),
+        ("POST", r"/v1/projects/(?P<pid>[^/]+)/mcp/register", "register_mcp"),
+        ("DELETE", r"/v1/projects/(?P<pid>[^/]+)/mcp/(?P<server_id>[^/]+)", "delete_mcp"),
+    )
+    _COMPILED = tuple((method, re.compile(pattern + r"/?$"), name) for method, pattern, name in ROUTES)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    # -- plumbing --------------------------------------------------------------
+
+    def _dispatch(self, method: str) -> None:
+        path = self.path.split("?", 1)[0]
+        body = self._read_body()
+        for route_method, pattern, name in self._COMPILED:
+            match = pattern.match(path)
+            if match and route_method == method:
+                getattr(self, f"_{name}")(body, **match.groupdict())
+                return
+        self._json({"detail": "Not Found"}, 404)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    @staticmethod
+    def _payload(body: bytes) -> dict:
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _json(self, obj: dict, status: int = 200) -> None:
+        data = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_sse(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _send_event(self, data: dict | str, event: str | None = None) -> None:
+        text = data if isinstance(data, str) else json.dumps(data, separators=(",", ":"))
+        frame = (f"event: {event}\n" if event else "") + f"data: {text}\n\n"
+        raw = frame.encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(raw), raw))
+        self.wfile.flush()
+
+    def _end_sse(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _project(self, pid: str) -> dict | None:
+        return next((p for p in self.state.projects if p["id"] == pid), None)
+
+    # -- endpoints -------------------------------------------------------------
+
+    def _health(self, body: bytes) -> None:
+        config = self.server_config
+        self._json({
+            "status": "ok",
+            "model_loaded": self.state.model_loaded,
+            "model_name": config.model_name if self.state.model_loaded else None,
+            "quantization": "Q4_K_M",
+            "n_ctx": config.n_ctx,
+            "n_gpu_layers": 0,
+            "flash_attn": False,
+            "model_size_bytes": config.bootstrap_bytes,
+            "memory_percent": 12.5,
+        })
+
+    def _get_rules(self, body: bytes) -> None:
+        self._json({"rules": self.state.rules})
+
+    def _put_rules(self, body: bytes) -> None:
+        with self.state.lock:
+            self.state.rules = self._payload(body).get("rule", "")
+        self._json({"rules": self.state.rules})
+
+    def _chat(self, body: bytes) -> None:
+        config = self.server_config
+        payload = self._payload(body)
+        messages = payload.get("messages") or [{}]
+        prompt = str(messages[-1].get("content", ""))
+        tokens = script_tokens()
+        reply = [tokens[i % len(tokens)] for i in range(max(0, config.reply_tokens))]
+        step = max(1, config.chunk_tokens)
+
+        self._start_sse()
+        try:
+            if config.status_events:
+                self._send_event({"object": "chat.status", "step": "retrieval",
+                                  "status": "processing", "message": "Searching documents..."})
+                time.sleep(config.retrieval_s)
+                self._send_event({"object": "chat.status", "step": "retrieval",
+                                  "status": "completed", "message": "Search complete"})
+            time.sleep(config.prefill_s)
+            start = time.perf_counter()
+            for index in range(0, len(reply), step):
+                if config.token_rate > 0:
+                    delay = start + index / config.token_rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                self._send_event({
+                    "id": "chatcmpl-mock",
+                    "object": "chat.completion.chunk",
+                    "model": config.model_name,
+                    "choices": [{"index": 0, "delta": {"content": "".join(reply[index:index + step])}}],
+                })
+            prompt_tokens = len(prompt.split())
+            self._send_event({
+                "object": "chat.usage",
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(reply),
+                "total_tokens": prompt_tokens + len(reply),
+                "max_context_tokens": config.n_ctx,
+            })
+            self._send_event("[DONE]")
+            self._end_sse()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client cancelled mid-stream (Esc in the TUI, Ctrl+C in the CLI).
+            self.close_connection = True
+
+    def _bootstrap(self, body: bytes) -> None:
+        """``/v1/bootstrap`` and ``/v1/init``: download progress, load, complete."""
+        config = self.server_config
+        model_name = self._payload(body).get("model_name") or config.model_name
+        total = config.bootstrap_bytes
+        steps = max(1, config.bootstrap_steps)
+        self._start_sse()
+        try:
+            self._send_event({"status": "checking", "message": "Checking model files..."})
+            for i in range(1, steps + 1):
+                self._send_event({"filename": f"{model_name}.gguf", "downloaded": total * i // steps, "total": total})
+                time.sleep(0.01)
+            self._send_event({"status": "download_complete", "message": "Download complete"})
+            self._send_event({"status": "loading", "message": "Loading model..."})
+            with self.state.lock:
+                self.state.model_loaded = True
+                project = self.state.current_project()
+            self._send_event({"status": "model_loaded", "message": "Model loaded"})
+            self._send_event({"model_name": model_name, "project": project}, event="complete")
+            self._end_sse()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _load_model(self, body: bytes) -> None:
+        with self.state.lock:
+            self.state.model_loaded = True
+        self._json({"status": "loaded", "model_name": self.server_config.model_name})
+
+    def _unload_model(self, body: bytes) -> None:
+        with self.state.lock:
+            self.state.model_loaded = False
+        self._json({"status": "unloaded"})
+
+    def _upload_asset(self, body: bytes) -> None:
+        match = re.search(rb'filename="([^"]*)"\r\n(?:.+\r\n)*\r\n', body)
+        filename = match.group(1).decode(errors="replace") if match else "upload"
+        boundary = self.headers.get("Content-Type", "").partition("boundary=")[2].strip('"')
+        content = body[match.end():body.rfind(b"\r\n--" + boundary.encode())] if match and boundary else body
+        self._json(self._new_asset(filename, bytes(content)))
+
+    def _new_asset(self, filename: str, content: bytes) -> dict:
+        asset = {
+            "asset_id": str(uuid.uuid4()), "filename": filename, "size": len(content),
+            "sha256": hashlib.sha256(content).hexdigest(), "markdown": True,
+        }
+        with self.state.lock:
+            self.state.assets[asset["asset_id"]] = asset
+        return asset
+
+    def _get_asset(self, body: bytes, asset_id: str) -> None:
+        asset = self.state.assets.get(asset_id)
+        if asset is None:
+            self._json({"detail": "Asset not found"}, 404)
+        else:
+            self._json(asset)
+
+    def _find_asset(self, body: bytes, sha256: str) -> None:
+        with self.state.lock:
+            asset = next((a for a in self.state.assets.values() if a["sha256"] == sha256), None)
+        if asset is None:
+            self._json({"detail": "Asset not found"}, 404)
+        else:
+            self._json(asset)
+
+    def _create_upload(self, body: bytes) -> None:
+        if not self.server_config.chunked_uploads:
+            self._json({"detail": "Not Found"}, 404)
+            return
+        data = self._payload(body)
+        upload = {
+            "upload_id": str(uuid.uuid4()),
+            "filename": str(data.get("filename", "upload")),
+            "size": int(data.get("size", 0)),
+            "sha256": str(data.get("sha256", "")),
+            "part_size": int(data.get("part_size") or 8 << 20),
+            "data": bytearray(),
+        }
+        with self.state.lock:
+            self.state.uploads[upload["upload_id"]] = upload
+        self._json({"upload_id": upload["upload_id"], "part_size": upload["part_size"], "offset": 0}, 201)
+
+    def _upload_status(self, body: bytes, upload_id: str) -> None:
+        upload = self.state.uploads.get(upload_id)
+        if upload is None:
+            self._json({"detail": "Upload not found"}, 404)
+            return
+        self._json({"upload_id": upload_id, "offset": len(upload["data"]), "size": upload["size"]})
+
+    def _upload_part(self, body: bytes, upload_id: str, index: str) -> None:
+        upload = self.state.uploads.get(upload_id)
+        if upload is None:
+            self._json({"detail": "Upload not found"}, 404)
+            return
+        if hashlib.sha256(body).hexdigest() != self.headers.get("X-Part-SHA256"):
+            self._json({"detail": "Part checksum mismatch"}, 422)
+            return
+        start = int(index) * upload["part_size"]
+        with self.state.lock:
+            if start > len(upload["data"]):
+                self._json({"detail": "Parts must be sent in order", "offset": len(upload["data"])}, 409)
+                return
+            upload["data"][start:start + len(body)] = body
+            offset = len(upload["data"])
+        self._json({"offset": offset})
+
+    def _complete_upload(self, body: bytes, upload_id: str) -> None:
+        with self.state.lock:
+            upload = self.state.uploads.pop(upload_id, None)
+        if upload is None:
+            self._json({"detail": "Upload not found"}, 404)
+            return
+        if len(upload["data"]) != upload["size"] or hashlib.sha256(upload["data"]).hexdigest() != upload["sha256"]:
+            self._json({"detail": "File checksum mismatch"}, 422)
+            return
+        self._json(self._new_asset(upload["filename"], bytes(upload["data"])))
+
+    def _list_projects(self, body: bytes) -> None:
+        self._json({"projects": self.state.projects})
+
+    def _create_project(self, body: bytes) -> None:
+        payload = self._payload(body)
+        project = _new_project(
+            payload.get("name") or f"project-{len(self.state.projects) + 1}",
+            payload.get("model_name") or self.server_config.model_name,
+        )
+        with self.state.lock:
+            self.state.projects.append(project)
+        self._json(project)
+
+    def _update_project(self, body: bytes, pid: str) -> None:
+        project = self._project(pid)
+        if project is None:
+            self._json({"detail": "Project not found"}, 404)
+            return
+        payload = self._payload(body)
+        with self.state.lock:
+            for key in ("name", "model_name", "rules"):
+                if payload.get(key) is not None:
+                    project[key] = payload[key]
+        self._json(project)
+
+    def _delete_project(self, body: bytes, pid: str) -> None:
+        with self.state.lock:
+            project = self._project(pid)
+            if project is None:
+                self._json({"detail": "Project not found"}, 404)
+                return
+            self.state.projects.remove(project)
+            self.state.documents.pop(pid, None)
+            self.state.mcp_servers.pop(pid, None)
+            if project["current"] and self.state.projects:
+                self.state.projects[0]["current"] = True
+        self._json({"message": f"Project deleted: {project['name']}"})
+
+    def _list_documents(self, body: bytes, pid: str) -> None:
+        self._json({"documents": self.state.documents.get(pid, [])})
+
+    def _add_documents(self, body: bytes, pid: str) -> None:
+        source = str(self._payload(body).get("source", ""))
+        filename = source.rsplit("/", 1)[-1]
+        self._start_sse()
+        try:
+            for stage in ("parsing", "chunking", "embedding"):
+                self._send_event({"stage": stage, "filename": filename}, event="progress")
+                time.sleep(0.01)
+            with self.state.lock:
+                docs = self.state.documents.setdefault(pid, [])
+                added = []
+                if source and not any(d["path"] == source for d in docs):
+                    added.append({"id": str(uuid.uuid4()), "path": source})
+                    docs.extend(added)
+            self._send_event({"documents": added}, event="complete")
+            self._end_sse()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _delete_document(self, body: bytes, pid: str, doc_id: str) -> None:
+        with self.state.lock:
+            docs = self.state.documents.get(pid, [])
+            doc = next((d for d in docs if d["id"] == doc_id), None)
+            if doc is not None:
+                docs.remove(doc)
+        if doc is None:
+            self._json({"detail": "Document not found"}, 404)
+            return
+        self._json({"message": f"Document deleted: {doc['path']}"})
+
+    def _list_mcp(self, body: bytes, pid: str) -> None:
+        self._json({"servers": self.state.mcp_servers.get(pid, [])})
+
+    def _register_mcp(self, body: bytes, pid: str) -> None:
+        payload = self._payload(body)
+        server = {
+            "id": str(uuid.uuid4()),
+            "name": payload.get("name") or payload.get("server_url") or "mock-mcp",
+            "server_type": payload.get("server_type", "local"),
+            "server_url": payload.get("server_url"),
+            "tools": [{"name": "search"}, {"name": "fetch"}],
+            "enabled": True,
+        }
+        with self.state.lock:
+            self.state.mcp_servers.setdefault(pid, []).append(server)
+        self._json({"server": server})
+
+    def _delete_mcp(self, body: bytes, pid: str, server_id: str) -> None:
+        with self.state.lock:
+            servers = self.state.mcp_servers.get(pid, [])
+            server = next((s for s in servers if s["id"] == server_id), None)
+            if server is not None:
+                servers.remove(server)
+        if server is None:
+            self._json({"detail": "MCP server not found"}, 404)
+            return
+        self._json({"message": f"Removed {server['name']}"})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--token-rate", type=float, default=50.0, help="tokens/s per reply (0: unpaced)")
+    parser.add_argument("--chunk-tokens", type=int, default=1, help="tokens per SSE content chunk")
+    parser.add_argument("--reply-tokens", type=int, default=200, help="tokens per reply")
+    parser.add_argument("--retrieval", type=float, default=0.0, help="simulated retrieval seconds")
+    parser.add_argument("--prefill", type=float, default=0.0, help="simulated prefill seconds")
+    parser.add_argument("--no-status", action="store_true", help="omit chat.status events")
+    parser.add_argument("--model-name", default="mock-model")
+    parser.add_argument("--no-chunked-uploads", action="store_true",
+                        help="answer 404 to chunked upload requests (single POST only)")
+    args = parser.parse_args()
+
+    config = MockConfig(
+        token_rate=args.token_rate,
+        chunk_tokens=args.chunk_tokens,
+        reply_tokens=args.reply_tokens,
+        status_events=not args.no_status,
+        retrieval_s=args.retrieval,
+        prefill_s=args.prefill,
+        model_name=args.model_name,
+        chunked_uploads=not args.no_chunked_uploads,
+    )
+    server = MockServer(config, args.host, args.port)
+    print(f"Mock model server on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
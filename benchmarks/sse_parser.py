@@ -0,0 +1,99 @@
+"""Microbenchmark for tui.sse.SSEDecoder.
+
+Replays a synthetic chat-completions stream split into fixed-size network
+chunks and reports events/s and MB/s for the incremental decoder, with and
+without JSON decoding, next to the previous line-by-line approach.
+
+    python -m benchmarks.sse_parser [--events 50000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from tui import sse
+from tui.sse import SSEDecoder
+
+
+def build_stream(n_events: int) -> bytes:
+    parts = [b'data: {"object":"chat.status","step":"retrieval","status":"processing","message":"Searching..."}\n\n']
+    for i in range(n_events):
+        chunk = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": {"content": f"tok{i % 97} "}}],
+        }
+        parts.append(b"data: " + json.dumps(chunk, separators=(",", ":")).encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+def split(stream: bytes, size: int) -> list[bytes]:
+    return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+
+def line_based(chunks: list[bytes], decode_json: bool) -> int:
+    """The per-line str decode + startswith parser the call sites used before."""
+    count = 0
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            text = line.decode("utf-8")
+            if not text.startswith("data: "):
+                continue
+            data = text[6:]
+            if data == "[DONE]":
+                continue
+            if decode_json:
+                json.loads(data)
+            count += 1
+    return count
+
+
+def incremental(chunks: list[bytes], decode_json: bool) -> int:
+    count = 0
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        for event in decoder.feed(chunk):
+            if decode_json and event.raw != b"[DONE]":
+                event.json()
+            count += 1
+    return count
+
+
+def bench(fn, chunks, decode_json, repeat) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(chunks, decode_json)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stream = build_stream(args.events)
+    mb = len(stream) / 1e6
+    print(f"{args.events:,} events, {mb:.1f} MB, json={sse.json_loads.__module__}")
+    print(f"{'chunk':>7} {'parser':<12} {'json':<5} {'events/s':>12} {'MB/s':>8}")
+    for size in (64, 1024, 16384):
+        chunks = split(stream, size)
+        for name, fn in (("line-based", line_based), ("incremental", incremental)):
+            for decode_json in (False, True):
+                elapsed = bench(fn, chunks, decode_json, args.repeat)
+                print(
+                    f"{size:>7} {name:<12} {'yes' if decode_json else 'no':<5} "
+                    f"{args.events / elapsed:>12,.0f} {mb / elapsed:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Headless rendering benchmark for the SLPChat TUI.
+
+Drives :class:`tui.chat.SLPChat` through Textual's pilot against the mock
+model server (:mod:`benchmarks.mock_server`, run as a separate process so
+its CPU time stays out of the numbers) and records, per scenario:
+
+* frame time — duration of each streaming frame (p50 / p95 / max);
+* event-loop lag — oversleep of a 5 ms probe timer (p50 / p95 / max);
+* CPU time per token (or per message for histories) on the UI thread;
+* peak RSS of the scenario process (each scenario runs in its own process).
+
+Scenarios are streamed replies of ``--tokens`` tokens at each of ``--rates``
+tokens/s (0 = as fast as the server can send), plus resumed histories of
+``--history`` messages paged in to the top of the log.
+
+    python -m benchmarks.tui_render [--tokens 1000 10000 100000] [--rates 1000 0]
+                                    [--history 1000 10000] [--json out.json]
+                                    [--baseline old.json --max-regression 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from tui.metrics import percentile
+
+LAG_PROBE_S = 0.005
+TERMINAL_SIZE = (120, 40)
+
+# Metrics compared against --baseline; lower is better for all of them.
+GATED_METRICS = ("cpu_us_per_unit", "frame_p95_ms", "lag_p95_ms", "peak_rss_mb")
+
+
+@dataclass
+class _Message:
+    """Stand-in for a stored conversation message (``role`` / ``content``)."""
+    role: str
+    content: str
+
+
+class _SyntheticStore:
+    """ConversationStore replacement returning *count* alternating messages."""
+
+    count = 0
+
+    def __init__(self, home_dir) -> None:
+        pass
+
+    def load(self, session_id: str) -> list[_Message]:
+        from benchmarks.mock_server import REPLY_SCRIPT
+        return [
+            _Message("user", f"Question {i // 2}: how does part {i // 2} work?")
+            if i % 2 == 0 else _Message("assistant", REPLY_SCRIPT)
+            for i in range(self.count)
+        ]
+
+
+class _Probe:
+    """Collects frame durations and event-loop lag while a scenario runs."""
+
+    def __init__(self) -> None:
+        self.frames: list[float] = []
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def instrument_frames(self) -> None:
+        from tui.render import FrameScheduler
+
+        tick = FrameScheduler._tick
+        frames = self.frames
+
+        def timed_tick(scheduler) -> None:
+            start = time.perf_counter()
+            tick(scheduler)
+            frames.append(time.perf_counter() - start)
+
+        FrameScheduler._tick = timed_tick
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._measure_lag())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _measure_lag(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_S)
+            self.lags.append(max(0.0, time.perf_counter() - start - LAG_PROBE_S))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _ms(values: list[float], pct: float) -> float | None:
+    return round(percentile(sorted(values), pct) * 1000, 3) if values else None
+
+
+async def _wait_until(pilot, predicate, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        await pilot.pause(0.01)
+    return True
+
+
+async def _run_scenario(scenario: dict, server_url: str) -> dict:
+    from tui.chat import SLPChat
+    from tui.widgets import MessageLog
+
+    probe = _Probe()
+    probe.instrument_frames()
+    history = scenario["kind"] == "history"
+    if history:
+        import tui.workers.bootstrap as bootstrap
+        _SyntheticStore.count = scenario["messages"]
+        bootstrap.ConversationStore = _SyntheticStore
+
+    app = SLPChat(server_url, session_id="bench-history" if history else "")
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        prompt = app.query_one("#prompt-box")
+        # Histories load during bootstrap, so they are measured from mount.
+        if not history and not await _wait_until(pilot, lambda: not prompt.disabled, 30):
+            raise RuntimeError("bootstrap did not finish")
+        log = app.query_one("#chat-log", MessageLog)
+        rss_before = _peak_rss_mb()
+        probe.start()
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+
+        if history:
+            await _wait_until(pilot, lambda: len(log.entries) > 2, 60)
+            # Page every older batch in, as a user holding scroll-up would.
+            while app._history_older:
+                log.scroll_home(animate=False)
+                log.post_message(MessageLog.ReachedTop())
+                await pilot.pause()
+            units = scenario["messages"]
+        else:
+            app._stream_response("benchmark")
+            await _wait_until(pilot, lambda: app._streaming, 10)
+            await _wait_until(pilot, lambda: not app._streaming, 3600)
+            units = scenario["tokens"]
+
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        probe.stop()
+        await pilot.pause()
+        mounted = len(log.children)
+
+    return {
+        **scenario,
+        "wall_s": round(wall, 3),
+        "units_per_s": round(units / wall, 1) if wall else None,
+        "cpu_us_per_unit": round(cpu / units * 1e6, 2) if units else None,
+        "frames": len(probe.frames),
+        "frame_p50_ms": _ms(probe.frames, 50),
+        "frame_p95_ms": _ms(probe.frames, 95),
+        "frame_max_ms": round(max(probe.frames) * 1000, 3) if probe.frames else None,
+        "lag_p50_ms": _ms(probe.lags, 50),
+        "lag_p95_ms": _ms(probe.lags, 95),
+        "lag_max_ms": round(max(probe.lags) * 1000, 3) if probe.lags else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "rss_growth_mb": round(_peak_rss_mb() - rss_before, 1),
+        "mounted_widgets": mounted,
+    }
+
+
+def run_one(scenario: dict) -> dict:
+    """Run *scenario* against a fresh mock server process."""
+    import httpx
+
+    port = _free_port()
+    server = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.mock_server", "--port", str(port),
+        "--token-rate", str(scenario.get("rate", 0)),
+        "--reply-tokens", str(scenario.get("tokens", 200)),
+    ], stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.perf_counter() + 10
+        while True:
+            try:
+                httpx.get(f"{url}/health", timeout=1)
+                break
+            except httpx.HTTPError:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError("mock server did not start")
+                time.sleep(0.05)
+        return asyncio.run(_run_scenario(scenario, url))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _scenarios(args) -> list[dict]:
+    scenarios = [
+        {"name": f"stream {tokens} @ {rate or 'max'} tok/s", "kind": "stream", "tokens": tokens, "rate": rate}
+        for tokens in args.tokens for rate in args.rates
+    ]
+    scenarios += [
+        {"name": f"history {messages} msgs", "kind": "history", "messages": messages}
+        for messages in args.history
+    ]
+    return scenarios
+
+
+def _print_table(results: list[dict], baseline: dict) -> None:
+    header = (f"{'scenario':<28} {'units/s':>10} {'cpu us/u':>9} {'frame p95':>10} {'frame max':>10} "
+              f"{'lag p95':>8} {'lag max':>8} {'peak MB':>8} {'widgets':>8}")
+    print(header)
+    for r in results:
+        print(
+            f"{r['name']:<28} {r['units_per_s'] or 0:>10,.0f} {r['cpu_us_per_unit'] or 0:>9.1f} "
+            f"{r['frame_p95_ms'] or 0:>10.2f} {r['frame_max_ms'] or 0:>10.2f} "
+            f"{r['lag_p95_ms'] or 0:>8.2f} {r['lag_max_ms'] or 0:>8.2f} "
+            f"{r['peak_rss_mb']:>8.1f} {r['mounted_widgets']:>8}"
+        )
+        before = baseline.get(r["name"])
+        if before:
+            changes = [
+                f"{metric} {(r[metric] - before[metric]) / before[metric]:+.0%}"
+                for metric in GATED_METRICS if r.get(metric) is not None and before.get(metric)
+            ]
+            print(f"{'':<28} vs baseline: {', '.join(changes)}")
+
+
+def _regressions(results: list[dict], baseline: dict, max_regression: float) -> list[str]:
+    failures = []
+    for r in results:
+        before = baseline.get(r["name"])
+        if not before:
+            continue
+        for metric in GATED_METRICS:
+            if r.get(metric) is None or not before.get(metric):
+                continue
+            change = (r[metric] - before[metric]) / before[metric] * 100
+            if change > max_regression:
+                failures.append(f"{r['name']}: {metric} {before[metric]} -> {r[metric]} ({change:+.0f}%)")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, nargs="*", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--rates", type=float, nargs="*", default=[1_000, 0],
+                        help="token rates in tokens/s (0: unpaced)")
+    parser.add_argument("--history", type=int, nargs="*", default=[1_000, 10_000],
+                        help="resumed history sizes in messages")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="earlier --json results to compare against")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="exit 1 if a gated metric is this many percent worse than --baseline")
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        # Child mode: one scenario, result as JSON on the last stdout line.
+        print(json.dumps(run_one(json.loads(args.scenario))))
+        return
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = {r["name"]: r for r in json.load(fh)["results"]}
+
+    results = []
+    for scenario in _scenarios(args):
+        print(f"running {scenario['name']} ...", file=sys.stderr)
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.tui_render", "--scenario", json.dumps(scenario)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(proc.stderr, file=sys.stderr)
+            raise SystemExit(f"scenario failed: {scenario['name']}")
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    _print_table(results, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, fh, indent=2)
+    if baseline and args.max_regression is not None:
+        failures = _regressions(results, baseline, args.max_regression)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,35 @@
-"""CLI command classes."""
+"""CLI command classes.
 
-from .base import Command
-from .init import InitCommand
-from .document import DocumentCommand
-from .rule import RuleCommand
-from .model import ModelCommand
-from .run import RunCommand
-from .token import TokenCommand
-from .mcp import McpCommand
-from .server import ServerCommand
-from .projects import ProjectsCommand
+Command modules pull in heavy dependencies (requests, prompt_toolkit,
+prettytable, the smartloop framework), so the classes below are imported on
+first attribute access rather than when the package is loaded.
+"""
 
-__all__ = [
-    "Command",
-    "InitCommand",
-    "DocumentCommand",
-    "RuleCommand",
-    "ModelCommand",
-    "RunCommand",
-    "TokenCommand",
-    "McpCommand",
-    "ServerCommand",
-    "ProjectsCommand",
-]
+from __future__ import annotations
+
+import importlib
+
+_EXPORTS = {
+    "Command": ".base",
+    "InitCommand": ".init",
+    "DocumentCommand": ".document",
+    "RuleCommand": ".rule",
+    "ModelCommand": ".model",
+    "RunCommand": ".run",
+    "AskCommand": ".ask",
+    "BatchCommand": ".batch",
+    "BenchCommand": ".bench",
+    "TokenCommand": ".token",
+    "McpCommand": ".mcp",
+    "ServerCommand": ".server",
+    "ProjectsCommand": ".projects",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
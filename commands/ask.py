@@ -0,0 +1,137 @@
+"""AskCommand — ``ask`` one-shot, non-interactive completion for pipelines."""
+
+from __future__ import annotations
+
+import json
+import sys
+import uuid
+from pathlib import Path
+
+from requests.exceptions import RequestException
+
+from commands.base import Command
+from commands.completion import run_completion
+from commands.console import console
+from commands.helpers import build_chat_payload
+from commands.leases import attached
+from commands.output import StreamWriter
+from commands.upload import upload_asset
+
+# Exit statuses (2 matches argparse's usage errors).
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+class AskCommand(Command):
+    """Handles ``slp ask``: prompt from argv or stdin, answer on stdout.
+
+    stdout carries only the answer (or the ``--json`` summary); all
+    diagnostics, spinners and the server start-up banner go to stderr.
+    """
+
+    args: object
+    model_name: str
+
+    def execute(self) -> None:
+        # Keep stdout clean for the caller: route the shared console to stderr.
+        console.file = sys.stderr
+        try:
+            code = self._ask()
+        except KeyboardInterrupt:
+            code = EXIT_INTERRUPTED
+        sys.exit(code)
+
+    def _ask(self) -> int:
+        prompt = self._read_prompt()
+        if not prompt:
+            console.print("[red]No prompt given: pass it as an argument or on stdin.[/red]")
+            return EXIT_USAGE
+        if not self._require_server():
+            return EXIT_FAILED
+        if not self._load_model():
+            return EXIT_FAILED
+
+        with attached("ask"):
+            attachment_ids = []
+            for path in self.args.attach or []:
+                asset_id = self._upload(path)
+                if asset_id is None:
+                    return EXIT_FAILED
+                attachment_ids.append(asset_id)
+            return self._complete(prompt, attachment_ids)
+
+    def _read_prompt(self) -> str:
+        """The prompt argument; stdin only when it is missing or ``-``.
+
+        stdin is left alone otherwise, so ``while read f; do slp ask ...; done``
+        loops do not swallow their own input.
+        """
+        if self.args.prompt and self.args.prompt != "-":
+            return self.args.prompt.strip()
+        return "" if sys.stdin.isatty() else sys.stdin.read().strip()
+
+    def _load_model(self) -> bool:
+        """Load the model if the server has none (no bootstrap, no prompts)."""
+        try:
+            health = self.client.get("/health", profile="health").json()
+            self.model_name = self.model_name or health.get("model_name")
+            if health.get("model_loaded"):
+                return True
+            payload = {"mode": "inference"}
+            project_id = self._resolve_project_id()
+            if project_id:
+                payload["project_id"] = project_id
+            with console.status("[bold cyan]Loading model...[/bold cyan]", spinner="dots"):
+                self.client.post("/v1/models/load", json=payload, profile="model").raise_for_status()
+            return True
+        except RequestException as e:
+            console.print(f"[red]Could not load model: {e}[/red]")
+            return False
+
+    def _upload(self, filepath: str) -> str | None:
+        path = Path(filepath)
+        if not path.is_file():
+            console.print(f"[red]File not found: {filepath}[/red]")
+            return None
+        try:
+            resp = upload_asset(self.client, path)
+            if resp.status_code in (400, 422):
+                console.print(f"[red]Upload rejected: {resp.json().get('detail', resp.text)}[/red]")
+                return None
+            resp.raise_for_status()
+            return resp.json()["asset_id"]
+        except (RequestException, ValueError) as e:
+            console.print(f"[red]Upload error: {e}[/red]")
+            return None
+
+    def _complete(self, prompt: str, attachment_ids: list[str]) -> int:
+        session_id = getattr(self.args, "session_id", None) or str(uuid.uuid4())
+        as_json = getattr(self.args, "json", False)
+        payload = build_chat_payload(prompt, self.model_name, session_id, attachment_ids)
+
+        out = None if as_json else StreamWriter(sys.stdout)
+        try:
+            result = run_completion(self.client, payload, on_text=out.write if out else None)
+        except RequestException as e:
+            if out is not None:
+                out.close()
+            console.print(f"[red]API Error: {e}[/red]")
+            return EXIT_FAILED
+
+        if out is not None:
+            out.write("\n")
+            out.close()
+            return EXIT_OK
+
+        summary = {
+            "session_id": session_id,
+            "model": self.model_name,
+            "content": result.content,
+            "usage": result.usage_dict(),
+            "timings": result.timings.as_dict(),
+        }
+        sys.stdout.write(json.dumps(summary) + "\n")
+        sys.stdout.flush()
+        return EXIT_OK
@@ -8,13 +8,14 @@ import sys
 import time
 from pathlib import Path
 
-import requests
 from requests.exceptions import RequestException
 
 from smartloop.server import is_server_running, read_port_file
 from smartloop.utils.log_utils import print_logo
 
+from commands.client import ApiClient, get_client
 from commands.console import console, logger, settings
+from commands.readiness import READY_FD_ENV, STAGE_MESSAGES, LISTENING, wait_for_stage
 
 
 class Command:
@@ -24,6 +25,10 @@ class Command:
     host: str
     port: int
 
+    def __init__(self, **options) -> None:
+        for name, value in options.items():
+            setattr(self, name, value)
+
     def execute(self) -> None:
         """Execute the primary command action."""
         raise NotImplementedError
@@ -31,6 +36,11 @@ class Command:
     def _base_url(self) -> str:
         return f"http://{self.host}:{self.port}"
 
+    @property
+    def client(self) -> ApiClient:
+        """Pooled HTTP client for the current server (follows port changes)."""
+        return get_client(self._base_url())
+
     def _require_server(self) -> bool:
         """Ensure the API server is reachable; auto-start if needed."""
         for port in dict.fromkeys([self.port, read_port_file()]):
@@ -45,37 +55,75 @@ class Command:
             home_dir = Path(settings.home_dir)
             log_file = str(home_dir / "server.log")
             os.makedirs(home_dir, exist_ok=True)
-            with open(log_file, "a") as lf:
-                if getattr(sys, "frozen", False):
-                    cmd = [sys.executable, "server", "start"]
-                else:
-                    cmd = [sys.executable, sys.argv[0], "server", "start"]
-                subprocess.Popen(cmd, stdout=lf, stderr=lf, start_new_session=True)
-            with console.status("Please wait while server is heating up...", spinner="dots") as status:
-                for i in range(30):
-                    time.sleep(1)
-                    check_port = read_port_file() or self.port
-                    if is_server_running(self.host, check_port):
-                        self.port = check_port
-                        return True
-                    if i % 5 == 4:
-                        status.update("Still waiting for server...")
+            if getattr(sys, "frozen", False):
+                cmd = [sys.executable, "server", "start"]
+            else:
+                cmd = [sys.executable, sys.argv[0], "server", "start"]
+            if os.name == "nt":
+                # Windows cannot select() on a pipe or pass fds: poll the port instead
+                started = self._poll_server_start(cmd, log_file)
+            else:
+                started = self._await_server_start(cmd, log_file)
+            if started:
+                return True
             logger.error(f"Server failed to start. Check {Path(settings.home_dir) / 'server.log'} for details.")
             return False
         except Exception as e:
             logger.error(f"Failed to start server: {e}")
             return False
 
+    def _await_server_start(self, cmd: list[str], log_file: str) -> bool:
+        """Spawn the server and block on its readiness pipe (see commands.readiness)."""
+        read_fd, write_fd = os.pipe()
+        try:
+            with open(log_file, "a") as lf:
+                subprocess.Popen(
+                    cmd, stdout=lf, stderr=lf, start_new_session=True,
+                    pass_fds=(write_fd,), env={**os.environ, READY_FD_ENV: str(write_fd)},
+                )
+            os.close(write_fd)
+            with console.status("Please wait while server is heating up...", spinner="dots") as status:
+                result = wait_for_stage(
+                    read_fd, timeout=30,
+                    on_stage=lambda stage, _: status.update(STAGE_MESSAGES.get(stage, stage)),
+                )
+        finally:
+            os.close(read_fd)
+        if result and result[0] == LISTENING:
+            self.port = int(result[1]) if result[1].isdigit() else (read_port_file() or self.port)
+            return True
+        # No handshake (child exited or timed out): one last direct check
+        check_port = read_port_file() or self.port
+        if check_port and is_server_running(self.host, check_port):
+            self.port = check_port
+            return True
+        return False
+
+    def _poll_server_start(self, cmd: list[str], log_file: str) -> bool:
+        """Spawn the server and poll until it listens (fallback without the readiness pipe)."""
+        with open(log_file, "a") as lf:
+            subprocess.Popen(cmd, stdout=lf, stderr=lf, start_new_session=True)
+        with console.status("Please wait while server is heating up...", spinner="dots") as status:
+            for i in range(30):
+                time.sleep(1)
+                check_port = read_port_file() or self.port
+                if is_server_running(self.host, check_port):
+                    self.port = check_port
+                    return True
+                if i % 5 == 4:
+                    status.update("Still waiting for server...")
+        return False
+
     def _is_ready(self) -> bool:
         """Return True when the server has a loaded model and at least one project."""
         try:
-            health = requests.get(f"{self._base_url()}/health", timeout=5).json()
+            health = self.client.get("/health", profile="health").json()
             if not health.get("model_loaded"):
                 return False
         except RequestException:
             return False
         try:
-            data = requests.get(f"{self._base_url()}/v1/projects", timeout=10).json()
+            data = self.client.get("/v1/projects", profile="list").json()
             if not data.get("projects"):
                 return False
         except RequestException:
@@ -88,7 +136,7 @@ class Command:
         if pid:
             return pid
         try:
-            data = requests.get(f"{self._base_url()}/v1/projects", timeout=10).json()
+            data = self.client.get("/v1/projects", profile="list").json()
             for p in data.get("projects", []):
                 if p.get("current"):
                     return p["id"]
@@ -0,0 +1,221 @@
+"""BatchCommand — ``batch`` offline inference over a JSONL file of prompts."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from prettytable import PrettyTable
+from requests.exceptions import RequestException
+from tqdm import tqdm
+
+from commands.base import Command
+from commands.client import ApiClient, local_socket_path
+from commands.completion import InFlight, run_completion
+from commands.console import console
+from commands.helpers import build_chat_payload
+from commands.leases import attached
+
+# Results allowed to wait for an earlier, slower prompt, per worker.
+_REORDER_FACTOR = 4
+
+
+class BatchCommand(Command):
+    """Handles ``slp batch``: run every prompt of a JSONL file, N at a time.
+
+    Input lines are ``{"prompt": ..., "id"?, "attachments"?, "session_id"?}``
+    objects (or bare JSON strings).  Each output line carries the input ``id``
+    (the line number when absent), so the output file doubles as the
+    checkpoint: rerunning the same command skips ids already written.
+    """
+
+    args: object
+    model_name: str
+    _in_flight: InFlight
+
+    def execute(self) -> None:
+        input_path = Path(self.args.input)
+        output_path = Path(self.args.output or input_path.with_suffix(".out.jsonl"))
+        concurrency = max(1, self.args.concurrency)
+        if not input_path.is_file():
+            console.print(f"[red]Input file not found: {input_path}[/red]")
+            sys.exit(2)
+        if not self._require_server():
+            sys.exit(1)
+
+        items = list(_read_items(input_path))
+        done = _load_checkpoint(output_path, retry_failed=self.args.retry_failed)
+        todo = [item for item in items if item["id"] not in done]
+        if done:
+            console.print(f"[dim]Resuming: {len(done)} of {len(items)} prompts already in {output_path}[/dim]")
+        if not todo:
+            console.print("[dim]Nothing to do.[/dim]")
+            return
+
+        client = ApiClient(self._base_url(), pool_size=concurrency, socket_path=local_socket_path(self.host, self.port))
+        stats = _Stats()
+        bar = tqdm(total=len(todo), unit="prompt", dynamic_ncols=True, desc="batch")
+        interrupted = False
+        self._in_flight = InFlight()
+        with attached("batch"), output_path.open("a", encoding="utf-8") as out:
+            pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="slp-batch")
+            window: deque[Future] = deque()
+            try:
+                for item in todo:
+                    window.append(pool.submit(self._run_one, client, item))
+                    if len(window) >= concurrency * _REORDER_FACTOR:
+                        self._emit(window.popleft().result(), out, stats, bar)
+                while window:
+                    self._emit(window.popleft().result(), out, stats, bar)
+            except KeyboardInterrupt:
+                interrupted = True
+                self._in_flight.abort()
+            finally:
+                # Aborted streams return at once, so this only waits for the workers to notice.
+                pool.shutdown(wait=True, cancel_futures=True)
+                if interrupted:
+                    # Keep what finished; aborted and unstarted prompts run on resume.
+                    for future in window:
+                        if not future.cancelled() and future.exception() is None and future.result() is not None:
+                            self._emit(future.result(), out, stats, bar)
+                bar.close()
+                client.close()
+
+        self._report(stats, output_path)
+        if interrupted:
+            console.print(f"[yellow]Interrupted after {stats.prompts} prompts; "
+                          f"run the same command again to resume.[/yellow]")
+            sys.exit(130)
+        if stats.failed:
+            sys.exit(1)
+
+    def _run_one(self, client: ApiClient, item: dict) -> dict | None:
+        """Run one prompt and return its output record; None if it was aborted by an interrupt."""
+        record = {"id": item["id"]}
+        if "error" in item:
+            return {**record, "error": item["error"]}
+        payload = build_chat_payload(
+            item["prompt"],
+            item.get("model") or self.model_name,
+            item.get("session_id") or str(uuid.uuid4()),
+            item.get("attachments"),
+        )
+        try:
+            result = run_completion(client, payload, in_flight=self._in_flight)
+        except RequestException as e:
+            if self._in_flight.aborted:
+                return None
+            return {**record, "error": str(e)}
+        return {
+            **record,
+            "content": result.content,
+            "usage": result.usage_dict(),
+            "completion_tokens": result.completion_tokens,
+            "timings": result.timings.as_dict(),
+        }
+
+    @staticmethod
+    def _emit(record: dict, out, stats: "_Stats", bar: tqdm) -> None:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        stats.add(record)
+        bar.update(1)
+        bar.set_postfix_str(stats.rates(), refresh=False)
+
+    @staticmethod
+    def _report(stats: "_Stats", output_path: Path) -> None:
+        elapsed = stats.elapsed()
+        table = PrettyTable()
+        table.field_names = ["Metric", "Value"]
+        table.align["Metric"] = "l"
+        table.align["Value"] = "r"
+        table.add_row(["Prompts", stats.prompts])
+        table.add_row(["Failed", stats.failed])
+        table.add_row(["Wall time", f"{elapsed:.1f} s"])
+        table.add_row(["Prompts/s", f"{stats.prompts / elapsed:.2f}" if elapsed else "-"])
+        table.add_row(["Tokens/s", f"{stats.tokens / elapsed:.1f}" if elapsed else "-"])
+        table.add_row(["Output", str(output_path)])
+        console.print(table)
+
+
+class _Stats:
+    """Running totals for the live progress line and the final report."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.prompts = 0
+        self.failed = 0
+        self.tokens = 0
+
+    def add(self, record: dict) -> None:
+        self.prompts += 1
+        if "error" in record:
+            self.failed += 1
+        else:
+            self.tokens += record.get("completion_tokens") or 0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def rates(self) -> str:
+        elapsed = self.elapsed() or 1e-9
+        return f"{self.prompts / elapsed:.2f} prompt/s, {self.tokens / elapsed:.1f} tok/s, {self.failed} failed"
+
+
+def _read_items(path: Path):
+    """Yield ``{"id", "prompt", ...}`` dicts; unparsable lines carry an ``error``."""
+    with path.open(encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                yield {"id": lineno, "error": f"invalid JSON: {e}"}
+                continue
+            if isinstance(data, str):
+                data = {"prompt": data}
+            if not isinstance(data, dict) or not isinstance(data.get("prompt"), str):
+                yield {"id": lineno, "error": "expected a string or an object with a 'prompt'"}
+                continue
+            data.setdefault("id", lineno)
+            yield data
+
+
+def _load_checkpoint(path: Path, retry_failed: bool = False) -> set:
+    """Return ids already present in *path*.
+
+    A trailing partial line (the run was killed mid-write) is dropped.  With
+    *retry_failed*, failed records are removed so those prompts run again.
+    """
+    if not path.exists():
+        return set()
+    kept: list[str] = []
+    done = set()
+    dirty = False
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                dirty = True
+                continue
+            if retry_failed and "error" in record:
+                dirty = True
+                continue
+            if not line.endswith("\n"):
+                line += "\n"
+                dirty = True
+            kept.append(line)
+            done.add(record.get("id"))
+    if dirty:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text("".join(kept), encoding="utf-8")
+        os.replace(tmp, path)
+    return done
@@ -0,0 +1,309 @@
+"""BenchCommand — ``bench`` load generator for ``/v1/chat/completions``."""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from prettytable import PrettyTable
+from requests.exceptions import RequestException
+from tqdm import tqdm
+
+from commands.base import Command
+from commands.client import ApiClient, local_socket_path
+from commands.completion import InFlight, run_completion
+from commands.console import console
+from commands.helpers import build_chat_payload, upload_asset_cli
+from commands.leases import attached
+from tui.metrics import percentile
+
+# Built-in prompt mix: (label, prompt, weight).  Lengths vary so prefill and
+# decode both show up in the numbers.
+DEFAULT_PROMPTS = (
+    ("short", "Say hello in one sentence.", 3),
+    ("medium", "Explain in a short paragraph how a hash map handles collisions.", 2),
+    ("long", "Summarise the following notes as five bullet points:\n\n"
+             + "The service keeps a pool of workers, a request queue and a result cache. " * 40, 1),
+)
+
+
+class BenchCommand(Command):
+    """Handles ``slp bench``: synthetic sessions against the chat endpoint.
+
+    Closed loop (default): ``--sessions`` workers each send their next request
+    as soon as the previous reply ends, each keeping its own session.  Fixed
+    arrival rate (``--rate``): requests are released on a fixed schedule and
+    latency is measured from the scheduled time, so time spent queued behind
+    busy sessions counts against the server.
+    """
+
+    args: object
+    model_name: str
+    _in_flight: InFlight
+
+    def execute(self) -> None:
+        args = self.args
+        sessions = max(1, args.sessions)
+        if not self._require_server():
+            sys.exit(1)
+        if not self.model_name:
+            # Record which model was measured, so saved runs compare like with like.
+            try:
+                self.model_name = self.client.get("/health", profile="health").json().get("model_name")
+            except RequestException:
+                pass
+        prompts = _load_prompts(args.prompts) if args.prompts else list(DEFAULT_PROMPTS)
+        if not prompts:
+            console.print(f"[red]No prompts in {args.prompts}[/red]")
+            sys.exit(2)
+        baseline = _load_baseline(args.baseline) if args.baseline else None
+
+        with attached("bench"):
+            attachment_ids = []
+            for path in args.attach or []:
+                asset_id = upload_asset_cli(path, self.host, self.port)
+                if asset_id is None:
+                    sys.exit(1)
+                attachment_ids.append(asset_id)
+
+            plan = self._plan(prompts, attachment_ids)
+            client = ApiClient(self._base_url(), pool_size=sessions, socket_path=local_socket_path(self.host, self.port))
+            bar = tqdm(total=len(plan), unit="req", dynamic_ncols=True, desc="bench")
+            results: list[dict] = []
+            stop = threading.Event()
+            self._in_flight = InFlight()
+            interrupted = False
+            pool = ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="slp-bench")
+            start = time.perf_counter()
+            try:
+                if args.rate:
+                    self._open_loop(pool, client, plan, args.rate, bar, results)
+                else:
+                    self._closed_loop(pool, client, plan, sessions, bar, stop, results)
+            except KeyboardInterrupt:
+                # Requests in flight are aborted and dropped; the finished ones are kept.
+                interrupted = True
+                stop.set()
+                self._in_flight.abort()
+            finally:
+                wall_s = time.perf_counter() - start
+                pool.shutdown(wait=True, cancel_futures=True)
+                results = sorted(results, key=lambda r: r["index"])
+                bar.close()
+                client.close()
+
+        if interrupted and not results:
+            console.print("[yellow]Interrupted before any request finished; no results saved.[/yellow]")
+            sys.exit(130)
+        summary = _summarise(results, wall_s)
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "interrupted": interrupted,
+            "config": {
+                "model": self.model_name,
+                "mode": "rate" if args.rate else "closed",
+                "sessions": sessions,
+                "requests": len(plan),
+                "rate": args.rate,
+                "prompts": args.prompts or "builtin",
+                "attachments": len(attachment_ids),
+                "attach_ratio": args.attach_ratio if attachment_ids else 0.0,
+            },
+            "summary": summary,
+            "requests": results,
+        }
+        output = Path(args.output or f"bench-{datetime.now():%Y%m%d-%H%M%S}.json")
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        _print_summary(summary, baseline)
+        console.print(f"[dim]Results saved to {output}[/dim]")
+        if interrupted:
+            console.print(f"[yellow]Interrupted after {len(results)} of {len(plan)} requests.[/yellow]")
+            sys.exit(130)
+
+    def _plan(self, prompts: list[tuple], attachment_ids: list[str]) -> list[dict]:
+        """Draw ``--requests`` prompts from the weighted mix (seeded, so runs match)."""
+        rng = random.Random(self.args.seed)
+        labels, texts, weights = zip(*prompts)
+        plan = []
+        for index in range(max(1, self.args.requests)):
+            pick = rng.choices(range(len(texts)), weights=weights)[0]
+            attach = bool(attachment_ids) and rng.random() < self.args.attach_ratio
+            plan.append({
+                "index": index,
+                "label": labels[pick],
+                "prompt": texts[pick],
+                "attachments": list(attachment_ids) if attach else [],
+            })
+        return plan
+
+    def _closed_loop(self, pool: ThreadPoolExecutor, client: ApiClient, plan: list[dict], sessions: int,
+                     bar: tqdm, stop: threading.Event, results: list[dict]) -> None:
+        lock = threading.Lock()
+        pending = iter(plan)
+
+        def session_worker() -> None:
+            session_id = str(uuid.uuid4())
+            while not stop.is_set():
+                with lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                record = self._send(client, item, session_id, time.perf_counter())
+                if record is None:
+                    return
+                with lock:
+                    results.append(record)
+                    bar.update(1)
+
+        for future in [pool.submit(session_worker) for _ in range(sessions)]:
+            future.result()
+
+    def _open_loop(self, pool: ThreadPoolExecutor, client: ApiClient, plan: list[dict], rate: float,
+                   bar: tqdm, results: list[dict]) -> None:
+        lock = threading.Lock()
+
+        def finished(future: Future) -> None:
+            if future.cancelled() or future.exception() is not None or future.result() is None:
+                return
+            with lock:
+                results.append(future.result())
+                bar.update(1)
+
+        start = time.perf_counter()
+        futures = []
+        for item in plan:
+            scheduled = start + item["index"] / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            future = pool.submit(self._send, client, item, str(uuid.uuid4()), scheduled)
+            future.add_done_callback(finished)
+            futures.append(future)
+        for future in futures:
+            future.result()
+
+    def _send(self, client: ApiClient, item: dict, session_id: str, scheduled: float) -> dict | None:
+        """Run one request and return its record; None if it was aborted by an interrupt."""
+        record = {
+            "index": item["index"],
+            "label": item["label"],
+            "attachments": len(item["attachments"]),
+            "queue_s": round(time.perf_counter() - scheduled, 4),
+        }
+        payload = build_chat_payload(item["prompt"], self.model_name, session_id, item["attachments"])
+        try:
+            timings = run_completion(client, payload, in_flight=self._in_flight).timings
+        except RequestException as e:
+            if self._in_flight.aborted:
+                return None
+            return {**record, "ok": False, "error": str(e),
+                    "e2e_s": round(time.perf_counter() - scheduled, 4)}
+        return {
+            **record,
+            "ok": True,
+            "ttft_s": round(record["queue_s"] + timings.first_token_s, 4)
+            if timings.first_token_s is not None else None,
+            "e2e_s": round(record["queue_s"] + timings.total_s, 4),
+            "prompt_tokens": timings.usage.prompt_tokens if timings.usage else None,
+            "completion_tokens": timings.completion_tokens,
+            "timings": timings.as_dict(),
+        }
+
+
+def _load_prompts(path: str) -> list[tuple]:
+    """Read a prompt mix: JSONL (strings or ``{"prompt", "label"?, "weight"?}``)
+    or plain text with one prompt per line."""
+    file = Path(path)
+    if not file.is_file():
+        console.print(f"[red]Prompt file not found: {path}[/red]")
+        sys.exit(2)
+    prompts = []
+    for lineno, line in enumerate(file.read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        if file.suffix == ".jsonl":
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                console.print(f"[red]{path}:{lineno}: invalid JSON: {e}[/red]")
+                sys.exit(2)
+            if isinstance(data, str):
+                data = {"prompt": data}
+            if not isinstance(data, dict) or not isinstance(data.get("prompt"), str):
+                console.print(f'[red]{path}:{lineno}: expected a string or an object with a "prompt"[/red]')
+                sys.exit(2)
+            prompts.append((str(data.get("label", lineno)), data["prompt"], float(data.get("weight", 1))))
+        else:
+            prompts.append((str(lineno), line, 1.0))
+    return prompts
+
+
+def _load_baseline(path: str) -> dict | None:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))["summary"]
+    except (OSError, ValueError, KeyError) as e:
+        console.print(f"[red]Could not read baseline {path}: {e}[/red]")
+        sys.exit(2)
+
+
+def _summarise(results: list[dict], wall_s: float) -> dict:
+    ok = [r for r in results if r["ok"]]
+
+    def dist(key: str) -> dict | None:
+        values = sorted(r[key] for r in ok if r.get(key) is not None)
+        if not values:
+            return None
+        return {f"p{p}": percentile(values, p) for p in (50, 95, 99)}
+
+    tokens = sum(r["completion_tokens"] or 0 for r in ok)
+    return {
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "error_rate": round((len(results) - len(ok)) / len(results), 4) if results else 0.0,
+        "wall_s": round(wall_s, 3),
+        "requests_per_s": round(len(results) / wall_s, 3) if wall_s else None,
+        "tokens_per_s": round(tokens / wall_s, 2) if wall_s else None,
+        "ttft_s": dist("ttft_s"),
+        "e2e_s": dist("e2e_s"),
+        "queue_s": dist("queue_s"),
+    }
+
+
+def _print_summary(summary: dict, baseline: dict | None) -> None:
+    table = PrettyTable()
+    table.field_names = ["Metric", "Value"] + (["Baseline", "Change"] if baseline else [])
+    table.align = "r"
+    table.align["Metric"] = "l"
+
+    rows = [
+        ("Requests", ("requests",), "{:.0f}"),
+        ("Errors", ("errors",), "{:.0f}"),
+        ("Error rate", ("error_rate",), "{:.1%}"),
+        ("Requests/s", ("requests_per_s",), "{:.2f}"),
+        ("Tokens/s", ("tokens_per_s",), "{:.1f}"),
+    ]
+    for name, label in (("ttft_s", "TTFT"), ("e2e_s", "End-to-end")):
+        for p in ("p50", "p95", "p99"):
+            rows.append((f"{label} {p} (s)", (name, p), "{:.3f}"))
+
+    def lookup(data: dict | None, keys: tuple):
+        for key in keys:
+            data = data.get(key) if isinstance(data, dict) else None
+        return data
+
+    for name, keys, fmt in rows:
+        value = lookup(summary, keys)
+        row = [name, fmt.format(value) if value is not None else "-"]
+        if baseline:
+            before = lookup(baseline, keys)
+            row.append(fmt.format(before) if before is not None else "-")
+            row.append(f"{(value - before) / before:+.1%}" if value is not None and before else "-")
+        table.add_row(row)
+    console.print(table)
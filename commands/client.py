@@ -0,0 +1,203 @@
+"""ApiClient — pooled, keep-alive HTTP client shared by every CLI command.
+
+One :class:`requests.Session` is kept per server base URL so that all calls a
+command makes (health check, project lookup, the actual request …) reuse the
+same connection.  Timeouts are chosen per endpoint through named
+profiles, and idempotent requests are retried on connection errors.
+
+When the server runs on this machine and advertises a Unix domain socket
+next to its port file, requests for that server's port go over the socket
+instead of loopback TCP.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import stat
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util.retry import Retry
+
+log = logging.getLogger("slp.client")
+
+# Socket file the server creates in ``settings.home_dir`` next to its port file.
+SOCKET_FILENAME = "server.sock"
+
+_LOCAL_HOSTS = {"127.0.0.1", "localhost", "::1", "0.0.0.0"}
+
+# Seconds allowed to establish a connection to the (local) API server.
+CONNECT_TIMEOUT = 3
+
+# Read timeouts in seconds, by endpoint profile.
+TIMEOUTS = {
+    "health": 5,
+    "list": 10,
+    "default": 30,
+    "upload": 120,
+    "stream": 300,
+    "model": 300,
+    "download": 600,
+    "bootstrap": 1800,
+}
+
+# Only retry requests that are safe to repeat; a POST may already have
+# started work on the server (document ingest, model load, …).
+_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    status=0,
+    backoff_factor=0.2,
+    allowed_methods=frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}),
+    raise_on_status=False,
+)
+
+
+def local_socket_path(host: str, port: int | None) -> str | None:
+    """Return the server's Unix socket path if *host* is local, *port* is the
+    port in the server's port file and the socket accepts connections, else
+    None (callers then fall back to TCP).
+
+    The socket belongs to the server that wrote the port file; another local
+    server (say ``benchmarks.mock_server`` on its own port) is reached over TCP.
+    """
+    if host not in _LOCAL_HOSTS or not hasattr(socket, "AF_UNIX"):
+        return None
+    from smartloop.server import read_port_file
+    if port is None or port != read_port_file():
+        return None
+    from commands.console import settings
+    path = Path(settings.home_dir) / SOCKET_FILENAME
+    try:
+        if not stat.S_ISSOCK(path.stat().st_mode):
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(0.5)
+            probe.connect(str(path))
+    except OSError:
+        return None
+    return str(path)
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """urllib3 connection that dials a Unix domain socket instead of host:port."""
+
+    def __init__(self, *args, socket_path: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class _UnixConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+    def __init__(self, socket_path: str, **kwargs) -> None:
+        super().__init__("localhost", **kwargs)
+        self.conn_kw["socket_path"] = socket_path
+
+
+class _UnixAdapter(HTTPAdapter):
+    """Transport adapter that sends every request through one Unix socket."""
+
+    def __init__(self, socket_path: str, pool_size: int, **kwargs) -> None:
+        self._pool = _UnixConnectionPool(socket_path, maxsize=pool_size, block=False)
+        super().__init__(**kwargs)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool
+
+    def get_connection(self, url, proxies=None):
+        return self._pool
+
+    def close(self) -> None:
+        self._pool.close()
+        super().close()
+
+
+class ApiClient:
+    """Thin wrapper around a pooled :class:`requests.Session` bound to one server."""
+
+    def __init__(self, base_url: str, pool_size: int = 8, socket_path: str | None = None) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.socket_path = socket_path
+        self.session = requests.Session()
+        if socket_path:
+            adapter = _UnixAdapter(socket_path, pool_size, max_retries=_RETRY)
+        else:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=_RETRY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        profile: str = "default",
+        timeout: float | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send *method* to *path*, using the read timeout of *profile* unless
+        an explicit *timeout* is given."""
+        read_timeout = timeout if timeout is not None else TIMEOUTS[profile]
+        if method != "GET":
+            from commands.leases import mark_activity
+            mark_activity()
+        start = time.perf_counter()
+        try:
+            return self.session.request(
+                method, self.url(path), timeout=(CONNECT_TIMEOUT, read_timeout), **kwargs
+            )
+        finally:
+            log.debug("%s %s (%s) %.1f ms", method, path, profile, (time.perf_counter() - start) * 1000)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_clients: dict[str, ApiClient] = {}
+
+
+def get_client(base_url: str) -> ApiClient:
+    """Return the shared :class:`ApiClient` for *base_url*, creating it on first use.
+
+    The client uses the server's Unix socket when *base_url* points at this
+    machine and the socket is live; otherwise it connects over TCP.
+    """
+    client = _clients.get(base_url)
+    if client is None:
+        url = urlparse(base_url)
+        socket_path = local_socket_path(url.hostname or "", url.port)
+        client = _clients[base_url] = ApiClient(base_url, socket_path=socket_path)
+    return client
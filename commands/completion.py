@@ -0,0 +1,121 @@
+"""One chat completion over ``/v1/chat/completions``, with client-side timings.
+
+Shared by the non-interactive commands (``ask``, ``batch``) so they send the
+same request shape as :func:`commands.helpers.stream_from_api` and measure
+it the same way.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+import requests
+from requests.exceptions import RequestException
+
+from commands.client import ApiClient
+from tui.events import SSEContent, SSEStatus, SSEUsage, iter_chat_events
+from tui.metrics import StreamTimings
+
+
+@dataclass
+class Completion:
+    """Result of one streamed completion."""
+    content: str = ""
+    timings: StreamTimings = field(default_factory=StreamTimings)
+
+    @property
+    def usage(self) -> SSEUsage | None:
+        return self.timings.usage
+
+    @property
+    def completion_tokens(self) -> int:
+        return self.timings.completion_tokens
+
+    def usage_dict(self) -> dict | None:
+        if self.usage is None:
+            return None
+        return {
+            "prompt_tokens": self.usage.prompt_tokens,
+            "completion_tokens": self.usage.completion_tokens,
+            "total_tokens": self.usage.total_tokens,
+            "max_context_tokens": self.usage.max_context_tokens,
+        }
+
+
+class InFlight:
+    """Completions being streamed by worker threads, so an interrupted run can abort them.
+
+    :meth:`abort` shuts down their sockets: a worker blocked on the stream
+    wakes up with a ``RequestException`` instead of reading it to the end,
+    and completions started afterwards fail straight away.
+    """
+
+    def __init__(self) -> None:
+        self.aborted = False
+        self._responses: set[requests.Response] = set()
+        self._lock = threading.Lock()
+
+    def add(self, resp: requests.Response) -> None:
+        with self._lock:
+            if not self.aborted:
+                self._responses.add(resp)
+                return
+        resp.close()
+        raise RequestException("Aborted")
+
+    def discard(self, resp: requests.Response) -> None:
+        with self._lock:
+            self._responses.discard(resp)
+
+    def abort(self) -> None:
+        with self._lock:
+            self.aborted = True
+            responses, self._responses = self._responses, set()
+        for resp in responses:
+            sock = getattr(getattr(resp.raw, "_connection", None), "sock", None)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
+def run_completion(
+    client: ApiClient,
+    payload: dict,
+    on_text: Callable[[str], None] | None = None,
+    in_flight: InFlight | None = None,
+) -> Completion:
+    """Send *payload* and consume the SSE reply; raises ``RequestException``
+    (also when the server reports an error status mid-stream).
+
+    *on_text* receives each content chunk as it arrives; without it the
+    chunks are collected into :attr:`Completion.content`.  The response is
+    registered with *in_flight*, if given, while it streams.
+    """
+    result = Completion()
+    timings = result.timings
+    parts: list[str] = []
+    with client.post("/v1/chat/completions", json=payload, stream=True, profile="stream") as resp:
+        if in_flight is not None:
+            in_flight.add(resp)
+        try:
+            resp.raise_for_status()
+            for event in iter_chat_events(resp.iter_content(chunk_size=None)):
+                timings.observe(event)
+                if isinstance(event, SSEStatus) and event.status == "error":
+                    raise RequestException(event.message or f"Server error during {event.step or 'completion'}")
+                if isinstance(event, SSEContent):
+                    if on_text is None:
+                        parts.append(event.text)
+                    else:
+                        on_text(event.text)
+        finally:
+            if in_flight is not None:
+                in_flight.discard(resp)
+    timings.finish()
+    result.content = "".join(parts)
+    return result
@@ -1,86 +1,420 @@
-"""DocumentCommand — ``add`` and ``delete`` document commands."""
+"""DocumentCommand — ``add``, ``sync`` and ``delete`` document commands."""
 
 from __future__ import annotations
 
-import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import requests
+from prettytable import PrettyTable
 from requests.exceptions import RequestException, HTTPError
+from tqdm import tqdm
 
 from smartloop.constants import SLP_PRIMARY
 
 from commands.base import Command
-from commands.console import console
+from commands.client import ApiClient, local_socket_path
+from commands.console import console, settings
+from tui.events import DocumentComplete, DocumentError, DocumentProgress, document_event
+from tui.ingest import IngestSummary, expand_sources, is_url
+from tui.manifest import FileState, Manifest, SyncPlan, plan_sync
+from tui.sse import iter_sse
+from tui.watch import DirectoryWatcher, RateLimiter
+
+
+def _stage_label(event: DocumentProgress, style: str = "") -> str:
+    label = f"{style}{event.stage.capitalize()}"
+    return f"{label}: {event.filename}" if event.filename else label
+
+
+def _error_detail(e: Exception) -> str:
+    """The server's ``detail`` for HTTP errors, else the exception text."""
+    response = getattr(e, "response", None)
+    if response is not None:
+        try:
+            return response.json().get("detail", str(e))
+        except ValueError:
+            pass
+    return str(e)
+
+
+def _unchanged(manifest: Manifest, path: str, live_ids: set[str] | None) -> bool:
+    """True if *path* matches its manifest entry and its documents are still on the server."""
+    entry = manifest.get(path)
+    if entry is None or not entry.doc_ids:
+        return False
+    if live_ids is not None and not set(entry.doc_ids) <= live_ids:
+        return False
+    try:
+        return manifest.stat_matches(path, FileState.stat(path))
+    except OSError:
+        return False
 
 
 class DocumentCommand(Command):
-    """Handles ``add`` and ``delete`` CLI commands."""
+    """Handles ``add``, ``sync`` and ``delete`` CLI commands."""
 
     args: object
 
     def execute(self) -> None:
-        """Route to add or delete based on the active command."""
+        """Route to add, sync or delete based on the active command."""
         if self.args.command == "add":
             self.add()
+        elif self.args.command == "sync":
+            self.sync()
         else:
             self.delete()
 
     def add(self) -> None:
-        """Add a document source."""
+        """Add document sources: files, directories, glob patterns or URLs."""
+        if self.args.watch:
+            self.watch()
+            return
+        sources, missing = expand_sources(
+            self.args.sources,
+            include=tuple(self.args.include or ()),
+            exclude=tuple(self.args.exclude or ()),
+            recursive=not self.args.no_recursive,
+        )
+        for arg in missing:
+            console.print(f"[red]No such file, directory or match: {arg}[/red]")
+        if not sources:
+            if not missing:
+                console.print("[yellow]No files matched[/yellow]")
+            return
         if not self._require_server():
             return
         project_id = self._resolve_project_id()
         if not project_id:
             console.print("[red]No current project. Create or switch to a project first.[/red]")
             return
+
+        # Files recorded in the manifest, unchanged on disk and still on the
+        # server are skipped before any upload.
+        manifest = Manifest.load(settings.home_dir, project_id)
+        live_ids = self._live_doc_ids(project_id)
+        pending = [s for s in sources if is_url(s) or not _unchanged(manifest, s, live_ids)]
+        if len(pending) < len(sources):
+            console.print(f"[dim]{len(sources) - len(pending)} file(s) unchanged since they were added[/dim]")
+        if not pending:
+            return
+        try:
+            if len(pending) == 1:
+                self._add_one(project_id, pending[0], manifest)
+            else:
+                self._add_many(project_id, pending, manifest)
+        finally:
+            manifest.save()
+
+    def _add_one(self, project_id: str, source: str, manifest: Manifest) -> None:
         try:
             with console.status("[bold cyan]Processing document...", spinner="dots") as status:
-                resp = requests.post(
-                    f"{self._base_url()}/v1/projects/{project_id}/documents",
-                    json={"source": self.args.file_path},
-                    timeout=300,
-                    stream=True,
+                documents, state = self._ingest(
+                    self.client, project_id, source,
+                    lambda event: status.update(_stage_label(event, "[bold cyan]")),
                 )
-                resp.raise_for_status()
-                documents = self._consume_sse(resp, status)
+            if documents and state is not None:
+                manifest.record(source, state, [doc["id"] for doc in documents])
             for doc in documents:
                 console.print(f"[{SLP_PRIMARY}]Added: {Path(doc['path']).name} (id={doc['id']})[/{SLP_PRIMARY}]")
             if not documents:
                 console.print("[yellow]No new documents added (may already exist)[/yellow]")
-        except requests.HTTPError as e:
-            detail = e.response.json().get("detail", str(e)) if e.response is not None else str(e)
-            console.print(f"[red]{detail}[/red]")
+        except HTTPError as e:
+            console.print(f"[red]{_error_detail(e)}[/red]")
         except RequestException as e:
             console.print(f"[red]API Error: {e}[/red]")
 
+    def _add_many(self, project_id: str, sources: list[str], manifest: Manifest) -> None:
+        """Submit *sources* ``--jobs`` at a time with one aggregated progress bar."""
+        jobs = max(1, self.args.jobs)
+        summary = IngestSummary(total=len(sources))
+        client = ApiClient(self._base_url(), pool_size=jobs, socket_path=local_socket_path(self.host, self.port))
+        bar = tqdm(total=len(sources), unit="file", dynamic_ncols=True, desc="add")
+
+        def progress(event: DocumentProgress) -> None:
+            bar.set_postfix_str(f"{summary.counts()} | {_stage_label(event)}", refresh=False)
+
+        pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="slp-add")
+        futures = {pool.submit(self._ingest, client, project_id, source, progress): source for source in sources}
+        interrupted = False
+        try:
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    documents, state = future.result()
+                    summary.record(source, documents)
+                    if documents and state is not None:
+                        manifest.record(source, state, [doc["id"] for doc in documents])
+                except (RequestException, OSError) as e:
+                    summary.record(source, None, _error_detail(e))
+                bar.update(1)
+                bar.set_postfix_str(summary.counts(), refresh=False)
+        except KeyboardInterrupt:
+            interrupted = True
+        finally:
+            pool.shutdown(wait=not interrupted, cancel_futures=True)
+            bar.close()
+            client.close()
+
+        table = PrettyTable()
+        table.field_names = ["Result", "Files"]
+        table.align["Result"] = "l"
+        table.align["Files"] = "r"
+        table.add_row(["Added", len(summary.added)])
+        table.add_row(["Skipped (already present)", len(summary.skipped)])
+        table.add_row(["Failed", len(summary.failed)])
+        if interrupted:
+            table.add_row(["Not submitted", summary.total - summary.done])
+        console.print(table)
+        for source, error in summary.failed:
+            console.print(f"[red]Failed: {source}: {error}[/red]")
+
+    @classmethod
+    def _ingest(cls, client: ApiClient, project_id: str, source: str, on_progress=None):
+        """:meth:`_submit` plus the file's manifest state, read before the upload."""
+        state = None if is_url(source) else FileState.read(source)
+        return cls._submit(client, project_id, source, on_progress), state
+
+    def _server_documents(self, project_id: str) -> dict[str, list[str]]:
+        """``path -> [document id]`` for the project's documents on the server."""
+        resp = self.client.get(f"/v1/projects/{project_id}/documents", profile="list")
+        resp.raise_for_status()
+        documents: dict[str, list[str]] = {}
+        for doc in resp.json().get("documents", []):
+            documents.setdefault(doc.get("path", ""), []).append(doc["id"])
+        return documents
+
+    def _live_doc_ids(self, project_id: str) -> set[str] | None:
+        """Ids of documents still on the server; None if the list is unavailable."""
+        try:
+            return {i for ids in self._server_documents(project_id).values() for i in ids}
+        except RequestException:
+            return None
+
     @staticmethod
-    def _consume_sse(resp: requests.Response, status) -> list[dict]:
-        """Parse an SSE stream from the document upload endpoint.
+    def _delete_docs(client: ApiClient, project_id: str, doc_ids: list[str]) -> None:
+        """DELETE each document; one that is already gone counts as deleted."""
+        for doc_id in doc_ids:
+            resp = client.delete(f"/v1/projects/{project_id}/documents/{doc_id}")
+            if resp.status_code != 404:
+                resp.raise_for_status()
 
-        Returns the list of documents from the final ``complete`` event.
+    @staticmethod
+    def _submit(client: ApiClient, project_id: str, source: str, on_progress=None) -> list[dict]:
+        """POST one source and follow its SSE stream; returns the added documents.
+
+        Raises ``RequestException`` on transport or HTTP errors and when the
+        server reports an ingestion error.
         """
-        event_type: str | None = None
         documents: list[dict] = []
-        for line in resp.iter_lines(decode_unicode=True):
-            if not line:
-                event_type = None
-                continue
-            if line.startswith("event:"):
-                event_type = line[len("event:"):].strip()
-            elif line.startswith("data:"):
-                payload = json.loads(line[len("data:"):].strip())
-                if event_type == "progress":
-                    stage = payload.get("stage", "processing")
-                    filename = payload.get("filename", "")
-                    label = f"[bold cyan]{stage.capitalize()}"
-                    if filename:
-                        label += f": {filename}"
-                    status.update(label)
-                elif event_type == "complete":
-                    documents = payload.get("documents", [])
+        with client.post(
+            f"/v1/projects/{project_id}/documents",
+            json={"source": source},
+            profile="stream",
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for sse in iter_sse(resp.iter_content(chunk_size=None)):
+                match document_event(sse):
+                    case DocumentProgress() as event if on_progress is not None:
+                        on_progress(event)
+                    case DocumentComplete(documents=docs):
+                        documents = docs
+                    case DocumentError(message=message):
+                        raise RequestException(message)
         return documents
 
+    def sync(self) -> None:
+        """Mirror a directory: upload new and modified files, delete removed ones."""
+        root = Path(self.args.directory).expanduser().resolve()
+        if not root.is_dir():
+            console.print(f"[red]Not a directory: {self.args.directory}[/red]")
+            return
+        files, _ = expand_sources(
+            [str(root)],
+            include=tuple(self.args.include or ()),
+            exclude=tuple(self.args.exclude or ()),
+            recursive=not self.args.no_recursive,
+        )
+        if not self._require_server():
+            return
+        project_id = self._resolve_project_id()
+        if not project_id:
+            console.print("[red]No current project. Create or switch to a project first.[/red]")
+            return
+        manifest = Manifest.load(settings.home_dir, project_id)
+        jobs = max(1, self.args.jobs)
+        try:
+            with console.status("[bold cyan]Comparing with the manifest...", spinner="dots"):
+                plan = self._plan_changes(
+                    project_id, manifest, files, [] if self.args.keep_deleted else manifest.under(root), jobs,
+                )
+        except RequestException as e:
+            console.print(f"[red]API Error: {e}[/red]")
+            return
+
+        console.print(
+            f"[dim]{len(plan.new)} new, {len(plan.modified)} modified, {len(plan.deleted)} deleted, "
+            f"{plan.unchanged} unchanged, {plan.adopted} already on the server[/dim]"
+        )
+        if self.args.dry_run:
+            for label, paths in (("new", plan.new), ("modified", plan.modified), ("deleted", plan.deleted)):
+                for path in paths:
+                    console.print(f"  {label:<9} {os.path.relpath(path, root)}")
+            return
+        try:
+            if plan.tasks:
+                counts, failures, interrupted = self._apply_sync(project_id, plan, manifest, jobs)
+                self._print_sync_summary(plan, counts, failures, interrupted)
+        finally:
+            manifest.save()
+
+    def watch(self) -> None:
+        """Sync directories, then keep uploading changes and deletions as they happen."""
+        roots = [Path(source).expanduser().resolve() for source in self.args.sources]
+        not_dirs = [str(root) for root in roots if not root.is_dir()]
+        if not_dirs:
+            console.print(f"[red]--watch needs directories: {', '.join(not_dirs)}[/red]")
+            return
+        if not self._require_server():
+            return
+        project_id = self._resolve_project_id()
+        if not project_id:
+            console.print("[red]No current project. Create or switch to a project first.[/red]")
+            return
+
+        include = tuple(self.args.include or ())
+        exclude = tuple(self.args.exclude or ())
+        recursive = not self.args.no_recursive
+        jobs = max(1, self.args.jobs)
+        limiter = RateLimiter(self.args.max_rate)
+        manifest = Manifest.load(settings.home_dir, project_id)
+        # Watch before the catch-up sync so nothing changed during it is missed.
+        watcher = DirectoryWatcher(
+            roots, include, exclude, recursive, debounce=self.args.debounce, force_poll=self.args.poll,
+        )
+
+        def full_sync() -> bool:
+            files, _ = expand_sources([str(root) for root in roots], include, exclude, recursive)
+            return self._sync_batch(project_id, manifest, files, [str(root) for root in roots], jobs, limiter)
+
+        try:
+            if not full_sync():
+                return
+            console.print(
+                f"[dim]Watching {', '.join(str(root) for root in roots)} ({watcher.backend}); "
+                f"press Ctrl+C to stop[/dim]"
+            )
+            while True:
+                batch = watcher.next_batch()
+                if batch.rescan:
+                    ok = full_sync()
+                else:
+                    ok = self._sync_batch(project_id, manifest, batch.changed, batch.removed, jobs, limiter)
+                if not ok:
+                    return
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+            manifest.save()
+            console.print("[dim]Stopped watching[/dim]")
+
+    def _sync_batch(self, project_id: str, manifest: Manifest, files: list[str], removed: list[str],
+                    jobs: int, limiter: RateLimiter) -> bool:
+        """Apply one watch batch and print a line about it; False once interrupted."""
+        try:
+            plan = self._plan_changes(project_id, manifest, files, removed, jobs)
+        except RequestException as e:
+            console.print(f"[red]API Error: {e}[/red]")
+            return True  # Server unreachable: try again with the next batch.
+        if not plan.tasks:
+            return True
+        counts, failures, interrupted = self._apply_sync(
+            project_id, plan, manifest, jobs, limiter=limiter, progress=False,
+        )
+        manifest.save()
+        console.print(
+            f"[dim]{time.strftime('%H:%M:%S')}[/dim] "
+            + ", ".join(f"{value} {key}" for key, value in counts.items())
+        )
+        for path, error in failures:
+            console.print(f"[red]Failed: {path}: {error}[/red]")
+        return not interrupted
+
+    def _plan_changes(self, project_id: str, manifest: Manifest, files: list[str],
+                      removed: list[str], jobs: int) -> SyncPlan:
+        """Compare *files* with the manifest and the server; see :func:`tui.manifest.plan_sync`."""
+        return plan_sync(files, removed, manifest, self._server_documents(project_id), jobs)
+
+    def _apply_sync(self, project_id: str, plan: SyncPlan, manifest: Manifest, jobs: int,
+                    limiter: RateLimiter | None = None, progress: bool = True):
+        """Run the plan's deletes and uploads; returns ``(counts, failures, interrupted)``."""
+        client = ApiClient(self._base_url(), pool_size=jobs, socket_path=local_socket_path(self.host, self.port))
+        counts = {"added": 0, "updated": 0, "deleted": 0, "failed": 0}
+        failures: list[tuple[str, str]] = []
+        bar = tqdm(total=len(plan.tasks), unit="file", dynamic_ncols=True, desc="sync", disable=not progress)
+
+        def run(kind: str, path: str, old_ids: list[str]):
+            if limiter is not None:
+                limiter.wait()
+            if old_ids:
+                self._delete_docs(client, project_id, old_ids)
+            if kind == "delete":
+                return [], None
+            return self._ingest(client, project_id, path)
+
+        pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="slp-sync")
+        futures = {
+            pool.submit(run, kind, path, manifest.get(path).doc_ids if kind != "add" else []): (kind, path)
+            for kind, path in plan.tasks
+        }
+        interrupted = False
+        try:
+            for future in as_completed(futures):
+                kind, path = futures[future]
+                try:
+                    documents, state = future.result()
+                except (RequestException, OSError) as e:
+                    counts["failed"] += 1
+                    failures.append((path, _error_detail(e)))
+                    if kind != "add":
+                        # Old documents may already be gone; the next sync re-adds the file.
+                        manifest.forget(path)
+                else:
+                    manifest.forget(path)
+                    if documents:
+                        manifest.record(path, state, [doc["id"] for doc in documents])
+                    counts[{"add": "added", "modify": "updated", "delete": "deleted"}[kind]] += 1
+                bar.update(1)
+                bar.set_postfix_str(", ".join(f"{v} {k}" for k, v in counts.items()), refresh=False)
+        except KeyboardInterrupt:
+            interrupted = True
+        finally:
+            pool.shutdown(wait=not interrupted, cancel_futures=True)
+            bar.close()
+            client.close()
+        return counts, failures, interrupted
+
+    @staticmethod
+    def _print_sync_summary(plan: SyncPlan, counts: dict[str, int],
+                            failures: list[tuple[str, str]], interrupted: bool) -> None:
+        table = PrettyTable()
+        table.field_names = ["Result", "Files"]
+        table.align["Result"] = "l"
+        table.align["Files"] = "r"
+        table.add_row(["Added", counts["added"]])
+        table.add_row(["Updated", counts["updated"]])
+        table.add_row(["Deleted", counts["deleted"]])
+        table.add_row(["Unchanged", plan.unchanged + plan.adopted])
+        table.add_row(["Failed", counts["failed"]])
+        if interrupted:
+            table.add_row(["Not processed", len(plan.tasks) - sum(counts.values())])
+        console.print(table)
+        for path, error in failures:
+            console.print(f"[red]Failed: {path}: {error}[/red]")
+
     def delete(self) -> None:
         """Delete a document by ID."""
         if not self._require_server():
@@ -90,12 +424,17 @@ class DocumentCommand(Command):
             console.print("[red]No current project. Create or switch to a project first.[/red]")
             return
         try:
-            resp = requests.delete(
-                f"{self._base_url()}/v1/projects/{project_id}/documents/{self.args.document_id}",
-                timeout=30,
+            resp = self.client.delete(
+                f"/v1/projects/{project_id}/documents/{self.args.document_id}",
             )
             resp.raise_for_status()
             console.print(f"[{SLP_PRIMARY}]{resp.json().get('message', 'Document deleted')}[/{SLP_PRIMARY}]")
+            manifest = Manifest.load(settings.home_dir, project_id)
+            stale = [p for p, e in manifest.entries.items() if self.args.document_id in e.doc_ids]
+            for path in stale:
+                manifest.forget(path)
+            if stale:
+                manifest.save()
         except HTTPError as e:
             if e.response is not None and e.response.status_code == 404:
                 console.print(f"[red]Document not found: {self.args.document_id}[/red]")
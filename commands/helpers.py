@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
-import json
-import time
 import uuid
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
-import requests
 from prompt_toolkit import prompt
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
@@ -20,7 +17,13 @@ from smartloop.constants import SLP_PRIMARY
 from smartloop.server import is_server_running
 from smartloop.utils.log_utils import print_logo
 
+from commands.client import get_client
 from commands.console import console
+from commands.output import StreamWriter
+from commands.upload import upload_asset
+from tui.events import SSEContent, SSEStatus, iter_chat_events
+from tui.metrics import StreamTimings
+from tui.uploads import progress_label
 
 # Key bindings shared by interactive input helpers
 kb = KeyBindings()
@@ -76,11 +79,13 @@ def upload_asset_cli(filepath: str, host: str, port: int) -> str | None:
     if not path.is_file():
         console.print(f"[red]File not found: {filepath}[/red]")
         return None
-    url = f"{get_server_url(host, port)}/v1/assets"
+    client = get_client(get_server_url(host, port))
     try:
-        with console.status(f"[bold cyan]Uploading {path.name}...[/bold cyan]", spinner="dots"):
-            with path.open("rb") as fh:
-                resp = requests.post(url, files={"file": (path.name, fh)}, timeout=120)
+        with console.status(f"[bold cyan]Uploading {path.name}...[/bold cyan]", spinner="dots") as status:
+            resp = upload_asset(
+                client, path,
+                lambda done, total: status.update(f"[bold cyan]{progress_label(path.name, done, total)}[/bold cyan]"),
+            )
         if resp.status_code in (400, 422):
             detail = resp.json().get("detail", str(resp.text))
             console.print(f"[red]Upload rejected: {detail}[/red]")
@@ -94,21 +99,18 @@ def upload_asset_cli(filepath: str, host: str, port: int) -> str | None:
             f"[dim](id={asset_id}, markdown={'yes' if markdown else 'no'})[/dim]"
         )
         return asset_id
-    except RequestException as e:
+    except (RequestException, ValueError) as e:
         console.print(f"[red]Upload error: {e}[/red]")
         return None
 
 
-def stream_from_api(
+def build_chat_payload(
     user_input: str,
     model_name: str,
-    host: str,
-    port: int,
     session_id: str = None,
     attachment_ids: list[str] | None = None,
-) -> None:
-    """Stream a chat completion response from the API server."""
-    url = f"{get_server_url(host, port)}/v1/chat/completions"
+) -> dict:
+    """Request body for a streaming ``/v1/chat/completions`` call."""
     payload = dict(
         model=model_name,
         messages=[{
@@ -120,38 +122,43 @@ def stream_from_api(
     )
     if session_id:
         payload["session_id"] = session_id
+    return payload
+
+
+def stream_from_api(
+    user_input: str,
+    model_name: str,
+    host: str,
+    port: int,
+    session_id: str = None,
+    attachment_ids: list[str] | None = None,
+) -> None:
+    """Stream a chat completion response from the API server."""
+    client = get_client(get_server_url(host, port))
+    payload = build_chat_payload(user_input, model_name, session_id, attachment_ids)
 
-    token_count = 0
-    start_time = time.time()
+    timings = StreamTimings()
 
     try:
-        with requests.post(url, json=payload, stream=True, timeout=300) as response:
+        with client.post("/v1/chat/completions", json=payload, stream=True, profile="stream") as response:
             response.raise_for_status()
             status_live = None
-            for line in response.iter_lines():
-                if line:
-                    line_str = line.decode("utf-8")
-                    if not line_str.startswith("data: "):
-                        continue
-                    data = line_str[6:]
-                    if data == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data)
-                    except json.JSONDecodeError:
-                        continue
-
-                    if chunk.get("object") == "chat.status":
-                        if chunk.get("status") == "processing":
-                            msg = chunk.get("message", "Processing...")
+            out = StreamWriter()
+            try:
+                for event in iter_chat_events(response.iter_content(chunk_size=None)):
+                    timings.observe(event)
+                    if isinstance(event, SSEStatus):
+                        if event.status == "processing":
+                            msg = event.message or "Processing..."
                             if status_live is None:
+                                out.flush()
                                 status_live = console.status(
                                     f"[bold cyan]{msg}[/bold cyan]", spinner="dots"
                                 )
                                 status_live.start()
                             else:
                                 status_live.update(f"[bold cyan]{msg}[/bold cyan]")
-                        elif chunk.get("status") in ("completed", "error"):
+                        elif event.status in ("completed", "error"):
                             if status_live is not None:
                                 status_live.stop()
                                 status_live = None
@@ -162,20 +169,18 @@ def stream_from_api(
                         status_live = None
                         console.print()
 
-                    if chunk.get("choices") and chunk["choices"][0].get("delta"):
-                        content = chunk["choices"][0]["delta"].get("content", "")
-                        if content:
-                            token_count += 1
-                            console.print(content, end="")
-
-            if status_live is not None:
-                status_live.stop()
+                    if isinstance(event, SSEContent):
+                        out.write(event.text)
+            finally:
+                # Flush what arrived and stop the spinner, even if the stream broke.
+                out.close()
+                if status_live is not None:
+                    status_live.stop()
 
-            duration = time.time() - start_time
-            tokens_per_sec = token_count / duration if duration > 0 else 0
+            timings.finish()
             console.print("\n")
             console.print("[dim]" + "-" * 50 + "[/dim]")
-            console.print(f"[dim]{tokens_per_sec:.1f} tok/s[/dim]")
+            console.print(f"[dim]{timings.summary()}[/dim]")
             console.print("")
 
     except RequestException as e:
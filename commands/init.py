@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import json
-
 import requests
 from requests.exceptions import RequestException
 from tqdm import tqdm
@@ -12,6 +10,7 @@ from smartloop.constants import SLP_PRIMARY
 
 from commands.base import Command
 from commands.console import console
+from tui.sse import iter_sse
 
 
 class InitCommand(Command):
@@ -32,7 +31,7 @@ class InitCommand(Command):
 
         if self._is_ready():
             try:
-                health = requests.get(f"{self._base_url()}/health", timeout=5).json()
+                health = self.client.get("/health", profile="health").json()
                 model_name = health.get("model_name", "unknown")
             except RequestException:
                 model_name = "unknown"
@@ -58,11 +57,11 @@ class InitCommand(Command):
         if self.developer_token:
             payload["developer_token"] = self.developer_token
         try:
-            with requests.post(
-                f"{self._base_url()}/v1/init",
+            with self.client.post(
+                "/v1/init",
                 json=payload,
                 stream=True,
-                timeout=600,
+                profile="download",
             ) as resp:
                 self._consume_sse_stream(resp)
         except RequestException as e:
@@ -71,10 +70,10 @@ class InitCommand(Command):
     def _bootstrap(self) -> None:
         """Unauthenticated bootstrap — download model + create default project."""
         try:
-            with requests.post(
-                f"{self._base_url()}/v1/bootstrap",
+            with self.client.post(
+                "/v1/bootstrap",
                 stream=True,
-                timeout=1800,
+                profile="bootstrap",
             ) as resp:
                 self._consume_sse_stream(resp)
         except RequestException as e:
@@ -91,15 +90,10 @@ class InitCommand(Command):
             return
 
         progress_bar = None
-        for raw in resp.iter_lines():
-            if not raw:
-                continue
-            line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
-            if not line.startswith("data:"):
-                continue
+        for sse in iter_sse(resp.iter_content(chunk_size=None)):
             try:
-                data = json.loads(line[5:].strip())
-            except json.JSONDecodeError:
+                data = sse.json()
+            except ValueError:
                 continue
 
             status = data.get("status", "")
@@ -0,0 +1,205 @@
+"""Client leases — keep the model resident while any slp session is attached.
+
+Every interactive session holds a lease file in ``settings.home_dir/clients``
+for as long as it runs, instead of unloading the model on exit.  An
+:class:`IdleUnloader` process, started next to the server, unloads the model
+only once no live lease remains and the configured idle period has elapsed, so
+back-to-back sessions reach their first token without a reload.
+
+The idle clock only sees slp clients: leases, plus state-changing CLI
+requests.  Requests from other OpenAI-compatible clients talking to the
+server directly do not keep the model loaded; raise ``--idle-unload`` (or
+set it to ``0``) when the server is used that way.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+CLIENTS_DIRNAME = "clients"
+IDLE_UNLOAD_ENV = "SLP_IDLE_UNLOAD_MINUTES"
+DEFAULT_IDLE_UNLOAD_MINUTES = 15.0
+UNLOADER_PID_FILENAME = "idle-unload.pid"
+# How long a freshly spawned unloader waits for the server to listen (seconds).
+_STARTUP_TIMEOUT = 120
+
+
+def _clients_dir() -> Path:
+    from commands.console import settings
+    path = Path(settings.home_dir) / CLIENTS_DIRNAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def idle_unload_minutes(value: float | None = None) -> float:
+    """Resolve the idle-unload period: explicit value, then $SLP_IDLE_UNLOAD_MINUTES, then 15."""
+    if value is not None:
+        return value
+    try:
+        return float(os.environ.get(IDLE_UNLOAD_ENV, DEFAULT_IDLE_UNLOAD_MINUTES))
+    except ValueError:
+        return DEFAULT_IDLE_UNLOAD_MINUTES
+
+
+def attach(kind: str) -> Path:
+    """Register this process as an attached client and return its lease file."""
+    lease = _clients_dir() / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.lease"
+    lease.write_text(json.dumps({"pid": os.getpid(), "kind": kind, "started": time.time()}))
+    return lease
+
+
+def detach(lease: Path) -> None:
+    """Release a lease; the idle clock starts when the last one is gone."""
+    lease.unlink(missing_ok=True)
+
+
+def mark_activity() -> None:
+    """Restart the idle clock (called for every state-changing API request)."""
+    try:
+        os.utime(_clients_dir())
+    except OSError:
+        pass
+
+
+@contextmanager
+def attached(kind: str):
+    """Hold a client lease for the duration of the ``with`` block."""
+    lease = attach(kind)
+    try:
+        yield lease
+    finally:
+        detach(lease)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def active_leases() -> list[dict]:
+    """Return live leases, removing any left behind by crashed clients."""
+    leases = []
+    for path in _clients_dir().glob("*.lease"):
+        try:
+            info = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        if _pid_alive(int(info.get("pid", 0))):
+            leases.append(info)
+        else:
+            path.unlink(missing_ok=True)
+    return leases
+
+
+def idle_seconds() -> float | None:
+    """Seconds since the last client detached, or None while any is attached."""
+    if active_leases():
+        return None
+    # Adding or removing a lease updates the directory mtime.
+    return max(0.0, time.time() - _clients_dir().stat().st_mtime)
+
+
+class IdleUnloader:
+    """Unloads the model after *minutes* without clients.
+
+    ``slp server start`` hands off to a background server and returns, so the
+    unloader runs in its own detached process (``slp server idle-unload``,
+    see :meth:`spawn`).  It waits for the server to listen and exits once the
+    server stops answering.  A period of ``0`` disables idle unloading (the
+    model stays resident).
+    """
+
+    def __init__(self, host: str, port: int, minutes: float) -> None:
+        self.host = host
+        self.port = port
+        self.limit = minutes * 60
+        self.interval = min(60.0, max(5.0, self.limit / 4))
+
+    def _idle(self) -> bool:
+        idle = idle_seconds()
+        return idle is not None and idle >= self.limit
+
+    def _server_port(self) -> int | None:
+        """Port the server currently answers on, or None when it is down."""
+        from smartloop.server import is_server_running, read_port_file
+
+        port = read_port_file() or self.port
+        return port if port and is_server_running(self.host, port) else None
+
+    def run(self) -> None:
+        from commands.client import get_client
+
+        deadline = time.monotonic() + _STARTUP_TIMEOUT
+        while self._server_port() is None:
+            if time.monotonic() > deadline:
+                return
+            time.sleep(1)
+
+        while True:
+            time.sleep(self.interval)
+            port = self._server_port()
+            if port is None:
+                return
+            if not self._idle():
+                continue
+            client = get_client(f"http://{self.host}:{port}")
+            try:
+                if not client.get("/health", profile="health").json().get("model_loaded"):
+                    continue
+                # A session may have attached while /health was in flight.
+                if self._idle():
+                    client.post("/v1/models/unload")
+            except Exception:
+                continue
+
+    def serve(self) -> None:
+        """Run in this process, replacing any unloader left by a previous start."""
+        from commands.console import settings
+
+        pid_file = Path(settings.home_dir) / UNLOADER_PID_FILENAME
+        try:
+            old = int(pid_file.read_text())
+            if old != os.getpid() and _pid_alive(old):
+                os.kill(old, signal.SIGTERM)
+        except (OSError, ValueError):
+            pass
+        pid_file.write_text(str(os.getpid()))
+        # Exit through the finally below when the next start replaces us.
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            self.run()
+        finally:
+            try:
+                if int(pid_file.read_text()) == os.getpid():
+                    pid_file.unlink()
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def spawn(host: str, port: int, minutes: float) -> None:
+        """Start ``slp server idle-unload`` detached from this process."""
+        if minutes <= 0:
+            return
+        from commands.console import settings
+
+        if getattr(sys, "frozen", False):
+            cmd = [sys.executable]
+        else:
+            cmd = [sys.executable, sys.argv[0]]
+        cmd += ["server", "idle-unload", "--host", host, "--port", str(port), "--idle-unload", str(minutes)]
+        kwargs = {"creationflags": subprocess.DETACHED_PROCESS} if os.name == "nt" else {"start_new_session": True}
+        with open(Path(settings.home_dir) / "server.log", "a") as lf:
+            subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=lf, stderr=lf, **kwargs)
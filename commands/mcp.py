@@ -5,7 +5,6 @@ from __future__ import annotations
 import webbrowser
 from urllib.parse import urlparse
 
-import requests
 from prettytable import PrettyTable
 from requests.exceptions import RequestException
 
@@ -47,8 +46,8 @@ class McpCommand(Command):
 
         with console.status("[bold cyan]Connecting to MCP server...[/bold cyan]", spinner="dots"):
             try:
-                resp = requests.post(
-                    f"{self._base_url()}/v1/projects/{project_id}/mcp/register",
+                resp = self.client.post(
+                    f"/v1/projects/{project_id}/mcp/register",
                     json=payload,
                     timeout=60,
                 )
@@ -85,7 +84,7 @@ class McpCommand(Command):
             console.print("[red]No current project. Create or switch to a project first.[/red]")
             return
         try:
-            resp = requests.get(f"{self._base_url()}/v1/projects/{project_id}/mcp", timeout=10)
+            resp = self.client.get(f"/v1/projects/{project_id}/mcp", profile="list")
             resp.raise_for_status()
             servers = resp.json().get("servers", [])
             if not servers:
@@ -118,7 +117,7 @@ class McpCommand(Command):
             return
         target_id = self.args.id
         try:
-            resp = requests.get(f"{self._base_url()}/v1/projects/{project_id}/mcp", timeout=10)
+            resp = self.client.get(f"/v1/projects/{project_id}/mcp", profile="list")
             resp.raise_for_status()
             servers = resp.json().get("servers", [])
             found = next(
@@ -127,7 +126,7 @@ class McpCommand(Command):
             if not found:
                 console.print(f"[red]MCP server not found: {target_id}[/red]")
                 return
-            del_resp = requests.delete(f"{self._base_url()}/v1/projects/{project_id}/mcp/{found['id']}", timeout=10)
+            del_resp = self.client.delete(f"/v1/projects/{project_id}/mcp/{found['id']}", profile="list")
             del_resp.raise_for_status()
             console.print(f"[{SLP_PRIMARY}]Removed MCP server: {found['name']} ({found['id'][:8]})[/{SLP_PRIMARY}]")
         except RequestException as e:
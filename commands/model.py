@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import requests
 from prettytable import PrettyTable
 from requests.exceptions import RequestException
 
@@ -37,8 +36,10 @@ class ModelCommand(Command):
         table.align["Value"] = "l"
 
         try:
-            health = requests.get(f"{self._base_url()}/health", timeout=5).json()
+            health = self.client.get("/health", profile="health").json()
             table.add_row(["Server", f"http://{self.host}:{self.port}"])
+            if self.client.socket_path:
+                table.add_row(["Socket", self.client.socket_path])
             pid = read_pid_file()
             if pid:
                 table.add_row(["PID", pid])
@@ -74,7 +75,7 @@ class ModelCommand(Command):
             pass
 
         try:
-            data = requests.get(f"{self._base_url()}/v1/projects", timeout=10).json()
+            data = self.client.get("/v1/projects", profile="list").json()
             current = next((p for p in data.get("projects", []) if p.get("current")), None)
             if current:
                 table.add_row(["Active project", f"{current.get('name')} (id={current.get('id')})"])
@@ -0,0 +1,100 @@
+"""StreamWriter — output sink for streamed model tokens in the CLI.
+
+Printing each token with ``console.print`` runs Rich markup parsing,
+highlighting and a terminal flush per token.  Tokens are plain text, so the
+writer bypasses Rich entirely:
+
+* on a terminal it buffers and flushes on newline, or once the buffered text
+  is a few milliseconds old, so output still appears live;
+* when stdout is not a TTY it writes UTF-8 bytes straight to the underlying
+  binary stream and lets its buffer decide when to flush.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import IO
+
+# Longest time (seconds) a partial line may sit in the buffer on a terminal.
+FLUSH_INTERVAL = 0.008
+
+
+class StreamWriter:
+    """Write streamed text to *file* (default: the shared console's file)."""
+
+    def __init__(self, file: IO[str] | None = None, interval: float = FLUSH_INTERVAL) -> None:
+        if file is None:
+            from commands.console import console
+            file = console.file
+        self.file = file
+        self.interval = interval
+        try:
+            self.interactive = file.isatty()
+        except (AttributeError, ValueError):
+            self.interactive = False
+        self._raw = None if self.interactive else getattr(file, "buffer", None)
+        self._parts: list[str] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+        # Anything printed through the text layer must come out first.
+        file.flush()
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if self._raw is not None:
+            self._raw.write(text.encode("utf-8", "replace"))
+            return
+        if not self.interactive:
+            self.file.write(text)
+            return
+        with self._lock:
+            self._parts.append(text)
+            if "\n" in text:
+                self._flush_locked()
+                return
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._run, name="slp-stream-flush", daemon=True)
+            self._flusher.start()
+        self._wake.set()
+
+    def flush(self) -> None:
+        """Write out everything buffered so far (e.g. before showing a spinner)."""
+        if self.interactive:
+            with self._lock:
+                self._flush_locked()
+        elif self._raw is not None:
+            self._raw.flush()
+        else:
+            self.file.flush()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def __enter__(self) -> "StreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _flush_locked(self) -> None:
+        if self._parts:
+            self.file.write("".join(self._parts))
+            self._parts.clear()
+            self.file.flush()
+
+    def _run(self) -> None:
+        # Flush a partial line once it has waited ``interval``; sleep while idle.
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            time.sleep(self.interval)
+            with self._lock:
+                self._flush_locked()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import requests
 from prettytable import PrettyTable
 from requests.exceptions import RequestException, HTTPError
 
@@ -47,7 +46,7 @@ class ProjectsCommand(Command):
                 else "[bold cyan]Creating project...[/bold cyan]"
             )
             with console.status(status_msg, spinner="dots"):
-                resp = requests.post(f"{self._base_url()}/v1/projects", json=payload, timeout=600)
+                resp = self.client.post("/v1/projects", json=payload, profile="download")
                 resp.raise_for_status()
             data = resp.json()
             model_info = f", model={data['model_name']}" if data.get("model_name") else ""
@@ -59,7 +58,7 @@ class ProjectsCommand(Command):
 
     def projects_list(self) -> None:
         try:
-            resp = requests.get(f"{self._base_url()}/v1/projects", timeout=30)
+            resp = self.client.get("/v1/projects")
             resp.raise_for_status()
             data = resp.json()
             table = PrettyTable()
@@ -79,17 +78,16 @@ class ProjectsCommand(Command):
 
     def projects_update(self) -> None:
         try:
-            resp = requests.get(f"{self._base_url()}/v1/projects", timeout=30)
+            resp = self.client.get("/v1/projects")
             resp.raise_for_status()
             projects_data = resp.json().get("projects", [])
             target = next((p for p in projects_data if p.get("name") == self.args.name), None)
             if target is None:
                 console.print(f"[red]Project not found: {self.args.name}[/red]")
                 return
-            resp = requests.patch(
-                f"{self._base_url()}/v1/projects/{target['id']}",
+            resp = self.client.patch(
+                f"/v1/projects/{target['id']}",
                 json={"model_name": self.args.model},
-                timeout=30,
             )
             resp.raise_for_status()
             data = resp.json()
@@ -109,17 +107,17 @@ class ProjectsCommand(Command):
 
     def projects_switch(self) -> None:
         try:
-            resp = requests.get(f"{self._base_url()}/v1/projects", timeout=30)
+            resp = self.client.get("/v1/projects")
             resp.raise_for_status()
             projects_data = resp.json().get("projects", [])
             target = next((p for p in projects_data if p.get("name") == self.args.name), None)
             if target is None:
                 console.print(f"[red]Project not found: {self.args.name}[/red]")
             else:
-                resp = requests.post(
-                    f"{self._base_url()}/v1/models/load",
+                resp = self.client.post(
+                    "/v1/models/load",
                     json={"mode": "inference", "project_id": target["id"]},
-                    timeout=300,
+                    profile="model",
                 )
                 resp.raise_for_status()
                 console.print(f"[{SLP_PRIMARY}]Switched to project: {target['name']} (id={target['id']})[/{SLP_PRIMARY}]")
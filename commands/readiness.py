@@ -0,0 +1,172 @@
+"""Server readiness handshake between ``_require_server`` and ``slp server start``.
+
+The parent opens a pipe and hands the write end to the spawned server process
+through ``SLP_READY_FD``.  The server side reports each startup stage as one
+``"<stage> [detail]\\n"`` line the moment it is reached, so the parent can
+block on the pipe and wake up immediately instead of sleeping and re-polling.
+
+On Windows (no ``select`` on pipes, no ``pass_fds``) ``_require_server`` keeps
+polling the port instead and the server side never sees ``SLP_READY_FD``.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import threading
+import time
+from typing import Callable
+
+READY_FD_ENV = "SLP_READY_FD"
+
+LISTENING = "listening"
+MODEL_LOADING = "model_loading"
+MODEL_READY = "model_ready"
+FAILED = "failed"
+
+STAGE_MESSAGES = {
+    LISTENING: "Server is accepting connections",
+    MODEL_LOADING: "Waiting for the model to load...",
+    MODEL_READY: "Model ready",
+    FAILED: "Server failed to start",
+}
+
+# Server-side probe cadence and limits (seconds).
+_LISTEN_POLL = 0.05
+_LISTEN_TIMEOUT = 60
+_MODEL_POLL = 0.5
+_MODEL_TIMEOUT = 120
+
+
+def wait_for_stage(
+    read_fd: int,
+    timeout: float,
+    until: str = LISTENING,
+    on_stage: Callable[[str, str], None] | None = None,
+) -> tuple[str, str] | None:
+    """Block on *read_fd* until the server reports *until* (or fails).
+
+    Returns ``(stage, detail)`` for the terminating stage, or None when the
+    pipe closes or *timeout* elapses first.
+    """
+    deadline = time.monotonic() + timeout
+    buf = b""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        ready, _, _ = select.select([read_fd], [], [], remaining)
+        if not ready:
+            return None
+        chunk = os.read(read_fd, 4096)
+        if not chunk:
+            return None
+        buf += chunk
+        while b"\n" in buf:
+            line, buf = buf.split(b"\n", 1)
+            stage, _, detail = line.decode("utf-8", "replace").partition(" ")
+            if on_stage:
+                on_stage(stage, detail)
+            if stage in (until, FAILED):
+                return stage, detail
+
+
+class ReadinessNotifier:
+    """Server-side writer for the readiness pipe (one per ``server start``)."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd: int | None = fd
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_env(cls) -> "ReadinessNotifier | None":
+        """Adopt the pipe passed by the parent, if any.
+
+        The variable is removed and the fd made non-inheritable so processes
+        the server spawns do not keep the pipe open.
+        """
+        raw = os.environ.pop(READY_FD_ENV, None)
+        if not raw:
+            return None
+        try:
+            fd = int(raw)
+            os.set_inheritable(fd, False)
+        except (ValueError, OSError):
+            return None
+        return cls(fd)
+
+    def notify(self, stage: str, detail: str = "") -> bool:
+        """Write one stage line; returns False once the parent has gone away."""
+        with self._lock:
+            if self._fd is None:
+                return False
+            try:
+                os.write(self._fd, f"{stage} {detail}".rstrip().encode() + b"\n")
+                return True
+            except OSError:
+                self._close_locked()
+                return False
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def watch(self, host: str, port: int) -> None:
+        """Report stages from a background thread while the server starts."""
+        self._thread = threading.Thread(
+            target=self._watch, args=(host, port), name="slp-readiness", daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: float) -> None:
+        """Give the watcher a chance to report before this process exits."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.close()
+
+    def _watch(self, host: str, port: int) -> None:
+        from smartloop.server import is_server_running, read_port_file
+        from commands.client import get_client
+
+        deadline = time.monotonic() + _LISTEN_TIMEOUT
+        while True:
+            if self._fd is None:
+                return
+            check_port = read_port_file() or port
+            if check_port and is_server_running(host, check_port):
+                break
+            if time.monotonic() > deadline:
+                self.notify(FAILED, "timed out waiting for the server to listen")
+                self.close()
+                return
+            time.sleep(_LISTEN_POLL)
+
+        if not self.notify(LISTENING, str(check_port)):
+            return
+
+        client = get_client(f"http://{host}:{check_port}")
+        deadline = time.monotonic() + _MODEL_TIMEOUT
+        loading_reported = False
+        while time.monotonic() < deadline:
+            try:
+                loaded = client.get("/health", profile="health").json().get("model_loaded")
+            except Exception:
+                break
+            if loaded:
+                self.notify(MODEL_READY)
+                break
+            if not loading_reported:
+                if not self.notify(MODEL_LOADING):
+                    return
+                loading_reported = True
+            time.sleep(_MODEL_POLL)
+        self.close()
@@ -0,0 +1,305 @@
+"""Lightweight command registry — argparse metadata and lazy command loading.
+
+Sub-commands are declared here as plain data so ``slp --help`` and
+``slp --version`` can build the parser without importing any command
+module.  The command class (and its heavy imports: requests, prompt_toolkit,
+prettytable, the smartloop framework …) is only imported by
+:func:`load_command` once ``dispatch()`` has selected it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Arg:
+    """A single ``add_argument`` call."""
+    flags: tuple[str, ...]
+    options: dict = field(default_factory=dict)
+
+
+def arg(*flags: str, **options) -> Arg:
+    return Arg(flags, options)
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """Parser metadata for one (sub-)command.
+
+    ``target`` is a ``"module:Class"`` path resolved lazily by
+    :func:`load_command`; nested ``subcommands`` are registered under
+    ``dest`` (e.g. ``server_command``).
+    """
+    name: str
+    help: str
+    target: str | None = None
+    args: tuple[Arg, ...] = ()
+    dest: str | None = None
+    group_help: str | None = None
+    subcommands: tuple["CommandSpec", ...] = ()
+
+
+_MODEL_HELP = "Model name to use (default: $SLP_BASE_MODEL_NAME or gemma3_it_text)"
+_TOKEN_HELP = "Smartloop developer token to download model (falls back to SLP_DEVELOPER_TOKEN in .env)"
+_DEBUG_HELP = "Enable debug mode (load base model + LoRA adapters)"
+_IDLE_HELP = ("Unload the model after this many minutes with no attached slp clients; requests from "
+              "other clients do not count (default: $SLP_IDLE_UNLOAD_MINUTES or 15; 0 keeps it resident)")
+
+COMMANDS: tuple[CommandSpec, ...] = (
+    CommandSpec(
+        "init", "Initialize a model", "commands.init:InitCommand",
+        args=(
+            arg("--model", "-m", nargs="?", help=_MODEL_HELP, default=None),
+            arg("--developer-token", "-t", help=_TOKEN_HELP),
+        ),
+    ),
+    CommandSpec(
+        "add", "Add a new source", "commands.document:DocumentCommand",
+        args=(
+            arg("sources", nargs="+", metavar="SOURCE",
+                help="Files, directories (added recursively), glob patterns or URLs"),
+            arg("--include", "-i", action="append", metavar="PATTERN",
+                help="Only add files whose name or relative path matches PATTERN (repeatable)"),
+            arg("--exclude", "-x", action="append", metavar="PATTERN",
+                help="Skip files whose name or relative path matches PATTERN (repeatable)"),
+            arg("--jobs", "-j", type=int, default=4, help="Sources processed in parallel (default: 4)"),
+            arg("--no-recursive", action="store_true", help="Do not descend into subdirectories"),
+            arg("--watch", "-w", action="store_true",
+                help="Keep running: upload changed files and delete removed ones as they happen"),
+            arg("--debounce", type=float, default=1.0, metavar="SECONDS",
+                help="With --watch, wait for this much quiet before submitting a batch (default: 1.0)"),
+            arg("--max-rate", type=float, default=5.0, metavar="N",
+                help="With --watch, submit at most N documents per second (default: 5)"),
+            arg("--poll", action="store_true",
+                help="With --watch, poll for changes instead of using inotify (e.g. network filesystems)"),
+        ),
+    ),
+    CommandSpec(
+        "sync", "Upload new and changed files in a directory and delete removed ones",
+        "commands.document:DocumentCommand",
+        args=(
+            arg("directory", help="Directory to mirror into the current project"),
+            arg("--include", "-i", action="append", metavar="PATTERN",
+                help="Only sync files whose name or relative path matches PATTERN (repeatable)"),
+            arg("--exclude", "-x", action="append", metavar="PATTERN",
+                help="Skip files whose name or relative path matches PATTERN (repeatable)"),
+            arg("--jobs", "-j", type=int, default=4, help="Files processed in parallel (default: 4)"),
+            arg("--no-recursive", action="store_true", help="Do not descend into subdirectories"),
+            arg("--dry-run", action="store_true", help="Show what would change without uploading"),
+            arg("--keep-deleted", action="store_true",
+                help="Keep documents whose local file was removed"),
+        ),
+    ),
+    CommandSpec(
+        "rules", "Add a rule to the current project", "commands.rule:RuleCommand",
+        args=(arg("--file", "-f", help="Read rule from a file"),),
+    ),
+    CommandSpec(
+        "delete", "Delete a document by ID", "commands.document:DocumentCommand",
+        args=(arg("document_id", metavar="document-id", help="Document ID to delete"),),
+    ),
+    CommandSpec("status", "Show project status", "commands.model:ModelCommand"),
+    CommandSpec(
+        "run", "Run interactive chat with the model", "commands.run:RunCommand",
+        args=(
+            arg("--model", "-m", help="Model name (default: $SLP_BASE_MODEL_NAME or gemma3_it_text)"),
+            arg("--project-name", help="Project name (default: $SLP_PROJECT_NAME)"),
+            arg("--host", help="API server host (default: $API_HOST or 127.0.0.1)"),
+            arg("--port", "-p", type=int, help="API server port (default: $API_PORT or 8000)"),
+            arg("--no-tui", action="store_true", help="Run in plain CLI mode instead of the TUI"),
+            arg("--resume", metavar="CONVERSATION_ID", default=None,
+                help="Resume a previous conversation by session ID"),
+        ),
+    ),
+    CommandSpec(
+        "ask", "Ask a single question non-interactively and print the answer",
+        "commands.ask:AskCommand",
+        args=(
+            arg("prompt", nargs="?", default=None,
+                help="Prompt text (omit it or pass '-' to read the prompt from stdin)"),
+            arg("--attach", "-a", action="append", metavar="PATH", help="Attach a file (repeatable)"),
+            arg("--json", action="store_true",
+                help="Print a JSON summary (answer, session id, token usage, timings) instead of streaming"),
+            arg("--session-id", metavar="SESSION_ID", default=None,
+                help="Continue an existing conversation (default: a new session)"),
+            arg("--model", "-m", help="Model name (default: $SLP_BASE_MODEL_NAME or gemma3_it_text)"),
+            arg("--host", help="API server host (default: $API_HOST or 127.0.0.1)"),
+            arg("--port", "-p", type=int, help="API server port (default: $API_PORT or 8000)"),
+        ),
+    ),
+    CommandSpec(
+        "batch", "Run every prompt of a JSONL file and write the answers as JSONL",
+        "commands.batch:BatchCommand",
+        args=(
+            arg("input", help="JSONL input: one {\"prompt\": ..., \"id\": ...} object or string per line"),
+            arg("--output", "-o", default=None,
+                help="JSONL output, also used as the resume checkpoint (default: <input>.out.jsonl)"),
+            arg("--concurrency", "-c", type=int, default=4, help="Requests in flight at once (default: 4)"),
+            arg("--retry-failed", action="store_true", help="Re-run prompts recorded as failed in the output"),
+            arg("--model", "-m", help="Model name (default: $SLP_BASE_MODEL_NAME or gemma3_it_text)"),
+            arg("--host", help="API server host (default: $API_HOST or 127.0.0.1)"),
+            arg("--port", "-p", type=int, help="API server port (default: $API_PORT or 8000)"),
+        ),
+    ),
+    CommandSpec(
+        "bench", "Load-test the chat endpoint and report latency percentiles",
+        "commands.bench:BenchCommand",
+        args=(
+            arg("--sessions", "-n", type=int, default=4, help="Concurrent synthetic sessions (default: 4)"),
+            arg("--requests", "-r", type=int, default=50, help="Total requests to send (default: 50)"),
+            arg("--rate", type=float, default=None,
+                help="Fixed arrival rate in requests/s (default: closed loop, next request on reply)"),
+            arg("--prompts", metavar="FILE",
+                help="Prompt mix: one prompt per line, or JSONL with prompt/label/weight (default: built-in mix)"),
+            arg("--attach", "-a", action="append", metavar="PATH",
+                help="Upload a file once and attach it to requests (repeatable)"),
+            arg("--attach-ratio", type=float, default=1.0,
+                help="Fraction of requests that carry the attachments (default: 1.0)"),
+            arg("--seed", type=int, default=0, help="Seed for drawing the prompt mix (default: 0)"),
+            arg("--output", "-o", default=None, help="Results JSON (default: bench-<timestamp>.json)"),
+            arg("--baseline", metavar="FILE", help="Earlier results JSON to compare against"),
+            arg("--model", "-m", help="Model name (default: $SLP_BASE_MODEL_NAME or gemma3_it_text)"),
+            arg("--host", help="API server host (default: $API_HOST or 127.0.0.1)"),
+            arg("--port", "-p", type=int, help="API server port (default: $API_PORT or 8000)"),
+        ),
+    ),
+    CommandSpec(
+        "mcp", "MCP server management commands", "commands.mcp:McpCommand",
+        dest="mcp_command", group_help="MCP commands",
+        subcommands=(
+            CommandSpec("add", "Register a remote MCP server", args=(arg("url", help="MCP server URL"),)),
+            CommandSpec("list", "List registered MCP servers"),
+            CommandSpec("remove", "Remove an MCP server", args=(arg("id", help="MCP server ID to remove"),)),
+        ),
+    ),
+    CommandSpec(
+        "projects", "Project management commands", "commands.projects:ProjectsCommand",
+        dest="projects_command", group_help="Project commands",
+        subcommands=(
+            CommandSpec(
+                "create", "Create a new project",
+                args=(
+                    arg("name", help="Project name"),
+                    arg("--model", "-m", help="Model name for the project (default: current model)"),
+                    arg("--developer-token", "-t",
+                        help="Developer token for model download (falls back to SLP_DEVELOPER_TOKEN in .env)"),
+                ),
+            ),
+            CommandSpec("list", "List all projects"),
+            CommandSpec(
+                "update", "Update a project's model",
+                args=(
+                    arg("name", help="Project name to update"),
+                    arg("--model", "-m", required=True, help="New model name for the project"),
+                ),
+            ),
+            CommandSpec("switch", "Switch to a project", args=(arg("name", help="Project name to switch to"),)),
+        ),
+    ),
+    CommandSpec(
+        "server", "Server management commands", "commands.server:ServerCommand",
+        dest="server_command", group_help="Server commands",
+        subcommands=(
+            CommandSpec(
+                "start", "Start the API server in background",
+                args=(
+                    arg("--debug", "-d", action="store_true", help=_DEBUG_HELP),
+                    arg("--no-service", action="store_true", help="Disable auto-restart on crash"),
+                    arg("--idle-unload", type=float, metavar="MINUTES", default=None, help=_IDLE_HELP),
+                ),
+            ),
+            CommandSpec(
+                "idle-unload", "Unload the model when no slp client is attached (started by 'server start')",
+                args=(
+                    arg("--host", help="API server host (default: $API_HOST or 127.0.0.1)"),
+                    arg("--port", "-p", type=int, help="API server port (default: $API_PORT or 8000)"),
+                    arg("--idle-unload", type=float, metavar="MINUTES", default=None, help=_IDLE_HELP),
+                ),
+            ),
+            CommandSpec("stop", "Stop the background API server"),
+            CommandSpec("status", "Show server status"),
+            CommandSpec(
+                "restart", "Restart the API server",
+                args=(
+                    arg("--debug", "-d", action="store_true", help=_DEBUG_HELP),
+                    arg("--no-service", action="store_true", help="Disable auto-restart on crash"),
+                    arg("--idle-unload", type=float, metavar="MINUTES", default=None, help=_IDLE_HELP),
+                ),
+            ),
+        ),
+    ),
+    CommandSpec(
+        "token", "Manage your developer token", "commands.token:TokenCommand",
+        dest="token_command", group_help="Token commands",
+        subcommands=(
+            CommandSpec(
+                "set", "Set your developer token",
+                args=(arg("token_value", nargs="?", default=None, help="Developer token (prompted if omitted)"),),
+            ),
+            CommandSpec("clear", "Remove stored token"),
+        ),
+    ),
+)
+
+# Entry points that are dispatched but not advertised in ``--help``.
+_HIDDEN_TARGETS = {
+    "run-cli": "commands.run:RunCommand",
+}
+
+
+class _LazyVersionAction(argparse.Action):
+    """``--version`` that imports the smartloop package only when invoked."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from smartloop import __version__
+        parser._print_message(f"{parser.prog} {__version__}\n", sys.stdout)
+        parser.exit()
+
+
+def _add_spec(subparsers, spec: CommandSpec) -> argparse.ArgumentParser:
+    sub = subparsers.add_parser(spec.name, help=spec.help)
+    for a in spec.args:
+        sub.add_argument(*a.flags, **a.options)
+    if spec.subcommands:
+        nested = sub.add_subparsers(dest=spec.dest, help=spec.group_help)
+        for child in spec.subcommands:
+            _add_spec(nested, child)
+    return sub
+
+
+def build_parser() -> tuple[argparse.ArgumentParser, dict[str, argparse.ArgumentParser]]:
+    """Build the ``slp`` argument parser from :data:`COMMANDS`.
+
+    Returns the root parser and a mapping of command name to its sub-parser
+    (used by group commands to print their own help).
+    """
+    parser = argparse.ArgumentParser(
+        description="Smartloop SLM framework for inferencing and tuning models on edge devices",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--version", action=_LazyVersionAction, help="show program's version number and exit")
+    parser.add_argument("--resume", metavar="CONVERSATION_ID", default=None,
+                        help="Resume a previous conversation (implies 'run')")
+    parser.add_argument("--no-tui", action="store_true", default=False,
+                        help="Run in plain CLI mode instead of the TUI (implies 'run')")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    command_parsers = {spec.name: _add_spec(subparsers, spec) for spec in COMMANDS}
+    return parser, command_parsers
+
+
+def load_command(name: str) -> type | None:
+    """Import and return the command class registered for *name*, or None."""
+    target = _HIDDEN_TARGETS.get(name)
+    if target is None:
+        target = next((spec.target for spec in COMMANDS if spec.name == name), None)
+    if target is None:
+        return None
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
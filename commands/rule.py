@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import requests
 from requests.exceptions import RequestException
 
 from smartloop.constants import SLP_PRIMARY
@@ -23,7 +22,7 @@ class RuleCommand(Command):
             return
         existing_rules = ""
         try:
-            resp = requests.get(f"{self._base_url()}/v1/rules", timeout=5)
+            resp = self.client.get("/v1/rules", profile="health")
             if resp.ok:
                 existing_rules = resp.json().get("rules", "")
         except RequestException:
@@ -40,10 +39,9 @@ class RuleCommand(Command):
 
         if rule_text and rule_text.strip():
             try:
-                resp = requests.put(
-                    f"{self._base_url()}/v1/rules",
+                resp = self.client.put(
+                    "/v1/rules",
                     json={"rule": rule_text},
-                    timeout=30,
                 )
                 resp.raise_for_status()
                 console.print(f"[{SLP_PRIMARY}]Rules updated[/{SLP_PRIMARY}]")
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-import requests
 from requests.exceptions import RequestException
 
 from smartloop.constants import SLP_PRIMARY
 
-from commands.base import Command
+from commands.init import InitCommand
 from commands.console import console
+from commands.leases import attach, attached, detach
 from commands.helpers import run_interactive, print_exit_message
 
 
-class RunCommand(Command):
-    """Handles ``run`` and ``run-cli`` CLI commands."""
+class RunCommand(InitCommand):
+    """Handles ``run`` and ``run-cli`` CLI commands.
+
+    Extends :class:`InitCommand` so ``_ensure_ready`` can fall back to
+    ``_init`` / ``_bootstrap`` on a fresh workspace.
+    """
 
     args: object
     host: str
@@ -32,17 +36,21 @@ class RunCommand(Command):
             return
 
         from tui.chat import SLPChat
+        # Detach rather than unload: the server keeps the model resident for
+        # the next session and unloads it only after its idle period.
+        lease = attach("tui")
         try:
             resume_id = getattr(self.args, "resume", None)
             app = SLPChat(
                 server_url=self._base_url(),
+                socket_path=self.client.socket_path,
                 model_name=self.model_name or "",
                 session_id=resume_id or "",
             )
             app.run()
         finally:
+            detach(lease)
             try:
-                requests.post(f"{self._base_url()}/v1/models/unload", timeout=30)
                 print_exit_message(app.session_id)
             except Exception:
                 pass
@@ -63,7 +71,7 @@ class RunCommand(Command):
         project_rules = ""
         project_id = self.project_id
         try:
-            data = requests.get(f"{self._base_url()}/v1/projects", timeout=10).json()
+            data = self.client.get("/v1/projects", profile="list").json()
             projects = data.get("projects", [])
             project = None
             if self.project_name:
@@ -81,16 +89,16 @@ class RunCommand(Command):
             pass
 
         try:
-            health = requests.get(f"{self._base_url()}/health", timeout=5).json()
+            health = self.client.get("/health", profile="health").json()
             if not health.get("model_loaded"):
                 load_payload = {"mode": "inference"}
                 if project_id:
                     load_payload["project_id"] = project_id
                 with console.status("[bold cyan]Loading model...[/bold cyan]", spinner="dots"):
-                    resp = requests.post(
-                        f"{self._base_url()}/v1/models/load",
+                    resp = self.client.post(
+                        "/v1/models/load",
                         json=load_payload,
-                        timeout=300,
+                        profile="model",
                     )
                     resp.raise_for_status()
                 console.print(f"[dim]{resp.json().get('message', 'Model loaded')}[/dim]")
@@ -98,10 +106,5 @@ class RunCommand(Command):
             console.print(f"[yellow]Warning: could not load model: {e}[/yellow]")
 
         resume_id = getattr(self.args, "resume", None)
-        try:
+        with attached("cli"):
             run_interactive(self.model_name, self.host, self.port, project_rules, session_id=resume_id)
-        finally:
-            try:
-                requests.post(f"{self._base_url()}/v1/models/unload", timeout=30)
-            except Exception:
-                pass
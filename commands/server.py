@@ -9,10 +9,12 @@ from smartloop.server import is_server_running, stop_server, start_server, get_s
 
 from commands.base import Command
 from commands.console import console
+from commands.leases import IdleUnloader, idle_unload_minutes
+from commands.readiness import FAILED, LISTENING, ReadinessNotifier
 
 
 class ServerCommand(Command):
-    """Handles ``server`` CLI sub-commands (start / stop / status / restart)."""
+    """Handles ``server`` CLI sub-commands (start / stop / status / restart / idle-unload)."""
 
     args: object
     host: str
@@ -21,24 +23,25 @@ class ServerCommand(Command):
 
     def execute(self) -> None:
         """Dispatch server sub-commands."""
-        sub = getattr(self, f"server_{self.args.server_command}", None)
+        name = (self.args.server_command or "").replace("-", "_")
+        sub = getattr(self, f"server_{name}", None)
         if sub:
             sub()
         else:
             self.server_parser.print_help()
 
     def server_start(self) -> None:
+        notifier = ReadinessNotifier.from_env()
         if is_server_running(self.host, self.port):
+            if notifier:
+                notifier.notify(LISTENING, str(self.port))
+                notifier.close()
             console.print(f"[{SLP_PRIMARY}]Server already running at http://{self.host}:{self.port}[/{SLP_PRIMARY}]")
         else:
             debug = getattr(self.args, "debug", False)
             if debug:
                 console.print("[bold yellow]🔧 Debug mode enabled - loading base model with LoRA adapters[/bold yellow]")
-            start_server(
-                self.host, self.port,
-                debug=debug,
-                service=not getattr(self.args, "no_service", False),
-            )
+            self._start_server(debug, notifier)
 
     def server_stop(self) -> None:
         stop_server()
@@ -59,8 +62,29 @@ class ServerCommand(Command):
         debug = getattr(self.args, "debug", False)
         if debug:
             console.print("[bold yellow]🔧 Debug mode enabled - loading base model with LoRA adapters[/bold yellow]")
-        start_server(
-            self.host, self.port,
-            debug=debug,
-            service=not getattr(self.args, "no_service", False),
-        )
+        self._start_server(debug, ReadinessNotifier.from_env())
+
+    def server_idle_unload(self) -> None:
+        """Run the idle unloader until the server stops (spawned by ``server start``)."""
+        IdleUnloader(self.host, self.port, idle_unload_minutes(getattr(self.args, "idle_unload", None))).serve()
+
+    def _start_server(self, debug: bool, notifier: ReadinessNotifier | None) -> None:
+        """Run start_server, reporting readiness stages to the spawning client if any.
+
+        Also spawns the idle unloader, which outlives this process: the model
+        stays loaded while any client holds a lease and is unloaded after the
+        idle period.
+        """
+        IdleUnloader.spawn(self.host, self.port, idle_unload_minutes(getattr(self.args, "idle_unload", None)))
+        if notifier is None:
+            start_server(self.host, self.port, debug=debug, service=not getattr(self.args, "no_service", False))
+            return
+        notifier.watch(self.host, self.port)
+        try:
+            start_server(self.host, self.port, debug=debug, service=not getattr(self.args, "no_service", False))
+        except BaseException as e:
+            notifier.notify(FAILED, str(e))
+            raise
+        finally:
+            # start_server hands off to a background server and returns early
+            notifier.wait(timeout=30)
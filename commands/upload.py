@@ -0,0 +1,112 @@
+"""Asset uploads for the CLI — deduplicated by digest, chunked for large files (see :mod:`tui.uploads`)."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import requests
+from requests.exceptions import RequestException
+
+from commands.client import ApiClient
+from commands.console import settings
+from tui.uploads import (
+    UNSUPPORTED_STATUS,
+    UPLOADS_PATH,
+    AssetIndex,
+    ChunkedUpload,
+    UploadFile,
+    UploadState,
+    chunked,
+)
+
+
+def upload_asset(client: ApiClient, path: Path, on_progress=None) -> requests.Response:
+    """Upload *path* to ``/v1/assets``; returns the response with the asset or the rejection.
+
+    Content the server already has is not sent again: the existing asset is
+    returned instead.  *on_progress* is called with ``(bytes_done,
+    bytes_total)`` as parts are sent.  Raises :class:`RequestException` if
+    the server stays unreachable; a chunked upload can then be resumed by
+    calling again.
+    """
+    index = AssetIndex(settings.home_dir)
+    file = UploadFile.open(path, index)
+    resp = _find_asset(client, file, index)
+    if resp is not None:
+        return resp
+    resp = None
+    if chunked(file.size):
+        resp = _upload_chunked(client, file, UploadState(settings.home_dir), on_progress)
+    if resp is None:
+        with path.open("rb") as fh:
+            resp = client.post("/v1/assets", files={"file": (path.name, fh)}, profile="upload")
+    if resp.ok:
+        index.remember_asset(file.sha256, resp.json()["asset_id"])
+    return resp
+
+
+def _find_asset(client: ApiClient, file: UploadFile, index: AssetIndex) -> requests.Response | None:
+    """The server's asset with *file*'s content, or None if it has none."""
+    asset_id = index.asset_id(file.sha256)
+    if asset_id:
+        resp = client.get(f"/v1/assets/{asset_id}", profile="list")
+        if resp.ok:
+            return resp
+        index.forget_asset(file.sha256)
+    resp = client.get(file.lookup_path, profile="list")
+    if not resp.ok:
+        return None
+    index.remember_asset(file.sha256, resp.json()["asset_id"])
+    return resp
+
+
+def _server_offset(client: ApiClient, upload_id: str) -> int | None:
+    """Bytes the server holds for *upload_id*; None if it no longer knows the upload."""
+    resp = client.get(f"{UPLOADS_PATH}/{upload_id}", profile="list")
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    return resp.json().get("offset", 0)
+
+
+def _upload_chunked(client: ApiClient, file: UploadFile, state: UploadState,
+                    on_progress=None) -> requests.Response | None:
+    """Send *file* in parts; None if the server has no chunked upload endpoints."""
+    upload = ChunkedUpload(file, state)
+    if upload.upload_id:
+        upload.resume(_server_offset(client, upload.upload_id))
+    if upload.offset is None:
+        resp = client.post(UPLOADS_PATH, json=file.create_body(), profile="upload")
+        if resp.status_code in UNSUPPORTED_STATUS:
+            return None
+        if not resp.ok:
+            return resp
+        upload.created(resp.json())
+
+    while not upload.done:
+        try:
+            for index, data, headers in upload.parts():
+                if on_progress:
+                    on_progress(upload.offset, file.size)
+                resp = client.put(f"{upload.path}/parts/{index}", data=data, headers=headers, profile="upload")
+                resp.raise_for_status()
+                if not upload.sent(index, data, resp.json().get("offset")):
+                    break
+        except RequestException:
+            delay = upload.retry_delay()
+            if delay is None:
+                raise
+            time.sleep(delay)
+            try:
+                offset = _server_offset(client, upload.upload_id)
+            except RequestException:
+                continue
+            if not upload.resync(offset):
+                raise
+    if on_progress:
+        on_progress(file.size, file.size)
+
+    resp = client.post(f"{upload.path}/complete", profile="upload")
+    upload.completed(resp.status_code)
+    return resp
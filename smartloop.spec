@@ -124,6 +124,19 @@ a = Analysis(
     datas=datas,
     hiddenimports=[
         'certifi',
+        # Command modules are imported lazily by commands.registry
+        'commands.init',
+        'commands.document',
+        'commands.rule',
+        'commands.model',
+        'commands.run',
+        'commands.ask',
+        'commands.batch',
+        'commands.bench',
+        'commands.token',
+        'commands.mcp',
+        'commands.server',
+        'commands.projects',
         'llama_cpp',
         'llama_cpp.llama_cpp',
         'llama_cpp._ctypes_extensions',
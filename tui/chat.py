@@ -1,5 +1,6 @@
 """Textual TUI chat interface for SLP Framework."""
 
+import asyncio
 import logging
 import uuid
 from pathlib import Path
@@ -7,13 +8,13 @@ from pathlib import Path
 from rich.style import Style
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.containers import Horizontal, Vertical
 from textual.widgets import Static, OptionList, TextArea
 from textual.widgets.text_area import TextAreaTheme
 
 from smartloop.model_factory import SUPPORTED_MODELS
 from tui.theme import SLP_DARK
-from tui.widgets import CommandMenu, PromptTextArea, ChatLog
+from tui.widgets import CommandMenu, PromptTextArea, ChatLog, MessageLog
 from tui.workers import Connection, Bootstrap, Streaming
 from tui.commands import (
     MCP,
@@ -65,15 +66,20 @@ class SLPChat(
         project_id: str | None = None,
         project_name: str | None = None,
         project_rules: str | None = None,
+        socket_path: str | None = None,
     ) -> None:
         super().__init__()
         self.server_url = server_url
+        self.socket_path = socket_path
         self.model_name = model_name
         self.session_id = session_id or str(uuid.uuid4())
         self.project_id = project_id
         self.project_rules = project_rules
         self.pending_attachments: list[str] = []
         self._attachment_names: list[str] = []
+        self._uploading: dict[int, str] = {}
+        self._uploads_idle = asyncio.Event()
+        self._uploads_idle.set()
         self.title = project_name or "project_name"
         self.sub_title = model_name or "starting..."
         self._streaming = False
@@ -83,6 +89,9 @@ class SLPChat(
         self._suppress_menu = False
         self._context_used = 0
         self._context_max = 0
+        self._history_older: list = []
+        self._history_anchor = None
+        self.http = None
 
     def get_css_variables(self) -> dict[str, str]:
         """Override theme colors with Smartloop dark-pink palette."""
@@ -91,7 +100,7 @@ class SLPChat(
         return variables
 
     def compose(self) -> ComposeResult:
-        yield VerticalScroll(id="chat-log")
+        yield MessageLog(id="chat-log")
         with Vertical(id="prompt-wrapper"):
             yield Static(id="status-bar")
             yield CommandMenu(id="command-menu")
@@ -103,6 +112,7 @@ class SLPChat(
                 yield Static("", id="cost-badge")
 
     def on_mount(self) -> None:
+        self._open_http_client()
         prompt = self.query_one("#prompt-box", PromptTextArea)
         prompt.show_line_numbers = False
         prompt.register_theme(TextAreaTheme(
@@ -122,6 +132,9 @@ class SLPChat(
             self._update_loading("Bootstrapping...")
             self._run_bootstrap()
 
+    async def on_unmount(self) -> None:
+        await self._close_http_client()
+
     @staticmethod
     def _make_badge(value: str, variant: str = "pink", icon: str | None = None) -> Horizontal:
         """Create a badge widget with optional icon, both vertically centered."""
@@ -190,6 +203,8 @@ class SLPChat(
         if self._attachment_names:
             for name in self._attachment_names:
                 bar.mount(self._make_badge(name, "muted"))
+        for label in self._uploading.values():
+            bar.mount(self._make_badge(label, "pink", icon="↑"))
 
         try:
             self.query_one("#cost-badge", Static).update(
@@ -254,8 +269,7 @@ class SLPChat(
             return
 
         if text.lower().startswith("/attach "):
-            filepath = text[8:].strip()
-            self._upload_attachment(filepath)
+            self._upload_attachment(text[8:].strip())
             return
 
         if text.lower().startswith("/mcp"):
@@ -2,58 +2,194 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import shlex
 from pathlib import Path
 
 import httpx
 from textual import work
 
+from smartloop.config import AppSettings
+from tui.ingest import DEFAULT_JOBS, expand_sources, is_url
+from tui.uploads import (
+    UNSUPPORTED_STATUS,
+    UPLOADS_PATH,
+    AssetIndex,
+    ChunkedUpload,
+    UploadFile,
+    UploadState,
+    chunked,
+)
+
+def _normalize_path(token: str) -> str:
+    """Undo the quoting and ``file://`` prefix that pasted paths often carry."""
+    token = token.strip().strip("'\"").replace("\\ ", " ")
+    if token.lower().startswith("file://"):
+        token = token[7:]
+    return os.path.expanduser(token)
+
+
+def _expand_attach_args(args: str) -> tuple[list[Path], list[str]]:
+    """Files named by ``/attach`` arguments (paths, directories or globs), and the arguments matching none."""
+    whole = Path(_normalize_path(args))
+    if whole.is_file():
+        return [whole], []  # One pasted path, possibly with unescaped spaces.
+    try:
+        tokens = shlex.split(args)
+    except ValueError:
+        tokens = args.split()
+    sources, missing = expand_sources([_normalize_path(token) for token in tokens])
+    return [Path(s) for s in sources if not is_url(s)], missing + [s for s in sources if is_url(s)]
+
 
 class Attachment:
-    """Command handler for _upload_attachment."""
+    """Command handler for _upload_attachment and the asset upload it uses."""
 
-    server_url: str
+    http: httpx.AsyncClient
     pending_attachments: list
     _attachment_names: list
+    # Uploads in flight: id -> info-bar label; _uploads_idle is set when empty.
+    _uploading: dict
+    _uploads_idle: asyncio.Event
+    _upload_seq: int = 0
+    _upload_slots: asyncio.Semaphore | None = None
 
-    @work(exclusive=True)
-    async def _upload_attachment(self, filepath: str) -> None:
-        # Normalize pasted file paths (match /document add behaviour)
-        filepath = filepath.strip().strip("'\"")
-        filepath = filepath.replace("\\ ", " ")
-        if filepath.lower().startswith("file://"):
-            filepath = filepath[7:]
-        path = Path(filepath).expanduser()
-        if not path.is_file():
-            self._append_system(f"File not found: {filepath}")
-            return
-
-        self._set_loading(f"Uploading {path.name}...")
+    @work(group="attach")
+    async def _upload_attachment(self, args: str) -> None:
+        """Upload every file matched by *args*, several at a time, without blocking the prompt."""
+        files, missing = await asyncio.to_thread(_expand_attach_args, args)
+        for arg in missing:
+            self._append_system(f"File not found: {arg}")
+        if self._upload_slots is None:
+            # Shared by all /attach commands, so the bound holds across them.
+            self._upload_slots = asyncio.Semaphore(DEFAULT_JOBS)
+        await asyncio.gather(*(self._attach_file(path) for path in files))
 
+    async def _attach_file(self, path: Path) -> None:
+        self._upload_seq += 1
+        upload_id = self._upload_seq
+        self._uploads_idle.clear()
+        self._set_upload_label(upload_id, f"{path.name} queued")
         try:
-            async with httpx.AsyncClient(timeout=120) as client:
-                with path.open("rb") as fh:
-                    resp = await client.post(
-                        f"{self.server_url}/v1/assets",
-                        files={"file": (path.name, fh)},
-                    )
-                if resp.status_code in (400, 422):
-                    detail = resp.json().get("detail", resp.text)
-                    self._append_system(f"Upload rejected: {detail}")
-                    return
-                resp.raise_for_status()
-                data = resp.json()
-                asset_id = data["asset_id"]
-                self.pending_attachments.append(asset_id)
-                self._attachment_names.append(path.name)
-                self._refresh_info_bar()
-                md = "yes" if data.get("markdown") else "no"
-                self._append_system(
-                    f"Attached: {path.name} (id={asset_id}, markdown={md}) — "
-                    f"{len(self.pending_attachments)} attachment(s) queued"
+            async with self._upload_slots:
+                self._set_upload_label(upload_id, f"{path.name} …")
+                resp = await self._upload_asset(
+                    path,
+                    lambda done, total: self._set_upload_label(
+                        upload_id, f"{path.name} {done * 100 // total if total else 100}%",
+                    ),
                 )
-        except httpx.RequestError:
-            self._append_system("Upload failed")
+            if resp.status_code in (400, 422):
+                detail = resp.json().get("detail", resp.text)
+                self._append_system(f"Upload rejected: {path.name}: {detail}")
+                return
+            resp.raise_for_status()
+            data = resp.json()
+            asset_id = data["asset_id"]
+            self.pending_attachments.append(asset_id)
+            self._attachment_names.append(path.name)
+            md = "yes" if data.get("markdown") else "no"
+            self._append_system(
+                f"Attached: {path.name} (id={asset_id}, markdown={md}) — "
+                f"{len(self.pending_attachments)} attachment(s) queued"
+            )
+        except (httpx.RequestError, httpx.HTTPStatusError):
+            self._append_system(f"Upload failed: {path.name}; /attach it again to resume")
+        except OSError as e:
+            self._append_system(f"Upload failed: {path.name}: {e.strerror or e}")
+        except (KeyError, ValueError):
+            self._append_system(f"Upload failed: {path.name}: unexpected response from the server")
         finally:
-            self._clear_loading()
+            del self._uploading[upload_id]
+            if not self._uploading:
+                self._uploads_idle.set()
+            self._refresh_info_bar()
 
+    def _set_upload_label(self, upload_id: int, label: str) -> None:
+        if self._uploading.get(upload_id) != label:
+            self._uploading[upload_id] = label
+            self._refresh_info_bar()
+
+    async def _upload_asset(self, path: Path, on_progress) -> httpx.Response:
+        """Upload *path*, unless the server already has its content (see :mod:`tui.uploads`)."""
+        home_dir = AppSettings().home_dir
+        index = AssetIndex(home_dir)
+        file = await asyncio.to_thread(UploadFile.open, path, index)
+        resp = await self._find_asset(file, index)
+        if resp is not None:
+            return resp
+        resp = None
+        if chunked(file.size):
+            resp = await self._upload_chunked(file, UploadState(home_dir), on_progress)
+        if resp is None:
+            with path.open("rb") as fh:
+                resp = await self.http.post("/v1/assets", files={"file": (path.name, fh)}, timeout=120)
+        if resp.is_success:
+            index.remember_asset(file.sha256, resp.json()["asset_id"])
+        return resp
+
+    async def _find_asset(self, file: UploadFile, index: AssetIndex) -> httpx.Response | None:
+        """The server's asset with *file*'s content, or None if it has none."""
+        asset_id = index.asset_id(file.sha256)
+        if asset_id:
+            resp = await self.http.get(f"/v1/assets/{asset_id}", timeout=10)
+            if resp.is_success:
+                return resp
+            index.forget_asset(file.sha256)
+        resp = await self.http.get(file.lookup_path, timeout=10)
+        if not resp.is_success:
+            return None
+        index.remember_asset(file.sha256, resp.json()["asset_id"])
+        return resp
+
+    async def _upload_offset(self, upload_id: str) -> int | None:
+        resp = await self.http.get(f"{UPLOADS_PATH}/{upload_id}", timeout=10)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        return resp.json().get("offset", 0)
+
+    async def _upload_chunked(self, file: UploadFile, state: UploadState, on_progress) -> httpx.Response | None:
+        """Send *file* in parts; None if the server has no chunked upload endpoints."""
+        upload = ChunkedUpload(file, state)
+        if upload.upload_id:
+            upload.resume(await self._upload_offset(upload.upload_id))
+        if upload.offset is None:
+            resp = await self.http.post(UPLOADS_PATH, json=file.create_body(), timeout=120)
+            if resp.status_code in UNSUPPORTED_STATUS:
+                return None
+            if resp.is_error:
+                return resp
+            upload.created(resp.json())
+
+        while not upload.done:
+            parts = upload.parts()
+            try:
+                while part := await asyncio.to_thread(next, parts, None):
+                    index, data, headers = part
+                    on_progress(upload.offset, file.size)
+                    resp = await self.http.put(
+                        f"{upload.path}/parts/{index}", content=data, headers=headers, timeout=120,
+                    )
+                    resp.raise_for_status()
+                    if not upload.sent(index, data, resp.json().get("offset")):
+                        break
+            except (httpx.RequestError, httpx.HTTPStatusError):
+                delay = upload.retry_delay()
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                try:
+                    offset = await self._upload_offset(upload.upload_id)
+                except (httpx.RequestError, httpx.HTTPStatusError):
+                    continue
+                if not upload.resync(offset):
+                    raise
+            finally:
+                parts.close()
+        on_progress(file.size, file.size)
 
+        resp = await self.http.post(f"{upload.path}/complete", timeout=120)
+        upload.completed(resp.status_code)
+        return resp
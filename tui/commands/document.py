@@ -1,22 +1,75 @@
-"""DocumentCommandsMixin — /document add|list|remove commands."""
+"""DocumentCommandsMixin — /document add|list|remove|watch|unwatch commands."""
 
 from __future__ import annotations
 
-import json
+import asyncio
+import shlex
+import threading
 from pathlib import Path
 
 import httpx
 from rich.table import Table
 from textual import work
-from textual.containers import VerticalScroll
-from textual.widgets import Static
+
+from smartloop.config import AppSettings
+
+from tui.events import DocumentComplete, DocumentError, DocumentProgress, document_event
+from tui.ingest import DEFAULT_JOBS, IngestSummary, expand_sources
+from tui.manifest import FileState, Manifest, plan_sync
+from tui.sse import aiter_sse
+from tui.watch import DEFAULT_MAX_RATE, DirectoryWatcher, RateLimiter
+from tui.widgets import MessageLog
+
+# Failed sources listed individually after a bulk add.
+_MAX_FAILURES_SHOWN = 20
+
+
+class _IngestError(Exception):
+    """The server reported an error event while ingesting a source."""
+
+
+def _stage_label(event: DocumentProgress) -> str:
+    label = event.stage.capitalize()
+    return f"{label}: {event.filename}" if event.filename else label
+
+
+def _error_detail(e: httpx.HTTPStatusError) -> str:
+    try:
+        return e.response.json().get("detail", "Unknown error")
+    except ValueError:
+        return "Unknown error"
+
+
+def _parse_add_args(args: str) -> tuple[list[str], tuple[str, ...], tuple[str, ...], bool]:
+    """Split ``/document add`` arguments into paths and --include/--exclude/--no-recursive."""
+    tokens = shlex.split(args)
+    paths: list[str] = []
+    include: list[str] = []
+    exclude: list[str] = []
+    recursive = True
+    it = iter(tokens)
+    for token in it:
+        if token in ("--include", "-i", "--exclude", "-x"):
+            pattern = next(it, None)
+            if pattern is None:
+                raise ValueError(f"{token} needs a pattern")
+            (include if token in ("--include", "-i") else exclude).append(pattern)
+        elif token == "--no-recursive":
+            recursive = False
+        else:
+            paths.append(token)
+    if not paths:
+        raise ValueError("No source given")
+    return paths, tuple(include), tuple(exclude), recursive
 
 
 class Document:
     """Command handler for _handle_document_command and all _document_* helpers."""
 
-    server_url: str
+    http: httpx.AsyncClient
     project_id: str | None
+    _watch_stop: threading.Event | None = None
+    _watch_label: str = ""
 
     def _handle_document_command(self, args: str) -> None:
         """Dispatch /document sub-commands."""
@@ -28,7 +81,7 @@ class Document:
             if path:
                 self._document_add(path)
             else:
-                self._append_system("Usage: /document add <path>")
+                self._append_system("Usage: /document add <path|dir|glob|url>...")
         elif args == "list":
             self._document_list()
         elif args.startswith("remove "):
@@ -37,40 +90,75 @@ class Document:
                 self._document_remove(doc_id)
             else:
                 self._append_system("Usage: /document remove <id>")
+        elif args == "watch" or args.startswith("watch "):
+            if args[6:].strip():
+                self._document_watch(args[6:].strip())
+            elif self._watch_stop is not None:
+                self._append_system(f"Watching {self._watch_label}")
+            else:
+                self._append_system("Usage: /document watch <dir>... [--include PAT] [--exclude PAT] [--poll]")
+        elif args == "unwatch":
+            self._document_unwatch()
         else:
-            self._append_system("Usage: /document <add|list|remove>")
+            self._append_system("Usage: /document <add|list|remove|watch|unwatch>")
 
     @work(exclusive=True)
-    async def _document_add(self, source: str) -> None:
-        """Add a document to the project."""
+    async def _document_add(self, args: str) -> None:
+        """Add files, directories, globs or URLs to the project, several at a time."""
+        try:
+            paths, include, exclude, recursive = _parse_add_args(args)
+        except ValueError as e:
+            self._append_system(f"{e}. Usage: /document add <path|dir|glob|url>... [--include PAT] [--exclude PAT]")
+            return
+        sources, missing = await asyncio.to_thread(expand_sources, paths, include, exclude, recursive)
+        for arg in missing:
+            self._append_system(f"No such file, directory or match: {arg}")
+        if not sources:
+            if not missing:
+                self._append_system("No files matched")
+            return
+
+        if len(sources) == 1:
+            await self._document_add_one(sources[0])
+            return
+
+        summary = IngestSummary(total=len(sources))
+        limit = asyncio.Semaphore(DEFAULT_JOBS)
+
+        def show(stage: str = "") -> None:
+            label = f"Adding documents {summary.done}/{summary.total} · {summary.counts()}"
+            self._set_loading(f"{label} · {stage}" if stage else label)
+
+        async def add(source: str) -> None:
+            async with limit:
+                try:
+                    documents = await self._submit_document(
+                        source, lambda event: show(_stage_label(event))
+                    )
+                    summary.record(source, documents)
+                except httpx.HTTPStatusError as e:
+                    summary.record(source, None, _error_detail(e))
+                except (httpx.RequestError, _IngestError) as e:
+                    summary.record(source, None, str(e) or "Request failed")
+                show()
+
+        show()
+        try:
+            await asyncio.gather(*(add(source) for source in sources))
+        finally:
+            self._clear_loading()
+            self._append_system(f"Documents: {summary.counts()} (of {summary.total})")
+            for source, error in summary.failed[:_MAX_FAILURES_SHOWN]:
+                self._append_system(f"Failed: {Path(source).name}: {error}")
+            if len(summary.failed) > _MAX_FAILURES_SHOWN:
+                self._append_system(f"… and {len(summary.failed) - _MAX_FAILURES_SHOWN} more failures")
+
+    async def _document_add_one(self, source: str) -> None:
         self._set_loading("Processing document...")
         try:
-            documents: list[dict] = []
-            event_type: str | None = None
-            async with httpx.AsyncClient(timeout=300) as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.server_url}/v1/projects/{self.project_id}/documents",
-                    json={"source": source},
-                ) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if not line:
-                            event_type = None
-                            continue
-                        if line.startswith("event:"):
-                            event_type = line[len("event:"):].strip()
-                        elif line.startswith("data:"):
-                            payload = json.loads(line[len("data:"):].strip())
-                            if event_type == "progress":
-                                stage = payload.get("stage", "processing")
-                                filename = payload.get("filename", "")
-                                label = stage.capitalize()
-                                if filename:
-                                    label += f": {filename}"
-                                self._set_loading(label)
-                            elif event_type == "complete":
-                                documents = payload.get("documents", [])
+            documents = await self._submit_document(
+                source, lambda event: self._set_loading(_stage_label(event))
+            )
             if documents:
                 for doc in documents:
                     name = Path(doc["path"]).name
@@ -78,24 +166,166 @@ class Document:
             else:
                 self._append_system("No new documents added (may already exist)")
         except httpx.HTTPStatusError as e:
-            detail = e.response.json().get("detail", "Unknown error") if e.response else "Unknown error"
-            self._append_system(f"Failed to add document: {detail}")
+            self._append_system(f"Failed to add document: {_error_detail(e)}")
+        except _IngestError as e:
+            self._append_system(f"Failed to add document: {e}")
         except httpx.RequestError:
             self._append_system("Request failed")
         finally:
             self._clear_loading()
 
+    async def _submit_document(self, source: str, on_progress, project_id: str | None = None) -> list[dict]:
+        """POST one source and follow its SSE stream; returns the added documents."""
+        documents: list[dict] = []
+        async with self.http.stream(
+            "POST",
+            f"/v1/projects/{project_id or self.project_id}/documents",
+            json={"source": source},
+            timeout=300,
+        ) as resp:
+            if resp.is_error:
+                await resp.aread()
+            resp.raise_for_status()
+            async for sse in aiter_sse(resp.aiter_bytes()):
+                match document_event(sse):
+                    case DocumentProgress() as event:
+                        on_progress(event)
+                    case DocumentComplete(documents=docs):
+                        documents = docs
+                    case DocumentError(message=message):
+                        raise _IngestError(message)
+        return documents
+
+    @work(exclusive=True, group="document-watch")
+    async def _document_watch(self, args: str) -> None:
+        """Add a directory's new files, then keep submitting changes and deletions."""
+        tokens = shlex.split(args)
+        poll = "--poll" in tokens
+        try:
+            paths, include, exclude, recursive = _parse_add_args(shlex.join(t for t in tokens if t != "--poll"))
+        except ValueError as e:
+            self._append_system(f"{e}. Usage: /document watch <dir>... [--include PAT] [--exclude PAT] [--poll]")
+            return
+        roots = [Path(p).expanduser().resolve() for p in paths]
+        not_dirs = [str(root) for root in roots if not root.is_dir()]
+        if not_dirs:
+            self._append_system(f"Not a directory: {', '.join(not_dirs)}")
+            return
+
+        project_id = self.project_id
+        stop = threading.Event()
+        self._watch_stop = stop
+        self._watch_label = ", ".join(str(root) for root in roots)
+        # Start watching first so changes made during the initial pass are seen.
+        watcher = await asyncio.to_thread(
+            DirectoryWatcher, roots, include, exclude, recursive, force_poll=poll,
+        )
+        limiter = RateLimiter(DEFAULT_MAX_RATE)
+        manifest = await asyncio.to_thread(Manifest.load, AppSettings().home_dir, project_id)
+
+        async def full_sync() -> None:
+            files, _ = await asyncio.to_thread(expand_sources, [str(r) for r in roots], include, exclude, recursive)
+            await self._apply_watch_batch(project_id, manifest, files, [str(r) for r in roots], limiter)
+
+        try:
+            await full_sync()
+            self._append_system(f"Watching {self._watch_label} ({watcher.backend}); /document unwatch to stop")
+            while True:
+                batch = await asyncio.to_thread(watcher.next_batch, stop)
+                if batch is None:
+                    break
+                if batch.rescan:
+                    # Events were lost: compare the whole tree with the manifest.
+                    await full_sync()
+                else:
+                    await self._apply_watch_batch(project_id, manifest, batch.changed, batch.removed, limiter)
+        finally:
+            stop.set()
+            watcher.close()
+            if self._watch_stop is stop:
+                self._watch_stop = None
+                self._append_system(f"Stopped watching {self._watch_label}")
+
+    def _document_unwatch(self) -> None:
+        if self._watch_stop is None:
+            self._append_system("Not watching any directory")
+            return
+        self._watch_stop.set()
+
+    async def _document_paths(self, project_id: str) -> dict[str, list[str]]:
+        """``path -> [document id]`` for the project's documents."""
+        resp = await self.http.get(f"/v1/projects/{project_id}/documents", timeout=10)
+        resp.raise_for_status()
+        documents: dict[str, list[str]] = {}
+        for doc in resp.json().get("documents", []):
+            documents.setdefault(doc.get("path", ""), []).append(doc["id"])
+        return documents
+
+    async def _apply_watch_batch(self, project_id: str, manifest: Manifest, files: list[str],
+                                 removed: list[str], limiter: RateLimiter) -> None:
+        """Upload new and modified files and delete removed ones, at a bounded rate.
+
+        Files are compared with the manifest by size, mtime and SHA-256, so
+        unchanged content is skipped and documents are only replaced when
+        the content changed.
+        """
+        if not files and not removed:
+            return
+        try:
+            on_server = await self._document_paths(project_id)
+        except (httpx.RequestError, httpx.HTTPStatusError):
+            self._append_system("Watch: could not list documents; will retry on the next change")
+            return
+        plan = await asyncio.to_thread(plan_sync, files, removed, manifest, on_server, DEFAULT_JOBS)
+        counts = {"added": 0, "updated": 0, "deleted": 0, "failed": 0}
+        failures: list[tuple[str, str]] = []
+        limit = asyncio.Semaphore(DEFAULT_JOBS)
+
+        async def delete(doc_ids: list[str]) -> None:
+            for doc_id in doc_ids:
+                resp = await self.http.delete(f"/v1/projects/{project_id}/documents/{doc_id}")
+                if resp.status_code != 404:
+                    resp.raise_for_status()
+
+        async def apply(kind: str, path: str) -> None:
+            old_ids = manifest.get(path).doc_ids if kind != "add" else []
+            async with limit:
+                await asyncio.sleep(limiter.reserve())
+                try:
+                    await delete(old_ids)
+                    manifest.forget(path)
+                    if kind != "delete":
+                        state = await asyncio.to_thread(FileState.read, path)
+                        documents = await self._submit_document(path, lambda event: None, project_id)
+                        if documents:
+                            manifest.record(path, state, [doc["id"] for doc in documents])
+                    counts[{"add": "added", "modify": "updated", "delete": "deleted"}[kind]] += 1
+                except httpx.HTTPStatusError as e:
+                    counts["failed"] += 1
+                    failures.append((path, _error_detail(e)))
+                except (httpx.RequestError, _IngestError, OSError) as e:
+                    counts["failed"] += 1
+                    failures.append((path, str(e) or "Request failed"))
+
+        try:
+            await asyncio.gather(*(apply(kind, path) for kind, path in plan.tasks))
+        finally:
+            await asyncio.to_thread(manifest.save)
+        if any(counts.values()):
+            self._append_system("Watch: " + ", ".join(f"{value} {key}" for key, value in counts.items()))
+        for path, error in failures[:_MAX_FAILURES_SHOWN]:
+            self._append_system(f"Failed: {Path(path).name}: {error}")
+
     @work(exclusive=True)
     async def _document_list(self) -> None:
         """List project documents."""
         self._set_loading("Fetching documents...")
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(
-                    f"{self.server_url}/v1/projects/{self.project_id}/documents"
-                )
-                resp.raise_for_status()
-                docs = resp.json().get("documents", [])
+            resp = await self.http.get(
+                f"/v1/projects/{self.project_id}/documents", timeout=10
+            )
+            resp.raise_for_status()
+            docs = resp.json().get("documents", [])
             if not docs:
                 self._append_system("No documents in project")
                 return
@@ -104,8 +334,8 @@ class Document:
             table.add_column("Name")
             for i, doc in enumerate(docs, 1):
                 table.add_row(str(i), Path(doc["path"]).name)
-            log = self.query_one("#chat-log", VerticalScroll)
-            log.mount(Static(table, classes="system-msg"))
+            log = self.query_one("#chat-log", MessageLog)
+            log.append(table, "system-msg")
             log.scroll_end(animate=False)
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
@@ -123,24 +353,21 @@ class Document:
 
         self._set_loading("Removing document...")
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(
-                    f"{self.server_url}/v1/projects/{self.project_id}/documents"
-                )
-                resp.raise_for_status()
-                docs = resp.json().get("documents", [])
-
-                if index < 1 or index > len(docs):
-                    self._append_system(f"Invalid index {index}. Documents have {len(docs)} entries.")
-                    return
-
-                doc = docs[index - 1]
-                del_resp = await client.delete(
-                    f"{self.server_url}/v1/projects/{self.project_id}/documents/{doc['id']}"
-                )
-                del_resp.raise_for_status()
-                name = Path(doc["path"]).name
-                self._append_system(f"Removed: {name}")
+            resp = await self.http.get(f"/v1/projects/{self.project_id}/documents")
+            resp.raise_for_status()
+            docs = resp.json().get("documents", [])
+
+            if index < 1 or index > len(docs):
+                self._append_system(f"Invalid index {index}. Documents have {len(docs)} entries.")
+                return
+
+            doc = docs[index - 1]
+            del_resp = await self.http.delete(
+                f"/v1/projects/{self.project_id}/documents/{doc['id']}"
+            )
+            del_resp.raise_for_status()
+            name = Path(doc["path"]).name
+            self._append_system(f"Removed: {name}")
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
         finally:
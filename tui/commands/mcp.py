@@ -8,14 +8,14 @@ from urllib.parse import urlparse
 import httpx
 from rich.table import Table
 from textual import work
-from textual.containers import VerticalScroll
-from textual.widgets import Static
+
+from tui.widgets import MessageLog
 
 
 class MCP:
     """Command handler for _handle_mcp_command and all _mcp_* helpers."""
 
-    server_url: str
+    http: httpx.AsyncClient
     model_name: str
     project_id: str | None
     _current_worker: object
@@ -65,13 +65,13 @@ class MCP:
 
         try:
             payload = {"server_type": "remote", "server_url": server_url}
-            async with httpx.AsyncClient(timeout=60) as client:
-                resp = await client.post(
-                    f"{self.server_url}/v1/projects/{self.project_id}/mcp/register",
-                    json=payload,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self.http.post(
+                f"/v1/projects/{self.project_id}/mcp/register",
+                json=payload,
+                timeout=60,
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             if data.get("auth_type") == "oauth":
                 auth_url = data.get("auth_url")
@@ -116,18 +116,17 @@ class MCP:
             payload: dict = {"server_type": "local", "name": name}
             if args:
                 payload["args"] = args
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(
-                    f"{self.server_url}/v1/projects/{self.project_id}/mcp/register",
-                    json=payload,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                server = data.get("server", {})
-                tool_count = len(server.get("tools", []))
-                self._append_system(
-                    f"MCP server registered: {server.get('name', name)} ({tool_count} tools)"
-                )
+            resp = await self.http.post(
+                f"/v1/projects/{self.project_id}/mcp/register",
+                json=payload,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            server = data.get("server", {})
+            tool_count = len(server.get("tools", []))
+            self._append_system(
+                f"MCP server registered: {server.get('name', name)} ({tool_count} tools)"
+            )
         except httpx.HTTPStatusError as e:
             detail = ""
             try:
@@ -146,12 +145,11 @@ class MCP:
         """List registered MCP servers."""
         self._set_loading("Fetching MCP servers...")
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(
-                    f"{self.server_url}/v1/projects/{self.project_id}/mcp"
-                )
-                resp.raise_for_status()
-                servers = resp.json().get("servers", [])
+            resp = await self.http.get(
+                f"/v1/projects/{self.project_id}/mcp", timeout=10
+            )
+            resp.raise_for_status()
+            servers = resp.json().get("servers", [])
             if not servers:
                 self._append_system("No MCP servers registered")
                 return
@@ -173,8 +171,8 @@ class MCP:
                     tool_names,
                     "yes" if s.get("enabled") else "no",
                 )
-            log = self.query_one("#chat-log", VerticalScroll)
-            log.mount(Static(table, classes="system-msg"))
+            log = self.query_one("#chat-log", MessageLog)
+            log.append(table, "system-msg")
             log.scroll_end(animate=False)
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
@@ -192,23 +190,22 @@ class MCP:
 
         self._set_loading("Removing MCP server...")
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(
-                    f"{self.server_url}/v1/projects/{self.project_id}/mcp"
-                )
-                resp.raise_for_status()
-                servers = resp.json().get("servers", [])
-
-                if index < 1 or index > len(servers):
-                    self._append_system(f"Invalid index {index}. Servers have {len(servers)} entries.")
-                    return
+            resp = await self.http.get(
+                f"/v1/projects/{self.project_id}/mcp", timeout=10
+            )
+            resp.raise_for_status()
+            servers = resp.json().get("servers", [])
+
+            if index < 1 or index > len(servers):
+                self._append_system(f"Invalid index {index}. Servers have {len(servers)} entries.")
+                return
 
-                server = servers[index - 1]
-                del_resp = await client.delete(
-                    f"{self.server_url}/v1/projects/{self.project_id}/mcp/{server['id']}"
-                )
-                del_resp.raise_for_status()
-                self._append_system(f"Removed MCP server: {server['name']}")
+            server = servers[index - 1]
+            del_resp = await self.http.delete(
+                f"/v1/projects/{self.project_id}/mcp/{server['id']}", timeout=10
+            )
+            del_resp.raise_for_status()
+            self._append_system(f"Removed MCP server: {server['name']}")
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
         finally:
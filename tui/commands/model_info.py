@@ -5,25 +5,23 @@ from __future__ import annotations
 import httpx
 from rich.table import Table
 from textual import work
-from textual.containers import VerticalScroll
-from textual.widgets import Static
 
 from smartloop.utils.device_utils import get_device_config
+from tui.widgets import MessageLog
 
 
 class ModelInfo:
     """Command handler for _model_info."""
 
-    server_url: str
+    http: httpx.AsyncClient
 
     @work(exclusive=True)
     async def _model_info(self) -> None:
         """Show current model info from the health endpoint."""
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                resp = await client.get(f"{self.server_url}/health")
-                resp.raise_for_status()
-                health = resp.json()
+            resp = await self.http.get("/health", timeout=5)
+            resp.raise_for_status()
+            health = resp.json()
 
             device_config = get_device_config()
             device_type = device_config.device.type.upper()
@@ -59,8 +57,8 @@ class ModelInfo:
             table.add_row("Size", size_label)
             table.add_row("Memory", pressure)
 
-            log = self.query_one("#chat-log", VerticalScroll)
-            log.mount(Static(table, classes="system-msg"))
+            log = self.query_one("#chat-log", MessageLog)
+            log.append(table, "system-msg")
             log.scroll_end(animate=False)
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Failed to fetch model info")
@@ -5,14 +5,14 @@ from __future__ import annotations
 import httpx
 from rich.table import Table
 from textual import work
-from textual.containers import VerticalScroll
-from textual.widgets import Static
+
+from tui.widgets import MessageLog
 
 
 class Project:
     """Command handler for _handle_project_command and all _project_* helpers."""
 
-    server_url: str
+    http: httpx.AsyncClient
     model_name: str
     project_id: str | None
     title: str
@@ -47,37 +47,38 @@ class Project:
         """Create a new project, reload the model to pick it up."""
         self._set_loading("Creating project...")
         try:
-            async with httpx.AsyncClient(timeout=120) as client:
-                resp = await client.post(
-                    f"{self.server_url}/v1/projects",
-                    json={"name": name},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                project_id = data.get("id")
-                project_name = data.get("name", name)
-                self.model_name = data.get("model_name", self.model_name)
-
-                # Unload and reload model so it picks up the new project
-                self._update_loading("Reloading model...")
-                await client.post(f"{self.server_url}/v1/models/unload")
-                load_resp = await client.post(
-                    f"{self.server_url}/v1/models/load",
-                    json={"project_id": project_id},
-                )
-                load_resp.raise_for_status()
-
-                # Update model name from what the server actually loaded
-                health_resp = await client.get(f"{self.server_url}/health")
-                if health_resp.is_success:
-                    loaded_model = health_resp.json().get("model_name")
-                    if loaded_model:
-                        self.model_name = loaded_model
-
-                self.project_id = project_id
-                self.title = project_name
-                self._refresh_info_bar()
-                self._append_system(f"Project created: {project_name}")
+            resp = await self.http.post(
+                "/v1/projects",
+                json={"name": name},
+                timeout=120,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            project_id = data.get("id")
+            project_name = data.get("name", name)
+            self.model_name = data.get("model_name", self.model_name)
+
+            # Unload and reload model so it picks up the new project
+            self._update_loading("Reloading model...")
+            await self.http.post("/v1/models/unload", timeout=120)
+            load_resp = await self.http.post(
+                "/v1/models/load",
+                json={"project_id": project_id},
+                timeout=120,
+            )
+            load_resp.raise_for_status()
+
+            # Update model name from what the server actually loaded
+            health_resp = await self.http.get("/health", timeout=5)
+            if health_resp.is_success:
+                loaded_model = health_resp.json().get("model_name")
+                if loaded_model:
+                    self.model_name = loaded_model
+
+            self.project_id = project_id
+            self.title = project_name
+            self._refresh_info_bar()
+            self._append_system(f"Project created: {project_name}")
         except httpx.HTTPStatusError as e:
             detail = ""
             try:
@@ -95,10 +96,9 @@ class Project:
         """List all projects."""
         self._set_loading("Fetching projects...")
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(f"{self.server_url}/v1/projects")
-                resp.raise_for_status()
-                projects = resp.json().get("projects", [])
+            resp = await self.http.get("/v1/projects", timeout=10)
+            resp.raise_for_status()
+            projects = resp.json().get("projects", [])
             if not projects:
                 self._append_system("No projects found")
                 return
@@ -114,8 +114,8 @@ class Project:
                     p.get("model_name", ""),
                     "yes" if p.get("current") else "",
                 )
-            log = self.query_one("#chat-log", VerticalScroll)
-            log.mount(Static(table, classes="system-msg"))
+            log = self.query_one("#chat-log", MessageLog)
+            log.append(table, "system-msg")
             log.scroll_end(animate=False)
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
@@ -133,36 +133,35 @@ class Project:
 
         self._set_loading("Switching project...")
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(f"{self.server_url}/v1/projects")
-                resp.raise_for_status()
-                projects = resp.json().get("projects", [])
-
-                if index < 1 or index > len(projects):
-                    self._append_system(f"Invalid index {index}. Projects have {len(projects)} entries.")
-                    return
-
-                project = projects[index - 1]
-
-                self._update_loading("Loading model...")
-                load_resp = await client.post(
-                    f"{self.server_url}/v1/models/load",
-                    json={"mode": "inference", "project_id": project["id"]},
-                    timeout=300,
-                )
-                load_resp.raise_for_status()
+            resp = await self.http.get("/v1/projects")
+            resp.raise_for_status()
+            projects = resp.json().get("projects", [])
 
-                # Update model name from what the server actually loaded
-                health_resp = await client.get(f"{self.server_url}/health")
-                if health_resp.is_success:
-                    loaded_model = health_resp.json().get("model_name")
-                    if loaded_model:
-                        self.model_name = loaded_model
+            if index < 1 or index > len(projects):
+                self._append_system(f"Invalid index {index}. Projects have {len(projects)} entries.")
+                return
 
-                self.project_id = project["id"]
-                self.title = project.get("name", "project_name")
-                self._refresh_info_bar()
-                self._append_system(f"Switched to project: {project.get('name', project['id'])}")
+            project = projects[index - 1]
+
+            self._update_loading("Loading model...")
+            load_resp = await self.http.post(
+                "/v1/models/load",
+                json={"mode": "inference", "project_id": project["id"]},
+                timeout=300,
+            )
+            load_resp.raise_for_status()
+
+            # Update model name from what the server actually loaded
+            health_resp = await self.http.get("/health", timeout=5)
+            if health_resp.is_success:
+                loaded_model = health_resp.json().get("model_name")
+                if loaded_model:
+                    self.model_name = loaded_model
+
+            self.project_id = project["id"]
+            self.title = project.get("name", "project_name")
+            self._refresh_info_bar()
+            self._append_system(f"Switched to project: {project.get('name', project['id'])}")
         except httpx.HTTPStatusError as e:
             detail = ""
             try:
@@ -186,29 +185,28 @@ class Project:
 
         self._set_loading("Removing project...")
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(f"{self.server_url}/v1/projects")
-                resp.raise_for_status()
-                projects = resp.json().get("projects", [])
-
-                if index < 1 or index > len(projects):
-                    self._append_system(f"Invalid index {index}. Projects have {len(projects)} entries.")
-                    return
-
-                project = projects[index - 1]
-                if project.get("system"):
-                    self._append_system("System projects cannot be removed")
-                    return
-
-                del_resp = await client.delete(f"{self.server_url}/v1/projects/{project['id']}")
-                del_resp.raise_for_status()
-                self._append_system(f"Removed project: {project.get('name', project['id'])}")
-
-                # If we deleted the active project, reset the title
-                if project.get("id") == self.project_id:
-                    self.project_id = None
-                    self.title = "project_name"
-                    self._refresh_info_bar()
+            resp = await self.http.get("/v1/projects")
+            resp.raise_for_status()
+            projects = resp.json().get("projects", [])
+
+            if index < 1 or index > len(projects):
+                self._append_system(f"Invalid index {index}. Projects have {len(projects)} entries.")
+                return
+
+            project = projects[index - 1]
+            if project.get("system"):
+                self._append_system("System projects cannot be removed")
+                return
+
+            del_resp = await self.http.delete(f"/v1/projects/{project['id']}")
+            del_resp.raise_for_status()
+            self._append_system(f"Removed project: {project.get('name', project['id'])}")
+
+            # If we deleted the active project, reset the title
+            if project.get("id") == self.project_id:
+                self.project_id = None
+                self.title = "project_name"
+                self._refresh_info_bar()
         except httpx.HTTPStatusError as e:
             detail = ""
             try:
@@ -7,13 +7,13 @@ import httpx
 from textual import work
 
 from rich.table import Table
-from textual.containers import VerticalScroll
-from textual.widgets import Static
+
+from tui.widgets import MessageLog
 
 class Rule:
     """Command handler for _handle_rule_command and all _rule_* helpers."""
 
-    server_url: str
+    http: httpx.AsyncClient
 
     def _handle_rule_command(self, args: str) -> None:
         """Dispatch /rule sub-commands."""
@@ -42,30 +42,29 @@ class Rule:
             return
         self._set_loading("Updating rules...")
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                rules = await self._get_rules(client)
+            rules = await self._get_rules()
 
-                if any(r.get("content") == rule_text for r in rules):
-                    self._append_system("This rule already exists.")
-                    return 
+            if any(r.get("content") == rule_text for r in rules):
+                self._append_system("This rule already exists.")
+                return 
 
-                rules.append({"content": rule_text})
+            rules.append({"content": rule_text})
         
-                resp = await client.patch(
-                    f"{self.server_url}/v1/projects/{self.project_id}",
-                    json={"rules": rules},
-                )
-                resp.raise_for_status()
-                self._append_system("New rule added")
+            resp = await self.http.patch(
+                f"/v1/projects/{self.project_id}",
+                json={"rules": rules},
+            )
+            resp.raise_for_status()
+            self._append_system("New rule added")
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
         finally:
             self._clear_loading()
 
 
-    async def _get_rules(self, client: httpx.AsyncClient) -> list[dict]:
+    async def _get_rules(self) -> list[dict]:
         """Helper to fetch current rules for the project."""
-        resp = await client.get(f"{self.server_url}/v1/projects")
+        resp = await self.http.get("/v1/projects")
         resp.raise_for_status()
         for p in resp.json().get("projects", []):
             if p.get("id") == self.project_id:
@@ -80,8 +79,7 @@ class Rule:
             return
         self._set_loading("Fetching rules...")
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                rules = await self._get_rules(client)
+            rules = await self._get_rules()
 
             if not rules:
                 self._append_system("No rules are set")
@@ -92,8 +90,8 @@ class Rule:
             table.add_column("Description")
             for i, r in enumerate(rules, 1):
                 table.add_row(str(i), r.get("content", ""))
-            log = self.query_one("#chat-log", VerticalScroll)
-            log.mount(Static(table, classes="system-msg"))
+            log = self.query_one("#chat-log", MessageLog)
+            log.append(table, "system-msg")
             log.scroll_end(animate=False)
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
@@ -113,18 +111,17 @@ class Rule:
             return
         self._set_loading("Updating rules...")
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                rules = await self._get_rules(client)
-                if index < 1 or index > len(rules):
-                    self._append_system(f"Invalid index {index}. Use /rule list to see available rules.")
-                    return
-                rules.pop(index - 1)
-                resp = await client.patch(
-                    f"{self.server_url}/v1/projects/{self.project_id}",
-                    json={"rules": rules},
-                )
-                resp.raise_for_status()
-                self._append_system(f"Rule {index} removed")
+            rules = await self._get_rules()
+            if index < 1 or index > len(rules):
+                self._append_system(f"Invalid index {index}. Use /rule list to see available rules.")
+                return
+            rules.pop(index - 1)
+            resp = await self.http.patch(
+                f"/v1/projects/{self.project_id}",
+                json={"rules": rules},
+            )
+            resp.raise_for_status()
+            self._append_system(f"Rule {index} removed")
         except (httpx.RequestError, httpx.HTTPStatusError):
             self._append_system("Request failed")
         finally:
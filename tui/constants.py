@@ -1,10 +1,12 @@
 """tui/constants.py — Slash command registry (single source of truth)."""
 
 SLASH_COMMANDS = [
-    ("/attach <path>", "Attach a file to the next message"),
-    ("/document add <path>", "Add a document to the project"),
+    ("/attach <path|glob>...", "Attach files to the next message"),
+    ("/document add <path|dir|glob>...", "Add documents to the project"),
     ("/document list", "List project documents"),
     ("/document remove <#>", "Remove a document by index"),
+    ("/document watch <dir>...", "Keep adding changed files and removing deleted ones"),
+    ("/document unwatch", "Stop watching directories"),
     ("/mcp add <url>", "Register a remote MCP server"),
     ("/mcp add local <name> [args]", "Register a local MCP server"),
     ("/mcp list", "List registered MCP servers"),
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-import httpx
+from tui.sse import ServerSentEvent, aiter_sse, iter_sse
+
+if TYPE_CHECKING:
+    import httpx
 
 
 # ---------------------------------------------------------------------------
@@ -78,81 +81,138 @@ class BootstrapError:
 BootstrapEvent = BootstrapProgress | BootstrapStatus | BootstrapComplete | BootstrapError
 
 
+# ---------------------------------------------------------------------------
+# Document ingestion SSE events
+# ---------------------------------------------------------------------------
+
+@dataclass
+class DocumentProgress:
+    """A processing stage for one source (parsing, chunking, embedding …)."""
+    stage: str
+    filename: str
+
+
+@dataclass
+class DocumentComplete:
+    """Ingestion finished; ``documents`` is empty when nothing new was added."""
+    documents: list[dict]
+
+
+@dataclass
+class DocumentError:
+    """Ingestion failed on the server."""
+    message: str
+
+
+DocumentEvent = DocumentProgress | DocumentComplete | DocumentError
+
+
 # ---------------------------------------------------------------------------
 # Parsers
 # ---------------------------------------------------------------------------
 
-async def parse_bootstrap_sse(response: httpx.Response):
-    """Async generator that yields typed events from a bootstrap SSE stream.
+def bootstrap_event(sse: ServerSentEvent) -> BootstrapEvent | None:
+    """Map one raw SSE event from /v1/bootstrap (or /v1/init) to a typed event.
 
-    Bootstrap SSE uses ``event: <type>\\ndata: <json>\\n\\n`` format.
+    Bootstrap SSE uses ``event: <type>\\ndata: <json>\\n\\n`` format; events
+    without a type are progress/status updates.
     """
-    current_event_type: str | None = None
-    async for raw_line in response.aiter_lines():
-        if raw_line.startswith("event: "):
-            current_event_type = raw_line[7:].strip()
-            continue
-        if not raw_line.startswith("data: "):
-            if raw_line.strip() == "":
-                current_event_type = None
-            continue
-        try:
-            data = json.loads(raw_line[6:])
-        except json.JSONDecodeError:
-            continue
+    try:
+        data = sse.json()
+    except ValueError:
+        return None
+
+    if sse.event == "error":
+        return BootstrapError(message=data.get("message", "Unknown error"))
+    if sse.event == "complete":
+        return BootstrapComplete(
+            model_name=data.get("model_name", ""),
+            project=data.get("project"),
+        )
+    if "downloaded" in data and "total" in data:
+        return BootstrapProgress(
+            filename=data.get("filename", ""),
+            downloaded=data["downloaded"],
+            total=data["total"],
+        )
+    return BootstrapStatus(
+        status=data.get("status", ""),
+        message=data.get("message", ""),
+    )
+
+
+def document_event(sse: ServerSentEvent) -> DocumentEvent | None:
+    """Map one raw SSE event from ``POST /v1/projects/{id}/documents``."""
+    try:
+        data = sse.json()
+    except ValueError:
+        return None
+    if sse.event == "progress":
+        return DocumentProgress(stage=data.get("stage", "processing"), filename=data.get("filename", ""))
+    if sse.event == "complete":
+        return DocumentComplete(documents=data.get("documents", []))
+    if sse.event == "error":
+        return DocumentError(message=data.get("message") or data.get("detail") or "Unknown error")
+    return None
+
+
+def chat_event(sse: ServerSentEvent) -> SSEEvent | None:
+    """Map one raw SSE event from /v1/chat/completions to a typed event."""
+    if sse.raw == b"[DONE]":
+        return SSEDone()
+    try:
+        chunk = sse.json()
+    except ValueError:
+        return None
+
+    obj = chunk.get("object")
+    if obj == "chat.status":
+        return SSEStatus(
+            step=chunk.get("step", ""),
+            status=chunk.get("status", ""),
+            message=chunk.get("message", ""),
+        )
+    if obj == "chat.usage":
+        return SSEUsage(
+            prompt_tokens=chunk.get("prompt_tokens", 0),
+            completion_tokens=chunk.get("completion_tokens", 0),
+            total_tokens=chunk.get("total_tokens", 0),
+            max_context_tokens=chunk.get("max_context_tokens", 0),
+        )
+    choices = chunk.get("choices")
+    if choices and choices[0].get("delta"):
+        content = choices[0]["delta"].get("content", "")
+        if content:
+            return SSEContent(text=content)
+    return None
 
-        event_type = current_event_type or "progress"
-
-        if event_type == "error":
-            yield BootstrapError(message=data.get("message", "Unknown error"))
-        elif event_type == "complete":
-            yield BootstrapComplete(
-                model_name=data.get("model_name", ""),
-                project=data.get("project"),
-            )
-        elif "downloaded" in data and "total" in data:
-            yield BootstrapProgress(
-                filename=data.get("filename", ""),
-                downloaded=data["downloaded"],
-                total=data["total"],
-            )
-        else:
-            yield BootstrapStatus(
-                status=data.get("status", ""),
-                message=data.get("message", ""),
-            )
-
-        current_event_type = None
+
+async def parse_bootstrap_sse(response: httpx.Response):
+    """Async generator that yields typed events from a bootstrap SSE stream."""
+    async for sse in aiter_sse(response.aiter_bytes()):
+        event = bootstrap_event(sse)
+        if event is not None:
+            yield event
 
 
 async def parse_sse_stream(response: httpx.Response):
     """Async generator that yields typed SSE events from a streaming response."""
-    async for raw_line in response.aiter_lines():
-        if not raw_line.startswith("data: "):
+    async for sse in aiter_sse(response.aiter_bytes()):
+        event = chat_event(sse)
+        if event is None:
             continue
-        data = raw_line[6:]
-        if data == "[DONE]":
-            yield SSEDone()
+        yield event
+        if isinstance(event, SSEDone):
             return
-        try:
-            chunk = json.loads(data)
-        except json.JSONDecodeError:
-            continue
 
-        if chunk.get("object") == "chat.status":
-            yield SSEStatus(
-                step=chunk.get("step", ""),
-                status=chunk.get("status", ""),
-                message=chunk.get("message", ""),
-            )
-        elif chunk.get("object") == "chat.usage":
-            yield SSEUsage(
-                prompt_tokens=chunk.get("prompt_tokens", 0),
-                completion_tokens=chunk.get("completion_tokens", 0),
-                total_tokens=chunk.get("total_tokens", 0),
-                max_context_tokens=chunk.get("max_context_tokens", 0),
-            )
-        elif chunk.get("choices") and chunk["choices"][0].get("delta"):
-            content = chunk["choices"][0]["delta"].get("content", "")
-            if content:
-                yield SSEContent(text=content)
+
+def iter_chat_events(chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+    """Synchronous counterpart of :func:`parse_sse_stream` for raw byte chunks
+    (e.g. ``requests.Response.iter_content(None)``)."""
+    for sse in iter_sse(chunks):
+        event = chat_event(sse)
+        if event is None:
+            continue
+        yield event
+        if isinstance(event, SSEDone):
+            return
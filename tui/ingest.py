@@ -0,0 +1,125 @@
+"""Source expansion and bookkeeping for bulk document ingestion.
+
+Shared by ``slp add`` and ``/document add``: arguments may be files,
+directories (walked recursively), glob patterns or URLs; each resolved file
+is submitted as its own ``source`` so several can be processed in parallel.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+# Parallel document submissions by default.
+DEFAULT_JOBS = 4
+
+HASH_CHUNK_SIZE = 1 << 20
+
+_URL_PREFIXES = ("http://", "https://")
+_GLOB_CHARS = set("*?[")
+
+
+def is_url(source: str) -> bool:
+    return source.startswith(_URL_PREFIXES)
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of *path*, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _matches(rel_path: str, patterns: tuple[str, ...]) -> bool:
+    name = rel_path.rsplit("/", 1)[-1]
+    return any(fnmatch(rel_path, p) or fnmatch(name, p) for p in patterns)
+
+
+def accepts(rel_path: str, include: tuple[str, ...] = (), exclude: tuple[str, ...] = ()) -> bool:
+    """True if *rel_path* passes the --include / --exclude patterns."""
+    if include and not _matches(rel_path, include):
+        return False
+    return not (exclude and _matches(rel_path, exclude))
+
+
+def _walk(root: Path, recursive: bool):
+    """Yield files under *root*, skipping hidden files and directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".")) if recursive else []
+        for name in sorted(filenames):
+            if not name.startswith("."):
+                yield Path(dirpath) / name
+
+
+def expand_sources(
+    args: list[str],
+    include: tuple[str, ...] = (),
+    exclude: tuple[str, ...] = (),
+    recursive: bool = True,
+) -> tuple[list[str], list[str]]:
+    """Resolve *args* into ``(sources, missing)``.
+
+    Files come back as absolute paths, URLs unchanged, in argument order and
+    without duplicates.  *include* / *exclude* are fnmatch patterns checked
+    against the file name and its path relative to the directory or glob it
+    came from; they do not filter files or URLs named explicitly.
+    """
+    sources: dict[str, None] = {}
+    missing: list[str] = []
+
+    def add(path: Path, rel: str) -> None:
+        if accepts(rel, include, exclude):
+            sources[str(path.resolve())] = None
+
+    for arg in args:
+        if is_url(arg):
+            sources[arg] = None
+            continue
+        path = Path(arg).expanduser()
+        if path.is_file():
+            sources[str(path.resolve())] = None
+        elif path.is_dir():
+            for file in _walk(path, recursive):
+                add(file, file.relative_to(path).as_posix())
+        elif _GLOB_CHARS & set(arg):
+            matches = sorted(glob.glob(str(path), recursive=recursive))
+            files = [Path(m) for m in matches if Path(m).is_file()]
+            if not files:
+                missing.append(arg)
+            for file in files:
+                add(file, file.as_posix())
+        else:
+            missing.append(arg)
+    return list(sources), missing
+
+
+@dataclass
+class IngestSummary:
+    """Per-source outcomes of a bulk add: added, skipped (already present) or failed."""
+    total: int = 0
+    added: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    documents: list[dict] = field(default_factory=list)
+
+    @property
+    def done(self) -> int:
+        return len(self.added) + len(self.skipped) + len(self.failed)
+
+    def record(self, source: str, documents: list[dict] | None, error: str | None = None) -> None:
+        if error is not None:
+            self.failed.append((source, error))
+        elif documents:
+            self.added.append(source)
+            self.documents.extend(documents)
+        else:
+            self.skipped.append(source)
+
+    def counts(self) -> str:
+        return f"{len(self.added)} added, {len(self.skipped)} skipped, {len(self.failed)} failed"
@@ -0,0 +1,177 @@
+"""Document manifest — what was ingested from which local file, per project.
+
+Shared by ``slp sync``/``slp add --watch`` and ``/document watch``.
+``<home_dir>/manifests/<project_id>.json`` maps each ingested path to
+its size, mtime, SHA-256 and the server document ids it produced.  A file
+whose size and mtime match its entry is unchanged without being read; only
+files whose stat changed are hashed, so a re-sync costs what changed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from tui.ingest import file_sha256
+
+MANIFESTS_DIRNAME = "manifests"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class FileState:
+    """Size, mtime and content hash of one local file."""
+    size: int
+    mtime_ns: int
+    sha256: str = ""
+
+    @classmethod
+    def stat(cls, path: str) -> "FileState":
+        st = os.stat(path)
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+    @classmethod
+    def read(cls, path: str) -> "FileState":
+        """Stat and hash *path* (stat first, so a concurrent write shows up as a change next time)."""
+        state = cls.stat(path)
+        state.sha256 = file_sha256(path)
+        return state
+
+
+def read_state(path: str) -> FileState | None:
+    try:
+        return FileState.read(path)
+    except OSError:
+        return None
+
+
+@dataclass
+class ManifestEntry:
+    size: int
+    mtime_ns: int
+    sha256: str
+    doc_ids: list[str] = field(default_factory=list)
+
+
+class Manifest:
+    """Per-project ``path -> ManifestEntry`` map stored as JSON."""
+
+    def __init__(self, path: Path, entries: dict[str, ManifestEntry] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = entries or {}
+
+    @classmethod
+    def load(cls, home_dir: str | Path, project_id: str) -> "Manifest":
+        path = Path(home_dir) / MANIFESTS_DIRNAME / f"{project_id}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entries = {p: ManifestEntry(**e) for p, e in data.get("files", {}).items()}
+        except (OSError, ValueError, TypeError):
+            entries = {}
+        return cls(path, entries)
+
+    def save(self) -> None:
+        """Write atomically, so an interrupted run never leaves a torn manifest."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "files": {p: asdict(e) for p, e in sorted(self.entries.items())}}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def get(self, path: str) -> ManifestEntry | None:
+        return self.entries.get(path)
+
+    def stat_matches(self, path: str, state: FileState) -> bool:
+        """True when *path* has an entry with the same size and mtime."""
+        entry = self.entries.get(path)
+        return entry is not None and entry.size == state.size and entry.mtime_ns == state.mtime_ns
+
+    def record(self, path: str, state: FileState, doc_ids: list[str]) -> None:
+        self.entries[path] = ManifestEntry(state.size, state.mtime_ns, state.sha256, list(doc_ids))
+
+    def touch(self, path: str, state: FileState) -> None:
+        """Content unchanged but stat differs (e.g. ``touch``, checkout): keep ids, refresh stat."""
+        entry = self.entries[path]
+        entry.size, entry.mtime_ns = state.size, state.mtime_ns
+
+    def forget(self, path: str) -> ManifestEntry | None:
+        return self.entries.pop(path, None)
+
+    def under(self, root: Path) -> list[str]:
+        """Recorded paths inside directory *root*."""
+        prefix = str(root).rstrip(os.sep) + os.sep
+        return [p for p in self.entries if p.startswith(prefix)]
+
+
+class SyncPlan:
+    """What a sync will do, worked out before anything is uploaded."""
+
+    def __init__(self) -> None:
+        self.new: list[str] = []
+        self.modified: list[str] = []
+        self.deleted: list[str] = []
+        self.unchanged = 0
+        self.adopted = 0
+
+    @property
+    def tasks(self) -> list[tuple[str, str]]:
+        return (
+            [("delete", p) for p in self.deleted]
+            + [("modify", p) for p in self.modified]
+            + [("add", p) for p in self.new]
+        )
+
+
+def plan_sync(files: list[str], removed: list[str], manifest: Manifest,
+              server_docs: dict[str, list[str]], jobs: int) -> SyncPlan:
+    """Compare *files* with the manifest and the server's ``path -> [document id]``.
+
+    Only files whose stat changed are hashed; a file the server already has
+    but the manifest does not is adopted rather than uploaded again.
+    *removed* are paths (files or directories) whose recorded documents go
+    if they no longer exist.
+    """
+    plan = SyncPlan()
+    live_ids = {i for ids in server_docs.values() for i in ids}
+    to_hash: list[str] = []
+    for path in files:
+        entry = manifest.get(path)
+        if entry is not None and not (entry.doc_ids and set(entry.doc_ids) <= live_ids):
+            manifest.forget(path)  # Removed on the server since the last sync.
+            entry = None
+        try:
+            state = FileState.stat(path)
+        except OSError:
+            continue  # Removed since it was listed.
+        if entry is not None and manifest.stat_matches(path, state):
+            plan.unchanged += 1
+        elif entry is not None or path in server_docs:
+            to_hash.append(path)
+        else:
+            plan.new.append(path)
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="slp-hash") as pool:
+        for path, state in zip(to_hash, pool.map(read_state, to_hash)):
+            entry = manifest.get(path)
+            if state is None:
+                continue
+            if entry is None:
+                # On the server but not in the manifest (added before it existed).
+                manifest.record(path, state, server_docs[path])
+                plan.adopted += 1
+            elif entry.sha256 == state.sha256:
+                manifest.touch(path, state)
+                plan.unchanged += 1
+            else:
+                plan.modified.append(path)
+
+    gone: dict[str, None] = {}
+    for path in removed:
+        for recorded in ([path] if manifest.get(path) else []) + manifest.under(Path(path)):
+            if not os.path.isfile(recorded):
+                gone[recorded] = None
+    plan.deleted = list(gone)
+    return plan
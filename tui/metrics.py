@@ -0,0 +1,143 @@
+"""StreamTimings — client-side latency metrics for one streamed completion.
+
+Chunk count over wall time mixes retrieval, prefill and decode into one
+number.  These timings split them:
+
+* **retrieval** — request sent until the last status event before the first
+  token (RAG lookups and other server-side steps reported via SSE status);
+* **TTFT** — request sent until the first content chunk;
+* **prefill** — TTFT minus retrieval; prompt tok/s uses it;
+* **decode** — first to last content chunk; decode tok/s uses the server's
+  ``completion_tokens`` when it sends usage, else the chunk count;
+* **ITL** — the gaps between successive content chunks (p50 / p95).
+"""
+
+from __future__ import annotations
+
+import time
+
+from tui.events import SSEContent, SSEStatus, SSEUsage
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class StreamTimings:
+    """Feed every SSE event of a reply to :meth:`observe`, then read the metrics."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.chunks = 0
+        self.usage: SSEUsage | None = None
+        self.retrieval_s: float | None = None
+        self.first_token_s: float | None = None
+        self.last_token_s: float | None = None
+        self.end_s: float | None = None
+        self._gaps: list[float] = []
+
+    def observe(self, event) -> None:
+        now = time.perf_counter() - self.start
+        if isinstance(event, SSEContent):
+            if self.first_token_s is None:
+                self.first_token_s = now
+            else:
+                self._gaps.append(now - self.last_token_s)
+            self.last_token_s = now
+            self.chunks += 1
+        elif isinstance(event, SSEStatus):
+            if self.first_token_s is None:
+                self.retrieval_s = now
+        elif isinstance(event, SSEUsage):
+            self.usage = event
+
+    def finish(self) -> None:
+        self.end_s = time.perf_counter() - self.start
+
+    # -- derived metrics ------------------------------------------------------
+
+    @property
+    def total_s(self) -> float:
+        return self.end_s if self.end_s is not None else time.perf_counter() - self.start
+
+    @property
+    def completion_tokens(self) -> int:
+        """Server-reported completion tokens, else the number of content chunks."""
+        if self.usage and self.usage.completion_tokens:
+            return self.usage.completion_tokens
+        return self.chunks
+
+    @property
+    def prefill_s(self) -> float | None:
+        if self.first_token_s is None:
+            return None
+        return self.first_token_s - (self.retrieval_s or 0.0)
+
+    @property
+    def decode_s(self) -> float | None:
+        if self.first_token_s is None or self.last_token_s is None:
+            return None
+        return self.last_token_s - self.first_token_s
+
+    @property
+    def decode_tok_s(self) -> float | None:
+        # The first token belongs to prefill; the rest arrive during decode.
+        decode_s = self.decode_s
+        if not decode_s or self.completion_tokens < 2:
+            return None
+        return (self.completion_tokens - 1) / decode_s
+
+    @property
+    def prompt_tok_s(self) -> float | None:
+        prefill_s = self.prefill_s
+        if not prefill_s or not self.usage or not self.usage.prompt_tokens:
+            return None
+        return self.usage.prompt_tokens / prefill_s
+
+    def itl(self) -> tuple[float, float] | None:
+        """``(p50, p95)`` inter-chunk latency in seconds, or None below two chunks."""
+        if not self._gaps:
+            return None
+        gaps = sorted(self._gaps)
+        return percentile(gaps, 50), percentile(gaps, 95)
+
+    # -- presentation ---------------------------------------------------------
+
+    def as_dict(self) -> dict:
+        """Rounded metrics for JSON output (seconds, tokens per second)."""
+        def r(value: float | None, digits: int = 4) -> float | None:
+            return round(value, digits) if value is not None else None
+
+        itl = self.itl()
+        return {
+            "total_s": r(self.total_s),
+            "retrieval_s": r(self.retrieval_s),
+            "first_token_s": r(self.first_token_s),
+            "prefill_s": r(self.prefill_s),
+            "decode_s": r(self.decode_s),
+            "chunks": self.chunks,
+            "completion_tokens": self.completion_tokens,
+            "itl_p50_s": r(itl[0]) if itl else None,
+            "itl_p95_s": r(itl[1]) if itl else None,
+            "decode_tok_s": r(self.decode_tok_s, 2),
+            "prompt_tok_s": r(self.prompt_tok_s, 2),
+        }
+
+    def summary(self) -> str:
+        """One-line footer, e.g. ``TTFT 0.42 s · decode 38.1 tok/s · ITL 24/61 ms``."""
+        if self.first_token_s is None:
+            return f"no tokens · {self.total_s:.2f} s"
+        ttft = f"TTFT {self.first_token_s:.2f} s"
+        if self.retrieval_s:
+            ttft += f" (retrieval {self.retrieval_s:.2f} s)"
+        parts = [ttft]
+        if self.decode_tok_s is not None:
+            parts.append(f"decode {self.decode_tok_s:.1f} tok/s")
+        itl = self.itl()
+        if itl:
+            parts.append(f"ITL p50 {itl[0] * 1000:.0f} ms / p95 {itl[1] * 1000:.0f} ms")
+        if self.prompt_tok_s is not None:
+            parts.append(f"prefill {self.prompt_tok_s:.0f} tok/s")
+        return " · ".join(parts)
@@ -0,0 +1,144 @@
+"""tui/render.py — Frame-coalesced rendering of streamed replies.
+
+Tokens can arrive far faster than a terminal can repaint.  Instead of touching
+widgets for every chunk, streamed text is buffered and a
+:class:`FrameScheduler` flushes it to the screen at a fixed frame rate, so
+each frame costs one widget update however many chunks arrived.
+:class:`MarkdownBlocks` splits a streaming reply into finished markdown
+blocks so only the trailing, still-open block is re-rendered per frame.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable
+
+# Target repaint rate while a reply is streaming.
+RENDER_FPS = 30
+
+
+class FrameScheduler:
+    """Call *render* at most ``fps`` times a second, only when something changed.
+
+    *owner* is any Textual ``MessagePump`` (the app or a widget); its timer
+    drives the frames, so rendering stays on the event loop.
+    """
+
+    def __init__(self, owner, render: Callable[[], None], fps: int = RENDER_FPS) -> None:
+        self._owner = owner
+        self._render = render
+        self._interval = 1 / fps
+        self._timer = None
+        self._dirty = False
+
+    def start(self) -> None:
+        if self._timer is None:
+            self._timer = self._owner.set_interval(self._interval, self._tick, name="frame")
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def _tick(self) -> None:
+        if self._dirty:
+            self._dirty = False
+            self._render()
+
+    def flush(self) -> None:
+        """Render any pending change now (e.g. at the end of the stream)."""
+        self._tick()
+
+    def stop(self) -> None:
+        """Stop the frame timer and drop any unrendered change."""
+        self._dirty = False
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_LIST_ITEM = re.compile(r"^ {0,3}(?:[-*+]|\d{1,9}[.)])(?:\s|$)")
+_HEADING = re.compile(r"^ {0,3}#{1,6}(?:\s|$)")
+
+
+class MarkdownBlocks:
+    """Split streamed markdown into finished top-level blocks.
+
+    :meth:`feed` returns each block (paragraph, heading, code fence, list,
+    table, quote …) as soon as the text that follows proves it complete;
+    :attr:`tail` is the still-open block.  Only whole lines are classified,
+    so the work per chunk is proportional to the chunk, not the reply.
+    """
+
+    __slots__ = ("_lines", "_partial", "_fence", "_blank")
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+        self._partial = ""
+        self._fence: str | None = None
+        self._blank = False
+
+    @property
+    def tail(self) -> str:
+        """The open block, including the incomplete last line."""
+        if self._partial:
+            return "\n".join([*self._lines, self._partial])
+        return "\n".join(self._lines)
+
+    def feed(self, text: str) -> list[str]:
+        if "\n" not in text:
+            self._partial += text
+            return []
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        done: list[str] = []
+        for line in lines:
+            self._line(line, done)
+        return done
+
+    def close(self) -> list[str]:
+        """End of stream: everything left is a finished block."""
+        done: list[str] = []
+        if self._partial:
+            self._line(self._partial, done)
+            self._partial = ""
+        self._emit(done)
+        return done
+
+    def _emit(self, done: list[str]) -> None:
+        if self._lines:
+            done.append("\n".join(self._lines))
+            self._lines = []
+        self._blank = False
+
+    def _line(self, line: str, done: list[str]) -> None:
+        if self._fence is not None:
+            self._lines.append(line)
+            if line.strip().startswith(self._fence) and not line.strip().lstrip(self._fence[0]):
+                self._fence = None
+                self._emit(done)
+            return
+
+        blank = not line.strip()
+        if self._blank:
+            if blank:
+                return
+            if _LIST_ITEM.match(self._lines[0]) and (_LIST_ITEM.match(line) or line[:1] in (" ", "\t")):
+                # A loose list: the blank line separates items of one list.
+                self._lines.append("")
+                self._blank = False
+            else:
+                self._emit(done)
+        elif blank:
+            self._blank = bool(self._lines)
+            return
+
+        fence = _FENCE.match(line)
+        if fence and not (self._lines and line[:1] in (" ", "\t")):
+            self._emit(done)
+            self._fence = fence.group(1)
+            self._lines.append(line)
+        elif _HEADING.match(line):
+            self._emit(done)
+            done.append(line)
+        else:
+            self._lines.append(line)
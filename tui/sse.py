@@ -0,0 +1,150 @@
+"""tui/sse.py — Incremental, byte-level Server-Sent Events parser.
+
+One decoder shared by the CLI (``requests``) and the TUI (``httpx``).  It
+consumes raw byte chunks as they arrive, handles ``\\n`` / ``\\r\\n`` / ``\\r``
+line endings split across chunks, multi-line ``data:`` fields, ``event:``,
+``id:`` and ``retry:``, and keeps the event payload as bytes so JSON can be
+decoded straight from them.  ``orjson`` is used for :meth:`ServerSentEvent.json`
+when it is installed.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+try:
+    import orjson as _orjson
+    json_loads = _orjson.loads
+except ImportError:  # pragma: no cover - optional speed-up
+    json_loads = json.loads
+
+
+@dataclass(slots=True)
+class ServerSentEvent:
+    """One dispatched SSE event; ``raw`` is the joined ``data:`` payload."""
+    raw: bytes
+    event: str = "message"
+    id: str = ""
+    retry: int | None = None
+
+    @property
+    def data(self) -> str:
+        return self.raw.decode("utf-8", "replace")
+
+    def json(self):
+        """Decode the payload as JSON (raises ``ValueError`` on bad input)."""
+        return json_loads(self.raw)
+
+
+class SSEDecoder:
+    """Feed byte chunks in, get complete :class:`ServerSentEvent` objects out."""
+
+    __slots__ = ("_buf", "_data", "_event", "_last_id", "_retry", "_skip_lf")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._data: list[bytes] = []
+        self._event: str | None = None
+        self._last_id = ""
+        self._retry: int | None = None
+        self._skip_lf = False
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Consume *chunk* and return the events it completed (possibly none)."""
+        if self._skip_lf:
+            # The previous chunk ended on "\r"; drop the "\n" of a split "\r\n".
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        buf = self._buf
+        buf += chunk
+        if b"\n" not in chunk and b"\r" not in chunk:
+            return []
+        if b"\r" in buf:
+            self._skip_lf = buf[-1:] == b"\r"
+            text = bytes(buf).replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        else:
+            text = bytes(buf)
+        lines = text.split(b"\n")
+        self._buf = bytearray(lines.pop())
+
+        events: list[ServerSentEvent] = []
+        data = self._data
+        for line in lines:
+            # Fast path: the vast majority of lines are "data: ..." or blank.
+            if line[:5] == b"data:":
+                data.append(line[6:] if line[5:6] == b" " else line[5:])
+            elif not line:
+                if data:
+                    raw = data[0] if len(data) == 1 else b"\n".join(data)
+                    events.append(ServerSentEvent(raw, self._event or "message", self._last_id, self._retry))
+                    data = self._data = []
+                self._event = None
+            else:
+                self._line(line)
+        return events
+
+    def close(self) -> list[ServerSentEvent]:
+        """Flush at end of stream: a trailing line or event without its blank
+        line terminator is still delivered."""
+        events: list[ServerSentEvent] = []
+        if self._buf:
+            event = self._line(bytes(self._buf))
+            self._buf.clear()
+            if event is not None:
+                events.append(event)
+        event = self._line(b"")
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _line(self, line: bytes) -> ServerSentEvent | None:
+        if not line:
+            return self._dispatch()
+        if line[0] == 0x3A:  # ":" comment / keep-alive
+            return None
+        field, sep, value = line.partition(b":")
+        if sep and value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value.decode("utf-8", "replace")
+        elif field == b"id":
+            if b"\0" not in value:
+                self._last_id = value.decode("utf-8", "replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> ServerSentEvent | None:
+        data, event = self._data, self._event
+        self._event = None
+        if not data:
+            return None
+        self._data = []
+        raw = data[0] if len(data) == 1 else b"\n".join(data)
+        return ServerSentEvent(raw, event or "message", self._last_id, self._retry)
+
+
+def iter_sse(chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    """Synchronous front-end, e.g. ``iter_sse(resp.iter_content(None))``."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        if chunk:
+            yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_sse(chunks: AsyncIterable[bytes]) -> AsyncIterator[ServerSentEvent]:
+    """Asynchronous front-end, e.g. ``aiter_sse(response.aiter_bytes())``."""
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        if chunk:
+            for event in decoder.feed(chunk):
+                yield event
+    for event in decoder.close():
+        yield event
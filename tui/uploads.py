@@ -0,0 +1,272 @@
+"""Asset uploads: skipped when the content is already there, else chunked and resumable.
+
+Shared by the CLI (``requests``) and the TUI (``httpx``).  Files larger than
+one part are uploaded in fixed-size parts, each sent with its SHA-256:
+
+    POST /v1/assets/uploads                     {filename, size, sha256, part_size}
+                                                -> {upload_id, part_size, offset}
+    GET  /v1/assets/uploads/{id}                -> {offset, size}
+    PUT  /v1/assets/uploads/{id}/parts/{index}  raw bytes, Content-Range, X-Part-SHA256
+                                                -> {offset}
+    POST /v1/assets/uploads/{id}/complete       -> the asset, as from POST /v1/assets
+
+``offset`` is the number of bytes the server holds, so an interrupted upload
+resumes from the first missing part; when a reply's offset is not the next
+part boundary, sending continues from the server's offset.  Upload ids are remembered per file
+content in ``uploads.json`` under the SLP home directory, which lets a
+later run (or a retry after a dropped connection) pick up where the last one
+stopped.  Servers without the endpoints (404/405 on create) and small files
+use the single multipart ``POST /v1/assets``.
+
+Before anything is sent, the file's digest is looked up so identical
+content is never uploaded (or converted to markdown) twice:
+
+    GET  /v1/assets/{asset_id}                  -> the asset, or 404
+    GET  /v1/assets/by-sha256/{sha256}          -> the asset, or 404
+
+``assets.json`` caches each file's digest by ``(size, mtime)`` and the
+asset id last seen for each digest; the server stays the authority, so a
+cached id is always confirmed before it is reused.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from tui.ingest import file_sha256
+
+UPLOADS_PATH = "/v1/assets/uploads"
+STATE_FILENAME = "uploads.json"
+INDEX_FILENAME = "assets.json"
+
+PART_SIZE = 8 << 20
+# Attempts per part before the upload is abandoned (it can still be resumed).
+MAX_PART_ATTEMPTS = 4
+# Status codes on create meaning the server has no chunked upload support.
+UNSUPPORTED_STATUS = (404, 405)
+
+
+@dataclass
+class UploadFile:
+    """A local file about to be uploaded."""
+    path: Path
+    size: int
+    sha256: str
+
+    @classmethod
+    def open(cls, path: Path, index: "AssetIndex | None" = None) -> "UploadFile":
+        """Stat and hash *path*; the hash comes from *index* when size and mtime match."""
+        st = path.stat()
+        sha256 = index.cached_digest(path, st) if index is not None else None
+        if sha256 is None:
+            sha256 = file_sha256(str(path))
+            if index is not None:
+                index.remember_digest(path, st, sha256)
+        return cls(path=path, size=st.st_size, sha256=sha256)
+
+    @property
+    def lookup_path(self) -> str:
+        return f"/v1/assets/by-sha256/{self.sha256}"
+
+    @property
+    def key(self) -> str:
+        """Identity under which the upload id is remembered."""
+        return f"{self.sha256}:{self.size}:{self.path.name}"
+
+    def create_body(self, part_size: int = PART_SIZE) -> dict:
+        return {"filename": self.path.name, "size": self.size, "sha256": self.sha256, "part_size": part_size}
+
+    def parts(self, offset: int, part_size: int):
+        """Yield ``(index, data, headers)`` for each part from byte *offset* on."""
+        index, offset = divmod(offset, part_size)
+        offset = index * part_size
+        with self.path.open("rb") as fh:
+            fh.seek(offset)
+            while data := fh.read(part_size):
+                end = offset + len(data) - 1
+                yield index, data, {
+                    "Content-Type": "application/octet-stream",
+                    "Content-Range": f"bytes {offset}-{end}/{self.size}",
+                    "X-Part-SHA256": hashlib.sha256(data).hexdigest(),
+                }
+                index += 1
+                offset = end + 1
+
+
+class ChunkedUpload:
+    """The chunked protocol's decisions for one file; the caller does the requests.
+
+    Tracks the upload id, part size and server offset, decides when a
+    remembered upload is resumed or dropped, when sending must continue from
+    the server's offset rather than the next part, and how retries are paced.
+    The CLI (``requests``) and the TUI (``httpx``) drive it with their own
+    transport calls.
+    """
+
+    def __init__(self, file: UploadFile, state: "UploadState") -> None:
+        self.file = file
+        self.state = state
+        self.offset: int | None = None
+        self.attempts = 0
+        remembered = state.get(file.key)
+        self.upload_id: str | None = remembered["upload_id"] if remembered else None
+        self.part_size: int = remembered["part_size"] if remembered else PART_SIZE
+
+    @property
+    def done(self) -> bool:
+        return self.offset is not None and self.offset >= self.file.size
+
+    @property
+    def path(self) -> str:
+        return f"{UPLOADS_PATH}/{self.upload_id}"
+
+    def resume(self, offset: int | None) -> None:
+        """Offset the server reports for the remembered upload; None if it forgot it."""
+        if offset is None:
+            self.state.drop(self.file.key)
+            self.upload_id = None
+            self.part_size = PART_SIZE
+        self.offset = offset
+
+    def created(self, data: dict) -> None:
+        self.upload_id = data["upload_id"]
+        self.part_size = data.get("part_size", PART_SIZE)
+        self.offset = data.get("offset", 0)
+        self.state.put(self.file.key, self.upload_id, self.part_size)
+
+    def parts(self):
+        """``(index, data, headers)`` for the parts from the current offset on."""
+        return self.file.parts(self.offset, self.part_size)
+
+    def sent(self, index: int, data: bytes, offset: int | None) -> bool:
+        """Record a stored part; False when the server's *offset* is not where the parts continue.
+
+        Raises ``ValueError`` once the server has repeatedly failed to move
+        past the current offset.
+        """
+        expected = index * self.part_size + len(data)
+        offset = expected if offset is None else offset
+        if offset > self.offset:
+            self.attempts = 0
+        else:
+            self.attempts += 1
+            if self.attempts >= MAX_PART_ATTEMPTS:
+                raise ValueError(f"server is not accepting parts past byte {self.offset}")
+        self.offset = offset
+        return offset == expected
+
+    def retry_delay(self) -> float | None:
+        """Seconds to wait before retrying after a failed request; None once out of attempts."""
+        self.attempts += 1
+        if self.attempts >= MAX_PART_ATTEMPTS:
+            return None
+        return 0.5 * 2 ** self.attempts
+
+    def resync(self, offset: int | None) -> bool:
+        """Adopt the server's offset after a failure; False if it forgot the upload."""
+        if offset is None:
+            self.state.drop(self.file.key)
+            return False
+        self.offset = offset
+        return True
+
+    def completed(self, status_code: int) -> None:
+        """Forget the upload once the server has answered ``complete`` (retry it on 5xx)."""
+        if status_code < 500:
+            self.state.drop(self.file.key)
+
+
+def chunked(size: int) -> bool:
+    """Whether a file of *size* bytes goes through the chunked protocol."""
+    return size > PART_SIZE
+
+
+def progress_label(name: str, done: int, total: int) -> str:
+    pct = done * 100 // total if total else 100
+    return f"Uploading {name} {pct}% ({done / 1e6:.1f}/{total / 1e6:.1f} MB)"
+
+
+class _JsonStore:
+    """A small JSON object in the SLP home directory, rewritten atomically."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class UploadState(_JsonStore):
+    """Remembered ``UploadFile.key -> {upload_id, part_size}`` for resuming."""
+
+    def __init__(self, home_dir: str | Path) -> None:
+        super().__init__(Path(home_dir) / STATE_FILENAME)
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, upload_id: str, part_size: int) -> None:
+        with self._lock:
+            data = self._load()
+            data[key] = {"upload_id": upload_id, "part_size": part_size}
+            self._save(data)
+
+    def drop(self, key: str) -> None:
+        with self._lock:
+            data = self._load()
+            if data.pop(key, None) is not None:
+                self._save(data)
+
+
+class AssetIndex(_JsonStore):
+    """Local ``path -> digest`` and ``digest -> asset id`` caches (``assets.json``)."""
+
+    def __init__(self, home_dir: str | Path) -> None:
+        super().__init__(Path(home_dir) / INDEX_FILENAME)
+
+    def cached_digest(self, path: Path, st: os.stat_result) -> str | None:
+        with self._lock:
+            entry = self._load().get("files", {}).get(str(path.resolve()))
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def remember_digest(self, path: Path, st: os.stat_result, sha256: str) -> None:
+        with self._lock:
+            data = self._load()
+            data.setdefault("files", {})[str(path.resolve())] = [st.st_size, st.st_mtime_ns, sha256]
+            self._save(data)
+
+    def asset_id(self, sha256: str) -> str | None:
+        with self._lock:
+            return self._load().get("assets", {}).get(sha256)
+
+    def remember_asset(self, sha256: str, asset_id: str) -> None:
+        with self._lock:
+            data = self._load()
+            data.setdefault("assets", {})[sha256] = asset_id
+            self._save(data)
+
+    def forget_asset(self, sha256: str) -> None:
+        with self._lock:
+            data = self._load()
+            if data.get("assets", {}).pop(sha256, None) is not None:
+                self._save(data)
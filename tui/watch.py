@@ -0,0 +1,316 @@
+"""Directory watching for continuous document ingestion.
+
+Shared by ``slp add --watch`` and ``/document watch``.  On Linux the tree is
+watched with inotify (through libc, no extra dependency); elsewhere, or when
+inotify is unavailable or out of watches, it falls back to polling ``stat``.
+Events are debounced into :class:`ChangeBatch` objects: one is emitted once
+the tree has been quiet for ``debounce`` seconds, or after ``max_delay``
+seconds of continuous changes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tui.ingest import accepts
+
+DEFAULT_DEBOUNCE_S = 1.0
+DEFAULT_MAX_DELAY_S = 10.0
+DEFAULT_POLL_INTERVAL_S = 2.0
+# Document submissions per second while watching.
+DEFAULT_MAX_RATE = 5.0
+
+# How often a blocked next_batch() checks its stop event.
+_WAKE_S = 0.5
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")
+
+
+@dataclass
+class ChangeBatch:
+    """Debounced changes: files created or modified, and paths that disappeared.
+
+    ``removed`` may name directories (everything under them is gone).  When
+    ``rescan`` is set, events were lost and the whole tree must be compared.
+    """
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    rescan: bool = False
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / rate`` seconds apart, across threads or tasks."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next slot; returns how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+            return start - now
+
+    def wait(self) -> None:
+        time.sleep(self.reserve())
+
+
+def _hidden(rel_path: str) -> bool:
+    return any(part.startswith(".") for part in rel_path.split("/"))
+
+
+class _Inotify:
+    """One inotify instance watching every directory of the trees."""
+
+    name = "inotify"
+
+    def __init__(self, roots: list[Path], recursive: bool) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._rm = libc.inotify_rm_watch
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._recursive = recursive
+        self._dirs: dict[int, str] = {}
+        try:
+            for root in roots:
+                self._watch_tree(str(root))
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, top: str) -> set[str]:
+        """Watch *top* (and its subdirectories); returns the files already in it."""
+        files: set[str] = set()
+        pending = [top]
+        while pending:
+            path = pending.pop()
+            wd = self._add(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), path)
+            self._dirs[wd] = path
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._recursive:
+                                pending.append(entry.path)
+                        else:
+                            files.add(entry.path)
+            except OSError:
+                pass
+        return files
+
+    def _unwatch_tree(self, top: str) -> None:
+        prefix = top + os.sep
+        for wd, path in list(self._dirs.items()):
+            if path == top or path.startswith(prefix):
+                self._rm(self._fd, wd)
+                del self._dirs[wd]
+
+    def read(self, timeout: float) -> tuple[set[str], bool]:
+        """Paths touched within *timeout* seconds, and whether events were lost."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set(), False
+        try:
+            data = os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return set(), False
+        paths: set[str] = set()
+        overflow = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            raw_name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            base = self._dirs.get(wd)
+            if base is None:
+                continue
+            name = os.fsdecode(raw_name)
+            path = os.path.join(base, name) if name else base
+            if not mask & _IN_ISDIR:
+                paths.add(path)
+            elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                if self._recursive and not name.startswith("."):
+                    try:
+                        paths |= self._watch_tree(path)
+                    except OSError:
+                        pass  # Gone again, or out of watches; the removal shows up on its own.
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                self._unwatch_tree(path)
+                paths.add(path)
+        return paths, overflow
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _Poller:
+    """Compares ``(size, mtime)`` snapshots of the trees every *interval* seconds."""
+
+    name = "polling"
+
+    def __init__(self, roots: list[Path], recursive: bool, interval: float) -> None:
+        self._roots = [str(root) for root in roots]
+        self._recursive = recursive
+        self._interval = interval
+        self._snapshot = self._scan()
+        self._due = time.monotonic() + interval
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        pending = list(self._roots)
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self._recursive:
+                                    pending.append(entry.path)
+                            elif entry.is_file():
+                                st = entry.stat()
+                                snapshot[entry.path] = (st.st_size, st.st_mtime_ns)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+        return snapshot
+
+    def read(self, timeout: float) -> tuple[set[str], bool]:
+        wait = self._due - time.monotonic()
+        if wait > timeout:
+            time.sleep(timeout)
+            return set(), False
+        time.sleep(max(0.0, wait))
+        self._due = time.monotonic() + self._interval
+        before, self._snapshot = self._snapshot, self._scan()
+        changed = {p for p, st in self._snapshot.items() if before.get(p) != st}
+        return changed | (before.keys() - self._snapshot.keys()), False
+
+    def close(self) -> None:
+        pass
+
+
+class DirectoryWatcher:
+    """Watches directory trees and returns debounced, filtered change batches."""
+
+    def __init__(
+        self,
+        roots: list[Path],
+        include: tuple[str, ...] = (),
+        exclude: tuple[str, ...] = (),
+        recursive: bool = True,
+        debounce: float = DEFAULT_DEBOUNCE_S,
+        max_delay: float = DEFAULT_MAX_DELAY_S,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_S,
+        force_poll: bool = False,
+    ) -> None:
+        self.roots = [Path(root).resolve() for root in roots]
+        self._include = include
+        self._exclude = exclude
+        self._recursive = recursive
+        self._debounce = debounce
+        self._max_delay = max_delay
+        self._backend: _Inotify | _Poller | None = None
+        if not force_poll:
+            try:
+                self._backend = _Inotify(self.roots, recursive)
+            except (OSError, AttributeError):
+                # Not Linux, or fs.inotify.max_user_watches exhausted.
+                self._backend = None
+        if self._backend is None:
+            self._backend = _Poller(self.roots, recursive, poll_interval)
+
+    @property
+    def backend(self) -> str:
+        return self._backend.name
+
+    def _accepts(self, path: str) -> bool:
+        for root in self.roots:
+            try:
+                rel = Path(path).relative_to(root).as_posix()
+            except ValueError:
+                continue
+            if _hidden(rel) or (not self._recursive and "/" in rel):
+                return False
+            return accepts(rel, self._include, self._exclude)
+        return False
+
+    def next_batch(self, stop: threading.Event | None = None) -> ChangeBatch | None:
+        """Block until a debounced batch of changes is ready; None once *stop* is set."""
+        pending: set[str] = set()
+        rescan = False
+        first = last = 0.0
+        while stop is None or not stop.is_set():
+            if pending or rescan:
+                now = time.monotonic()
+                quiet_left = last + self._debounce - now
+                if quiet_left <= 0 or now - first >= self._max_delay:
+                    return self._batch(pending, rescan)
+                timeout = min(quiet_left, _WAKE_S)
+            else:
+                timeout = _WAKE_S
+            paths, overflow = self._backend.read(timeout)
+            if paths or overflow:
+                last = time.monotonic()
+                if not pending and not rescan:
+                    first = last
+                pending |= paths
+                rescan |= overflow
+        return None
+
+    def _batch(self, paths: set[str], rescan: bool) -> ChangeBatch:
+        batch = ChangeBatch(rescan=rescan)
+        for path in sorted(paths):
+            if os.path.isfile(path):
+                if self._accepts(path):
+                    batch.changed.append(path)
+            elif not os.path.exists(path):
+                batch.removed.append(path)
+        return batch
+
+    def close(self) -> None:
+        self._backend.close()
@@ -3,5 +3,7 @@
 from .command_menu import CommandMenu
 from .prompt_text_area import PromptTextArea
 from .chat_log import ChatLog
+from .streaming_markdown import StreamingMarkdown
+from .message_log import MessageLog
 
-__all__ = ["CommandMenu", "PromptTextArea", "ChatLog"]
+__all__ = ["CommandMenu", "PromptTextArea", "ChatLog", "StreamingMarkdown", "MessageLog"]
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 from rich.table import Table
-from textual.containers import VerticalScroll
-from textual.widgets import Static
 
 from smartloop import __version__
 from smartloop.constants import LOGO
 
 from tui.constants import SLASH_COMMANDS
+from tui.widgets.message_log import MessageLog
 
 
 class ChatLog:
@@ -19,18 +18,18 @@ class ChatLog:
     project_rules: str | None
 
     def _append_user(self, text: str) -> None:
-        log = self.query_one("#chat-log", VerticalScroll)
-        log.mount(Static(f"> {text}", classes="user-msg"))
+        log = self.query_one("#chat-log", MessageLog)
+        log.append(f"> {text}", "user-msg")
         log.scroll_end(animate=False)
 
     def _append_system(self, text: str) -> None:
-        log = self.query_one("#chat-log", VerticalScroll)
-        log.mount(Static(text, classes="system-msg"))
+        log = self.query_one("#chat-log", MessageLog)
+        log.append(text, "system-msg")
         log.scroll_end(animate=False)
 
     def _show_welcome(self) -> None:
         """Show project context and usage hints at the top of the chat."""
-        log = self.query_one("#chat-log", VerticalScroll)
+        log = self.query_one("#chat-log", MessageLog)
         lines = [f"[bold #ec4899]{LOGO}[/bold #ec4899]", f"[#4a3d5c]v{__version__}[/#4a3d5c]", ""]
         if self.project_rules:
             lines.append("[#ec4899]Rules:[/#ec4899]")
@@ -38,11 +37,11 @@ class ChatLog:
                 lines.append(f"  [dim]{rule}[/dim]")
             lines.append("")
         lines.append("")
-        log.mount(Static("\n".join(lines), classes="system-msg"))
+        log.append("\n".join(lines), "system-msg")
 
     def _show_help(self) -> None:
         """Show the full commands table in the chat log."""
-        log = self.query_one("#chat-log", VerticalScroll)
+        log = self.query_one("#chat-log", MessageLog)
         commands_table = Table(
             show_header=True,
             header_style="#ec4899",
@@ -56,10 +55,10 @@ class ChatLog:
         commands_table.add_column("Description", style="dim")
         for cmd, desc in SLASH_COMMANDS:
             commands_table.add_row(cmd, desc)
-        log.mount(Static(commands_table, classes="system-msg"))
+        log.append(commands_table, "system-msg")
         log.scroll_end(animate=False)
 
-    def _show_command_guide(self, log: VerticalScroll) -> None:
+    def _show_command_guide(self, log: MessageLog) -> None:
         """Show a friendly getting-started guide after bootstrap completes."""
         c = "#f9a8d4"  # command highlight
         d = "#6b5b7b"  # description text
@@ -85,6 +84,6 @@ class ChatLog:
             "",
             f"[{b}]{'─' * 60}[/{b}]",
         ]
-        log.mount(Static("\n".join(lines), classes="system-msg"))
+        log.append("\n".join(lines), "system-msg")
         log.scroll_end(animate=False)
 
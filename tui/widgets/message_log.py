@@ -0,0 +1,338 @@
+"""MessageLog — virtualized chat log.
+
+Every message is kept as a compact :class:`LogEntry`.  Widgets are mounted
+only for a window of entries around the viewport; entries outside it are
+represented by two spacers whose heights are the sum of the entries they
+stand in for, so scrolling behaves as if everything were mounted.  Widgets
+that scroll out of the window are removed and rebuilt from their entry when
+they come back into view.
+
+Live entries (a streaming reply) always stay mounted.  When one starts
+while the user is reading further up, it and everything after it form a
+separate tail region below the bottom spacer, so the window itself stays
+small; the two merge once the window reaches the tail.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, chain
+
+from rich.markdown import Markdown as RichMarkdown
+from rich.table import Table
+from textual.containers import VerticalScroll
+from textual.message import Message
+from textual.widget import Widget
+from textual.widgets import Static
+
+# Entries mounted beyond each edge of the viewport.
+WINDOW_MARGIN = 20
+# Upper bound on mounted entries while following the tail; once exceeded the
+# oldest are evicted in one batch, down to MAX_MOUNTED - WINDOW_MARGIN.
+MAX_MOUNTED = 80
+
+
+@dataclass(slots=True, eq=False)
+class LogEntry:
+    """One chat-log message: what to render, and its last measured height."""
+    content: object = ""
+    classes: str = ""
+    markdown: bool = False
+    height: int = 0
+    widget: Widget | None = None
+    live: bool = False
+
+
+class _Spacer(Widget):
+    DEFAULT_CSS = """
+    _Spacer {
+        height: 0;
+    }
+    """
+
+
+class MessageLog(VerticalScroll):
+    """Scrollable chat log that mounts at most a window of its messages."""
+
+    class ReachedTop(Message):
+        """Posted when the user scrolls to the very top (e.g. to page in history)."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.entries: list[LogEntry] = []
+        # Mounted: the window [_lo, _hi) and the tail region [_tail, len(entries)).
+        self._lo = 0
+        self._hi = 0
+        self._tail = 0
+        self._top = _Spacer()
+        self._bottom = _Spacer()
+        self._reflow_pending = False
+
+    def compose(self):
+        yield self._top
+        yield self._bottom
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def append(self, content: object, classes: str = "", *, markdown: bool = False) -> None:
+        """Add a static message (markup string, Rich renderable or markdown source)."""
+        self._add(LogEntry(content, classes, markdown))
+
+    def extend(self, entries: list[LogEntry]) -> None:
+        """Add prepared entries at the end of the log."""
+        for entry in entries:
+            self._add(entry)
+
+    def mount_live(self, widget: Widget):
+        """Add a widget that is still being updated (streaming reply, progress bar).
+
+        Live entries are never evicted; call :meth:`settle` once the widget
+        stops changing so it can be recycled like any other message.
+        """
+        entry = LogEntry(widget=widget, live=True)
+        following = self._hi == len(self.entries)
+        self.entries.append(entry)
+        if following:
+            self._hi = self._tail = len(self.entries)
+            return self.mount(widget, before=self._bottom)
+        # Scrolled away: it joins (or starts) the tail region, below the bottom spacer.
+        return self.mount(widget)
+
+    def insert(self, index: int, entries: list[LogEntry]) -> None:
+        """Insert *entries* before position *index* (e.g. an older history page).
+
+        Entries landing above the window are only added to the top spacer, and
+        the scroll offset is moved by the same amount so the view stays put.
+        """
+        if not entries:
+            return
+        count = len(entries)
+        self.entries[index:index] = entries
+        if index <= self._lo:
+            self._lo += count
+            self._hi += count
+            self._tail += count
+            added = sum(self._height(e) for e in entries)
+            self._update_spacers()
+            self.call_after_refresh(self.scroll_to, y=self.scroll_y + added, animate=False)
+            return
+        if index < self._hi:
+            anchor = self.entries[index + count].widget
+            self.mount_all(self._build_range(index, index + count), before=anchor)
+            self._hi += count
+        if index < self._tail:
+            self._tail += count
+        elif index + count < len(self.entries):
+            self.mount_all(self._build_range(index, index + count), before=self.entries[index + count].widget)
+        else:
+            self.mount_all(self._build_range(index, index + count))
+        self._update_spacers()
+        self._schedule_reflow()
+
+    def settle(self, widget: Widget, content: object, *, markdown: bool = False) -> None:
+        """Freeze a live widget; *content* is used to rebuild it after eviction."""
+        entry = self._entry_for(widget)
+        if entry is not None:
+            entry.content, entry.markdown, entry.live = content, markdown, False
+            entry.classes = " ".join(widget.classes)
+            self._schedule_reflow()
+
+    async def discard(self, widget: Widget) -> None:
+        """Remove a live widget and its entry (e.g. a finished progress bar)."""
+        entry = self._entry_for(widget)
+        if entry is not None:
+            index = self.entries.index(entry)
+            del self.entries[index]
+            if index < self._lo:
+                self._lo -= 1
+            if index < self._hi:
+                self._hi -= 1
+            if index < self._tail:
+                self._tail -= 1
+        await widget.remove()
+
+    # ------------------------------------------------------------------
+    # Windowing
+    # ------------------------------------------------------------------
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if round(old_value) != round(new_value):
+            self._schedule_reflow()
+            if round(new_value) == 0:
+                self.post_message(self.ReachedTop())
+
+    def on_mouse_scroll_up(self) -> None:
+        # Already at the top, so scroll_y does not change; ask for more anyway.
+        if round(self.scroll_y) == 0:
+            self.post_message(self.ReachedTop())
+
+    def on_resize(self) -> None:
+        self._schedule_reflow()
+
+    def _add(self, entry: LogEntry) -> None:
+        following = self._hi == len(self.entries)
+        self.entries.append(entry)
+        if not following:
+            if self._tail < len(self.entries) - 1:
+                # Joins the tail region below a live entry.
+                entry.widget = self._build(entry)
+                self.mount(entry.widget)
+            else:
+                self._tail = len(self.entries)
+                self._update_spacers()
+            return
+        entry.widget = self._build(entry)
+        self.mount(entry.widget, before=self._bottom)
+        self._hi = self._tail = len(self.entries)
+        if self._hi - self._lo > MAX_MOUNTED:
+            self._evict_head(self._hi - (MAX_MOUNTED - WINDOW_MARGIN))
+
+    def _evict_head(self, target_lo: int) -> None:
+        """Unmount entries from the top of the window up to *target_lo*."""
+        while self._lo < target_lo and not self.entries[self._lo].live:
+            self._evict(self.entries[self._lo])
+            self._lo += 1
+        self._update_spacers()
+
+    def _schedule_reflow(self) -> None:
+        if not self._reflow_pending:
+            self._reflow_pending = True
+            self.call_after_refresh(self._reflow)
+
+    def _reflow(self) -> None:
+        """Re-centre the mounted window on the viewport if it has drifted."""
+        self._reflow_pending = False
+        count = len(self.entries)
+        if not count:
+            return
+        self._measure()
+        offsets = list(accumulate((self._height(e) for e in self.entries), initial=0))
+        top = self.scroll_y
+        first = max(0, bisect_right(offsets, top) - 1)
+        last = min(count, bisect_left(offsets, top + self.size.height) + 1)
+        lo, hi = max(0, first - WINDOW_MARGIN), min(count, last + WINDOW_MARGIN)
+
+        covered = (
+            (self._lo <= first - WINDOW_MARGIN // 2 or self._lo == 0)
+            and (self._hi >= last + WINDOW_MARGIN // 2 or self._hi == count)
+            and self._hi - self._lo <= MAX_MOUNTED
+            and (self._tail == count or any(e.live for e in self.entries[self._tail:]))
+        )
+        if not covered:
+            at_end = self.scroll_y >= self.max_scroll_y - 1
+            self._set_window(lo, hi)
+            if at_end:
+                # Estimated heights were replaced by real ones; stay pinned.
+                self.scroll_end(animate=False)
+
+    def _set_window(self, lo: int, hi: int) -> None:
+        count = len(self.entries)
+        # Live entries stay mounted: those above the window stretch it, and
+        # the first one below it starts the tail region.
+        lo = min([lo] + [i for i in range(lo) if self.entries[i].live])
+        tail = next((i for i in range(hi, count) if self.entries[i].live), count)
+        if tail == hi:
+            hi = tail = count
+        wanted = (lo, hi), (tail, count)
+        for a, b in ((self._lo, self._hi), (self._tail, count)):
+            for index in range(a, b):
+                if not any(x <= index < y for x, y in wanted):
+                    self._evict(self.entries[index])
+        self._lo, self._hi, self._tail = lo, hi, tail
+
+        for a, b in wanted:
+            start = a
+            while start < b:
+                if self.entries[start].widget is not None:
+                    start += 1
+                    continue
+                end = start
+                while end < b and self.entries[end].widget is None:
+                    end += 1
+                anchor = self._next_mounted(end)
+                widgets = self._build_range(start, end)
+                if anchor is not None:
+                    self.mount_all(widgets, before=anchor)
+                elif a == tail:
+                    self.mount_all(widgets)
+                else:
+                    self.mount_all(widgets, before=self._bottom)
+                start = end
+        self._place_bottom()
+        self._update_spacers()
+
+    def _next_mounted(self, index: int) -> Widget | None:
+        """Widget of the first mounted entry at or after *index*."""
+        for entry in chain(self.entries[index:self._hi], self.entries[max(index, self._tail):]):
+            if entry.widget is not None:
+                return entry.widget
+        return None
+
+    def _place_bottom(self) -> None:
+        """Keep the bottom spacer between the window and the tail region."""
+        nodes = list(self.children)
+        position = nodes.index(self._bottom)
+        if self._tail < len(self.entries):
+            first = self.entries[self._tail].widget
+            if position + 1 < len(nodes) and nodes[position + 1] is first:
+                return
+            self.move_child(self._bottom, before=first)
+        elif nodes[-1] is not self._bottom:
+            self.move_child(self._bottom, after=nodes[-1])
+
+    def _build_range(self, lo: int, hi: int) -> list[Widget]:
+        widgets = []
+        for entry in self.entries[lo:hi]:
+            entry.widget = self._build(entry)
+            widgets.append(entry.widget)
+        return widgets
+
+    @staticmethod
+    def _build(entry: LogEntry) -> Widget:
+        content = RichMarkdown(entry.content) if entry.markdown else entry.content
+        return Static(content, classes=entry.classes)
+
+    def _evict(self, entry: LogEntry) -> None:
+        if entry.widget is not None:
+            entry.height = self._outer_height(entry.widget) or entry.height
+            entry.widget.remove()
+            entry.widget = None
+
+    def _measure(self) -> None:
+        for entry in self.entries[self._lo:self._hi] + self.entries[self._tail:]:
+            if entry.widget is not None:
+                entry.height = self._outer_height(entry.widget) or entry.height
+
+    def _update_spacers(self) -> None:
+        self._top.styles.height = sum(self._height(e) for e in self.entries[:self._lo])
+        self._bottom.styles.height = sum(self._height(e) for e in self.entries[self._hi:self._tail])
+
+    def _entry_for(self, widget: Widget) -> LogEntry | None:
+        for entry in reversed(self.entries):
+            if entry.widget is widget:
+                return entry
+        return None
+
+    @staticmethod
+    def _outer_height(widget: Widget) -> int:
+        margin = widget.styles.margin
+        height = widget.outer_size.height
+        return height + margin.top + margin.bottom if height else 0
+
+    def _height(self, entry: LogEntry) -> int:
+        """Measured height of *entry*, or an estimate if it was never laid out."""
+        if entry.height:
+            return entry.height
+        width = max(20, self.size.width - 4)
+        content = entry.content
+        if isinstance(content, str):
+            lines = sum(len(line) // width + 1 for line in content.splitlines()) or 1
+        elif isinstance(content, Table):
+            lines = content.row_count + 4
+        else:
+            lines = 1
+        return lines + 2
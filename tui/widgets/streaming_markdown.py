@@ -0,0 +1,83 @@
+"""StreamingMarkdown — assistant reply rendered block by block while it streams."""
+
+from __future__ import annotations
+
+from rich.markdown import Markdown as RichMarkdown
+from textual.containers import Vertical
+from textual.widgets import Static
+
+from tui.render import MarkdownBlocks
+
+
+class StreamingMarkdown(Vertical):
+    """Reply container holding one Static per finished markdown block.
+
+    Finished blocks are rendered once and never touched again; only the
+    trailing open block is re-rendered on each frame.
+    """
+
+    DEFAULT_CSS = """
+    StreamingMarkdown {
+        height: auto;
+    }
+
+    StreamingMarkdown > .md-block {
+        margin: 0 0 1 0;
+    }
+
+    /* Not ``:last-child``: order pseudo-classes make Textual restyle every
+       sibling on each mount, which is quadratic in the reply length. */
+    StreamingMarkdown > .md-tail, StreamingMarkdown > .md-last {
+        margin: 0;
+    }
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._blocks = MarkdownBlocks()
+        self._pending: list[str] = []
+        self._source: list[str] = []
+        self._tail = Static("", classes="md-tail")
+        self._last_block: Static | None = None
+
+    def compose(self):
+        yield self._tail
+
+    def append(self, text: str) -> None:
+        """Queue streamed text; it is laid out on the next :meth:`render_frame`."""
+        self._pending.append(text)
+        self._source.append(text)
+
+    @property
+    def source(self) -> str:
+        """The markdown received so far."""
+        if len(self._source) > 1:
+            self._source = ["".join(self._source)]
+        return self._source[0] if self._source else ""
+
+    def render_frame(self) -> None:
+        """Mount newly finished blocks and re-render the open one."""
+        if self._pending:
+            text, self._pending = "".join(self._pending), []
+            self._mount_blocks(self._blocks.feed(text))
+        tail = self._blocks.tail
+        self._tail.update(RichMarkdown(tail) if tail.strip() else "")
+
+    def finish(self, interrupted: bool = False) -> None:
+        """Render whatever is left as finished blocks at the end of the stream."""
+        if self._pending:
+            text, self._pending = "".join(self._pending), []
+            self._mount_blocks(self._blocks.feed(text))
+        self._mount_blocks(self._blocks.close())
+        if interrupted:
+            self._tail.update("[dim][interrupted][/dim]")
+        else:
+            self._tail.remove()
+            # The tail is gone, so the last block now ends the reply (set once, see above).
+            if self._last_block is not None:
+                self._last_block.add_class("md-last")
+
+    def _mount_blocks(self, blocks: list[str]) -> None:
+        for block in blocks:
+            self._last_block = Static(RichMarkdown(block), classes="md-block")
+            self.mount(self._last_block, before=self._tail)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
-from rich.markdown import Markdown as RichMarkdown
 from textual import work
-from textual.containers import VerticalScroll
 from textual.widgets import Static
 
 from smartloop.config import AppSettings
@@ -17,28 +17,66 @@ from tui.events import (
     BootstrapError,
     parse_bootstrap_sse,
 )
-from tui.widgets import PromptTextArea
+from tui.widgets import MessageLog, PromptTextArea
+from tui.widgets.message_log import LogEntry
+
+# Messages shown per page when resuming a conversation.
+RESUME_PAGE_SIZE = 50
 
 class Bootstrap:
     """Mixin for _render_block_bar, _run_bootstrap."""
 
-    server_url: str
+    http: httpx.AsyncClient
+    session_id: str
+    _history_older: list
+    _history_anchor: LogEntry | None
 
+    @work(group="resume")
     async def _load_conversation(self) -> None:
-        """Restore conversation history from disk into the chat log."""
+        """Restore conversation history from disk into the chat log.
+
+        Reading the store runs in a thread, and only the newest page is shown;
+        older pages are added when the user scrolls to the top of the log.
+        """
         if not self.session_id:
             return
-        history = ConversationStore(AppSettings().home_dir).load(self.session_id)
+        store = ConversationStore(AppSettings().home_dir)
+        history = await asyncio.to_thread(store.load, self.session_id)
         if not history:
             return
-        log = self.query_one("#chat-log", VerticalScroll)
-        for msg in history:
-            if msg.role == "user":
-                log.mount(Static(f"> {msg.content}", classes="user-msg"))
-            else:
-                log.mount(Static(RichMarkdown(msg.content), classes="assistant-msg"))
+        log = self.query_one("#chat-log", MessageLog)
+        self._history_older = list(history)
+        self._history_anchor = None
+        page = self._history_page()
+        self._history_anchor = page[0]
+        log.extend(page)
         log.scroll_end(animate=False)
 
+    def _history_page(self) -> list[LogEntry]:
+        """Pop the newest RESUME_PAGE_SIZE messages not yet shown as log entries."""
+        older = self._history_older
+        cut = max(0, len(older) - RESUME_PAGE_SIZE)
+        page, self._history_older = older[cut:], older[:cut]
+        return [
+            LogEntry(f"> {msg.content}", "user-msg")
+            if msg.role == "user"
+            else LogEntry(msg.content, "assistant-msg", markdown=True)
+            for msg in page
+        ]
+
+    def on_message_log_reached_top(self, event: MessageLog.ReachedTop) -> None:
+        """Page in the next batch of older messages above the oldest shown."""
+        if not self._history_older or self._history_anchor is None:
+            return
+        log = self.query_one("#chat-log", MessageLog)
+        try:
+            index = log.entries.index(self._history_anchor)
+        except ValueError:
+            return
+        page = self._history_page()
+        self._history_anchor = page[0]
+        log.insert(index, page)
+
     @staticmethod
     def _render_block_bar(downloaded: int, total: int, width: int = 30) -> str:
         """Render a progress bar using square block characters in the primary theme color."""
@@ -51,12 +89,38 @@ class Bootstrap:
 
     @work(exclusive=True)
     async def _run_bootstrap(self) -> None:
-        """Call POST /v1/bootstrap and render SSE progress in the chat log."""
-        log = self.query_one("#chat-log", VerticalScroll)
+        """Bring the session up: startup phases run concurrently where they can.
+
+        The bootstrap stream, project fetch and history load run side by side.
+        The health check and enabling the prompt wait for the bootstrap
+        stream, which is what loads the model.
+        """
+        log = self.query_one("#chat-log", MessageLog)
 
         # Show command guide first — download progress appears below it
         self._show_command_guide(log)
+        self._load_conversation()
+
+        await _run_phases({
+            "stream": (lambda: self._bootstrap_stream(log), ()),
+            "health": (self._bootstrap_health, ("stream",)),
+            "project": (self._bootstrap_project, ()),
+            "ready": (self._bootstrap_ready, ("stream",)),
+        })
+
+    async def _bootstrap_ready(self, stream_ok: bool) -> None:
+        """Enable the prompt once the bootstrap stream has succeeded."""
+        if not stream_ok:
+            return
+        self._refresh_info_bar()
+        self._update_loading("")
+        prompt = self.query_one("#prompt-box", PromptTextArea)
+        prompt.load_text("")
+        prompt.disabled = False
+        prompt.focus()
 
+    async def _bootstrap_stream(self, log: MessageLog) -> bool:
+        """Call POST /v1/bootstrap and render SSE progress in the chat log."""
         download_label: Static | None = None
         progress_widget: Static | None = None
 
@@ -68,92 +132,117 @@ class Bootstrap:
             return f"{n / 1024:.0f} KB"
 
         try:
-            async with httpx.AsyncClient(timeout=600) as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.server_url}/v1/bootstrap",
-                ) as response:
-                    response.raise_for_status()
-                    async for event in parse_bootstrap_sse(response):
-                        match event:
-                            case BootstrapProgress(filename=fn, downloaded=dl, total=total):
-                                if download_label is None:
-                                    download_label = Static("", classes="bootstrap-status")
-                                    await log.mount(download_label)
-                                if progress_widget is None:
-                                    progress_widget = Static("", classes="bootstrap-progress")
-                                    await log.mount(progress_widget)
-                                pct = (dl / total * 100) if total else 0
-                                bar = self._render_block_bar(dl, total)
-                                progress_widget.update(
-                                    f"{bar} [#6b5b7b]{pct:3.0f}%[/#6b5b7b]"
-                                )
-                                friendly_fn = self._friendly_filename(fn)
-                                download_label.update(
-                                    f"[#6b5b7b]Downloading {friendly_fn}  "
-                                    f"{_format_bytes(dl)} / {_format_bytes(total)}[/#6b5b7b]"
-                                )
-                                log.scroll_end(animate=False)
-
-                            case BootstrapStatus(status=st, message=_msg):
-                                _done_statuses = (
-                                    "download_complete", "model_ready",
-                                    "creating_project", "loading", "model_loaded",
-                                )
-                                if progress_widget is not None and st in _done_statuses:
-                                    await progress_widget.remove()
-                                    progress_widget = None
-                                if download_label is not None and st in _done_statuses:
-                                    await download_label.remove()
-                                    download_label = None
-                                self._update_loading("♨ Heating up ...")
-
-                            case BootstrapComplete(model_name=mn, project=proj):
-                                self.model_name = mn
-                                self.sub_title = mn
-                                if proj:
-                                    self.project_id = proj.get("id")
-                                    pname = proj.get("name", "")
-                                    self.project_rules = proj.get("rules", "")
-                                    if pname:
-                                        self.title = pname
-                                self._bootstrap_done = True
-
-                            case BootstrapError(message=msg):
-                                self._append_system(f"[red]Bootstrap failed: {msg}[/red]")
-                                return
+            async with self.http.stream("POST", "/v1/bootstrap", timeout=600) as response:
+                response.raise_for_status()
+                async for event in parse_bootstrap_sse(response):
+                    match event:
+                        case BootstrapProgress(filename=fn, downloaded=dl, total=total):
+                            if download_label is None:
+                                download_label = Static("", classes="bootstrap-status")
+                                await log.mount_live(download_label)
+                            if progress_widget is None:
+                                progress_widget = Static("", classes="bootstrap-progress")
+                                await log.mount_live(progress_widget)
+                            pct = (dl / total * 100) if total else 0
+                            bar = self._render_block_bar(dl, total)
+                            progress_widget.update(
+                                f"{bar} [#6b5b7b]{pct:3.0f}%[/#6b5b7b]"
+                            )
+                            friendly_fn = self._friendly_filename(fn)
+                            download_label.update(
+                                f"[#6b5b7b]Downloading {friendly_fn}  "
+                                f"{_format_bytes(dl)} / {_format_bytes(total)}[/#6b5b7b]"
+                            )
+                            log.scroll_end(animate=False)
+
+                        case BootstrapStatus(status=st, message=_msg):
+                            _done_statuses = (
+                                "download_complete", "model_ready",
+                                "creating_project", "loading", "model_loaded",
+                            )
+                            if progress_widget is not None and st in _done_statuses:
+                                await log.discard(progress_widget)
+                                progress_widget = None
+                            if download_label is not None and st in _done_statuses:
+                                await log.discard(download_label)
+                                download_label = None
+                            self._update_loading("♨ Heating up ...")
+
+                        case BootstrapComplete(model_name=mn, project=proj):
+                            self.model_name = mn
+                            self.sub_title = mn
+                            if proj:
+                                self.project_id = proj.get("id")
+                                pname = proj.get("name", "")
+                                self.project_rules = proj.get("rules", "")
+                                if pname:
+                                    self.title = pname
+                            self._bootstrap_done = True
+
+                        case BootstrapError(message=msg):
+                            self._append_system(f"[red]Bootstrap failed: {msg}[/red]")
+                            return False
 
         except httpx.HTTPStatusError as exc:
             self._append_system(f"[red]Bootstrap failed: {exc.response.status_code}[/red]")
-            return
+            return False
         except httpx.RequestError as exc:
             self._append_system(f"[red]Bootstrap failed: {exc}[/red]")
-            return
+            return False
 
         # Clean up any remaining progress widgets
         if progress_widget is not None:
-            await progress_widget.remove()
+            await log.discard(progress_widget)
         if download_label is not None:
-            await download_label.remove()
+            await log.discard(download_label)
+        return True
 
-        # Confirm model name from health endpoint
+    async def _bootstrap_health(self, stream_ok: bool) -> None:
+        """Confirm the loaded model name from the health endpoint after bootstrap."""
+        if not stream_ok:
+            return
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                resp = await client.get(f"{self.server_url}/health")
-                if resp.is_success:
-                    loaded_model = resp.json().get("model_name")
-                    if loaded_model:
-                        self.model_name = loaded_model
+            resp = await self.http.get("/health", timeout=5)
+            if resp.is_success:
+                loaded_model = resp.json().get("model_name")
+                if loaded_model:
+                    self.model_name = loaded_model
+                    self._refresh_info_bar()
         except Exception:
             pass
 
-        # Enable the prompt
-        self._refresh_info_bar()
-        self._update_loading("")
-        prompt = self.query_one("#prompt-box", PromptTextArea)
-        prompt.load_text("")
-        prompt.disabled = False
-        prompt.focus()
+    async def _bootstrap_project(self) -> None:
+        """Paint the current project's name and rules without waiting for bootstrap."""
+        try:
+            resp = await self.http.get("/v1/projects", timeout=10)
+            if not resp.is_success:
+                return
+            for proj in resp.json().get("projects", []):
+                if proj.get("current") and not self._bootstrap_done:
+                    self.project_id = proj.get("id")
+                    self.project_rules = proj.get("rules", "")
+                    if proj.get("name"):
+                        self.title = proj["name"]
+                    self._refresh_info_bar()
+                    break
+        except Exception:
+            pass
+
+
+async def _run_phases(phases: dict) -> dict:
+    """Run ``{name: (coroutine_fn, deps)}`` concurrently, each after its deps.
+
+    A phase with deps is called with their results, in order.  Returns each
+    phase's result by name.
+    """
+    tasks: dict[str, asyncio.Future] = {}
 
-        await self._load_conversation()
+    async def run(name: str):
+        fn, deps = phases[name]
+        args = await asyncio.gather(*(tasks[dep] for dep in deps)) if deps else ()
+        return await fn(*args)
 
+    for name in phases:
+        tasks[name] = asyncio.ensure_future(run(name))
+    await asyncio.gather(*tasks.values())
+    return {name: task.result() for name, task in tasks.items()}
@@ -9,19 +9,43 @@ from textual import work
 
 
 class Connection:
-    """_check_connected and _probe_reconnect."""
+    """Shared HTTP client, _check_connected and _probe_reconnect."""
 
     # Attributes provided by SLPChat.__init__
     server_url: str
+    socket_path: str | None
     _connected: bool
+    http: httpx.AsyncClient | None
+
+    def _open_http_client(self) -> None:
+        """Create the pooled client used by every worker and slash command.
+
+        Individual calls pass their own ``timeout=`` where the default is
+        not appropriate (health pings, streaming, model loads).  When the
+        server advertised a local Unix socket, requests go through it and
+        ``server_url`` only supplies the Host header.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            uds=self.socket_path,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=120),
+        )
+        self.http = httpx.AsyncClient(
+            base_url=self.server_url,
+            timeout=httpx.Timeout(30, connect=5),
+            transport=transport,
+        )
+
+    async def _close_http_client(self) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
 
     async def _check_connected(self) -> bool:
         """Ping the server health endpoint and update connection state."""
         try:
-            async with httpx.AsyncClient(timeout=3) as client:
-                resp = await client.get(f"{self.server_url}/health")
-                resp.raise_for_status()
-                connected = True
+            resp = await self.http.get("/health", timeout=3)
+            resp.raise_for_status()
+            connected = True
         except Exception:
             connected = False
 
@@ -42,13 +66,12 @@ class Connection:
         for attempt, delay in enumerate(delays, 1):
             await asyncio.sleep(delay)
             try:
-                async with httpx.AsyncClient(timeout=3) as client:
-                    resp = await client.get(f"{self.server_url}/health")
-                    resp.raise_for_status()
-                    self._connected = True
-                    self._refresh_info_bar()
-                    self._append_system("[#a3e635]Server reconnected.[/#a3e635]")
-                    return
+                resp = await self.http.get("/health", timeout=3)
+                resp.raise_for_status()
+                self._connected = True
+                self._refresh_info_bar()
+                self._append_system("[#a3e635]Server reconnected.[/#a3e635]")
+                return
             except Exception:
                 self._append_system(f"[dim]Reconnect attempt {attempt}/{len(delays)} failed, retrying in {delays[min(attempt, len(delays)-1)]}s...[/dim]")
 
@@ -6,24 +6,25 @@ import asyncio
 import time
 
 import httpx
-from rich.markup import escape as _rich_escape
-from rich.markdown import Markdown as RichMarkdown
 from textual import work
-from textual.containers import VerticalScroll
 from textual.widgets import Static
 
 from tui.events import SSEDone, SSEStatus, SSEUsage, SSEContent, parse_sse_stream
+from tui.metrics import StreamTimings
+from tui.render import FrameScheduler
 from tui.theme import SLP_DARK
 
 
 class Streaming:
     """_stream_response."""
 
-    server_url: str
+    http: httpx.AsyncClient
     model_name: str
     session_id: str
     pending_attachments: list
     _attachment_names: list
+    _uploading: dict
+    _uploads_idle: asyncio.Event
     _streaming: bool
     _current_worker: object
     _context_used: int
@@ -43,85 +44,101 @@ class Streaming:
         self._streaming = True
         self._refresh_shortcut_bar()
 
-        from tui.widgets import PromptTextArea
+        from tui.widgets import MessageLog, PromptTextArea, StreamingMarkdown
         prompt_box = self.query_one("#prompt-box", PromptTextArea)
         prompt_box.disabled = True
         self._update_loading("Generating response...")
 
-        log = self.query_one("#chat-log", VerticalScroll)
+        log = self.query_one("#chat-log", MessageLog)
         log.scroll_end(animate=False)
 
-        reply_widget = Static("", classes="assistant-msg")
-
-        payload = {
-            "model": self.model_name,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": user_input,
-                    **(
-                        {"attachments": self.pending_attachments}
-                        if self.pending_attachments
-                        else {}
-                    ),
-                }
-            ],
-            "stream": True,
-            "session_id": self.session_id,
-        }
-        self.pending_attachments = []
-        self._attachment_names = []
-        self._refresh_info_bar()
-
-        token_count = 0
-        start_time = time.time()
-        accumulated = ""
+        reply_widget = StreamingMarkdown(classes="assistant-msg")
+
+        timings = StreamTimings()
         reply_mounted = False
         interrupted = False
 
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.server_url}/v1/chat/completions",
-                    json=payload,
-                ) as response:
-                    response.raise_for_status()
-
-                    async for event in parse_sse_stream(response):
-                        match event:
-                            case SSEDone():
-                                break
-                            case SSEStatus(status=s, message=msg):
-                                if s == "processing":
-                                    self._update_loading(msg)
-                                elif s in ("completed", "error"):
-                                    self._update_loading("Generating response...")
-                                log.scroll_end(animate=False)
-                            case SSEUsage(total_tokens=total, max_context_tokens=max_ctx):
-                                self._context_used = total
-                                self._context_max = max_ctx
-                                self._refresh_info_bar()
-                            case SSEContent(text=content):
-                                if not reply_mounted:
-                                    await log.mount(reply_widget)
-                                    reply_mounted = True
-                                token_count += 1
-                                accumulated += content
-                                self._context_used += 1
-                                reply_widget.update(_rich_escape(accumulated))
-                                try:
-                                    self.query_one("#cost-badge", Static).update(
-                                        f"[#6b5b7b]{self._context_used:,}[/#6b5b7b] [dim]token(s) processed[/dim]"
-                                    )
-                                except Exception:
-                                    pass
-                                log.scroll_end(animate=False)
+            cost_badge = self.query_one("#cost-badge", Static)
+        except Exception:
+            cost_badge = None
+
+        def render_frame() -> None:
+            # One reply update, badge refresh and scroll per frame, however
+            # many chunks arrived since the last one.
+            if reply_mounted:
+                reply_widget.render_frame()
+            if cost_badge is not None:
+                cost_badge.update(
+                    f"[#6b5b7b]{self._context_used:,}[/#6b5b7b] [dim]token(s) processed[/dim]"
+                )
+            log.scroll_end(animate=False)
+
+        frames = FrameScheduler(self, render_frame)
+        frames.start()
 
+        try:
+            if self._uploading:
+                # Attachments still uploading are sent with this message.
+                self._update_loading(f"Waiting for {len(self._uploading)} upload(s)...")
+                await self._uploads_idle.wait()
+                self._update_loading("Generating response...")
+                timings.start = time.perf_counter()  # Time to first token starts at the request.
+            payload = {
+                "model": self.model_name,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": user_input,
+                        **(
+                            {"attachments": self.pending_attachments}
+                            if self.pending_attachments
+                            else {}
+                        ),
+                    }
+                ],
+                "stream": True,
+                "session_id": self.session_id,
+            }
+            self.pending_attachments = []
+            self._attachment_names = []
+            self._refresh_info_bar()
+
+            async with self.http.stream(
+                "POST",
+                "/v1/chat/completions",
+                json=payload,
+                timeout=300,
+            ) as response:
+                response.raise_for_status()
+
+                async for event in parse_sse_stream(response):
+                    timings.observe(event)
+                    match event:
+                        case SSEDone():
+                            break
+                        case SSEStatus(status=s, message=msg):
+                            if s == "processing":
+                                self._update_loading(msg)
+                            elif s in ("completed", "error"):
+                                self._update_loading("Generating response...")
+                            frames.mark_dirty()
+                        case SSEUsage(total_tokens=total, max_context_tokens=max_ctx):
+                            self._context_used = total
+                            self._context_max = max_ctx
+                            self._refresh_info_bar()
+                        case SSEContent(text=content):
+                            if not reply_mounted:
+                                await log.mount_live(reply_widget)
+                                reply_mounted = True
+                            reply_widget.append(content)
+                            self._context_used += 1
+                            frames.mark_dirty()
         except asyncio.CancelledError:
             interrupted = True
-            if accumulated:
-                reply_widget.update(accumulated + "\n\n[dim][interrupted][/dim]")
+            frames.stop()
+            if reply_mounted:
+                reply_widget.finish(interrupted=True)
         except httpx.HTTPStatusError:
             self._append_system("Request failed")
             await self._check_connected()
@@ -129,6 +146,8 @@ class Streaming:
             self._append_system("Request failed")
             await self._check_connected()
         finally:
+            frames.flush()
+            frames.stop()
             self._streaming = False
             self._current_worker = None
             self._refresh_shortcut_bar()
@@ -140,18 +159,15 @@ class Streaming:
             except asyncio.CancelledError:
                 pass
 
-        # Re-render the final response as Rich Markdown so code blocks,
-        # bold, italics etc. display correctly on any terminal.
-        if not interrupted and accumulated and reply_mounted:
-            try:
-                reply_widget.update(RichMarkdown(accumulated))
-            except Exception:
-                pass  # keep the escaped plain-text fallback on any error
-
-        # Metrics
-        duration = time.time() - start_time
-        if token_count and duration > 0 and not interrupted:
-            tok_s = token_count / duration
-            metrics = Static(f"{tok_s:.1f} tok/s", classes="metrics-msg")
-            await log.mount(metrics)
+        # Earlier blocks are already rendered; only the last one is left.
+        if reply_mounted:
+            if not interrupted:
+                reply_widget.finish()
+            source = reply_widget.source + ("\n\n*[interrupted]*" if interrupted else "")
+            log.settle(reply_widget, source, markdown=True)
+
+        # Metrics: TTFT, decode rate and inter-token latency, not chunks/wall time.
+        timings.finish()
+        if timings.chunks and not interrupted:
+            log.append(timings.summary(), "metrics-msg")
             log.scroll_end(animate=False)